@@ -31,7 +31,6 @@ if DOTENV_AVAILABLE:
 else:
     DOTENV_MISSING = os.path.exists(".env")
 
-from bs4 import BeautifulSoup
 
 class HardTimeout(Exception):
     """Raised when the per-company hard time limit is exceeded."""
@@ -42,18 +41,23 @@ class SkipCompany(Exception):
     """Raised to skip remaining processing for the current company."""
     pass
 
+# spawn で起動した子プロセス（PDF 抽出 / CpuStage のワーカー）は main.py を __mp_main__ として読み直す。
+# ワーカーはここの関数を使わないので、ログファイル/参照データ/分類器などの初期化は親プロセスでだけ行う
+SPAWNED_WORKER = __name__ == "__mp_main__"
+
 # --------------------------------------------------
 # ロギング設定
 # --------------------------------------------------
-os.makedirs("logs", exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("logs/app.log", encoding="utf-8"),
-        logging.StreamHandler(),
-    ],
-)
+if not SPAWNED_WORKER:
+    os.makedirs("logs", exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("logs/app.log", encoding="utf-8"),
+            logging.StreamHandler(),
+        ],
+    )
 log = logging.getLogger(__name__)
 if DOTENV_MISSING:
     log.warning("python-dotenv が未導入のため .env を読み込めません（venv有効化 or `pip install -r requirements.txt` を実行してください）")
@@ -73,6 +77,8 @@ from src.text_normalizer import norm_text_compact
 from scripts.extract_contact_urls import _pick_contact_url, _build_ai_signals, AI_MIN_CONFIDENCE_DEFAULT
 from src.reference_checker import ReferenceChecker
 from src.jp_number import normalize_kanji_numbers
+from src.search_lookahead import SearchLookahead
+from src.parsed_page import HtmlLike, as_parsed_page
 
 # --------------------------------------------------
 # 実行オプション（.env）
@@ -120,6 +126,8 @@ REFERENCE_CSVS = [p.strip() for p in os.getenv("REFERENCE_CSVS", "").split(",")
 FETCH_CONCURRENCY = max(1, int(os.getenv("FETCH_CONCURRENCY", "3")))
 PROFILE_FETCH_CONCURRENCY = max(1, int(os.getenv("PROFILE_FETCH_CONCURRENCY", "3")))
 SEARCH_CANDIDATE_LIMIT = max(1, int(os.getenv("SEARCH_CANDIDATE_LIMIT", "3")))
+# 次の K 社を先に確保して検索だけ先行させる（0で無効）。確保中の会社もリース（RUNNING_TTL_MIN）の対象
+SEARCH_LOOKAHEAD = max(0, int(os.getenv("SEARCH_LOOKAHEAD", "0")))
 # 優先docs（会社概要等）の取得上限（時間爆発防止）
 PRIORITY_DOCS_MAX_LINKS_CAP = max(1, int(os.getenv("PRIORITY_DOCS_MAX_LINKS_CAP", "5")))
 PROFILE_DISCOVERY_MAX_LINKS_CAP = max(1, int(os.getenv("PROFILE_DISCOVERY_MAX_LINKS_CAP", "4")))
@@ -284,15 +292,15 @@ EXTRACT_DEBUG_JSONL_PATH = os.getenv("EXTRACT_DEBUG_JSONL_PATH", "")
 CONCEPT_HOLD_LOG_PATH = os.getenv("CONCEPT_HOLD_LOG_PATH", "logs/concept_hold.jsonl")
 
 REFERENCE_CHECKER: ReferenceChecker | None = None
-if REFERENCE_CSVS:
+if REFERENCE_CSVS and not SPAWNED_WORKER:
     try:
         REFERENCE_CHECKER = ReferenceChecker.from_csvs(REFERENCE_CSVS)
         log.info("Reference data loaded: %s rows", len(REFERENCE_CHECKER))
     except Exception:
         log.exception("Reference data loading failed")
 
-INDUSTRY_CLASSIFIER = IndustryClassifier()
-CONCEPT_INDEX = ConceptIndex()
+INDUSTRY_CLASSIFIER: IndustryClassifier | None = None if SPAWNED_WORKER else IndustryClassifier()
+CONCEPT_INDEX: ConceptIndex | None = None if SPAWNED_WORKER else ConceptIndex()
 
 ZIP_CODE_RE = re.compile(r"(\d{3}-\d{4})")
 JAPANESE_RE = re.compile(r"[ぁ-んァ-ン一-龥]")
@@ -1917,12 +1925,11 @@ def extract_description_snippet(text: str | None) -> str | None:
             return cleaned
     return None
 
-def extract_meta_description(html: str | None) -> str | None:
+def extract_meta_description(html: HtmlLike) -> str | None:
     if not html:
         return None
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-    except Exception:
+    soup = as_parsed_page(html).soup
+    if soup is None:
         return None
     for attr in ("description", "og:description"):
         node = soup.find("meta", attrs={"name": attr}) or soup.find("meta", attrs={"property": attr})
@@ -1933,12 +1940,11 @@ def extract_meta_description(html: str | None) -> str | None:
                 return cleaned
     return None
 
-def extract_lead_description(html: str | None) -> str | None:
+def extract_lead_description(html: HtmlLike) -> str | None:
     if not html:
         return None
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-    except Exception:
+    soup = as_parsed_page(html).soup
+    if soup is None:
         return None
     candidates: list[str] = []
     noise_re = re.compile(r"(お問い合わせ|お問合せ|アクセス|採用|求人|募集|news|menu|nav|http|https|tel[:：]|電話)", re.I)
@@ -1953,7 +1959,7 @@ def extract_lead_description(html: str | None) -> str | None:
 
 def extract_description_from_payload(payload: dict[str, Any]) -> str:
     text = payload.get("text", "") or ""
-    html = payload.get("html", "") or ""
+    html = as_parsed_page(payload.get("html", "") or "")
     snippet = extract_description_snippet(text)
     if snippet:
         return snippet
@@ -2346,12 +2352,13 @@ def build_official_ai_text(text: str, html: str, signals: dict[str, Any] | None
     if text:
         parts.append(str(text))
     if html:
+        page = as_parsed_page(html)
         try:
-            parts.append(CompanyScraper._meta_strings(html))
+            parts.append(CompanyScraper._meta_strings(page))
         except Exception:
             pass
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = page.soup
             h1 = soup.find("h1")
             if h1:
                 parts.append(f"[H1] {h1.get_text(' ', strip=True)}")
@@ -2595,6 +2602,46 @@ def claim_next(manager: DatabaseManager) -> dict | None:
         return manager.claim_next_company(WORKER_ID)
     return manager.get_next_company()
 
+
+def input_address_parts(company: dict) -> tuple[str, str, str]:
+    """
+    入力住所の (生値, ノイズ除去後, 正規化後)。検索クエリ/照合には正規化後を使う。
+    """
+    # 入力住所は csv_address を優先（古いDBは address に入っているためフォールバック）
+    addr_raw_original = (company.get("csv_address") or company.get("address") or "").strip()
+    # 照合用は「混入ノイズ」を落としたものを使う（DBの生値は保持）
+    addr_raw = sanitize_input_address_raw(addr_raw_original) or addr_raw_original
+    addr = normalize_address(addr_raw) or ""
+    return addr_raw_original, addr_raw, addr
+
+
+def build_search_lookahead(manager: DatabaseManager, scraper: CompanyScraper) -> SearchLookahead | None:
+    if SEARCH_LOOKAHEAD <= 0 or not hasattr(manager, "claim_next_company"):
+        return None
+
+    def _should_prefetch(company: dict) -> bool:
+        cid = company.get("id")
+        name = (company.get("company_name") or "").strip()
+        if not name or (ID_MIN and cid < ID_MIN) or (ID_MAX and cid > ID_MAX):
+            return False
+        return not should_skip_company(name)
+
+    async def _search(company: dict) -> list[str]:
+        name = (company.get("company_name") or "").strip()
+        _, _, addr = input_address_parts(company)
+        if await scraper.guess_official_urls(name, addr):
+            return []
+        return await scraper.search_company(name, addr, num_results=SEARCH_CANDIDATE_LIMIT)
+
+    return SearchLookahead(
+        depth=SEARCH_LOOKAHEAD,
+        claim=lambda: claim_next(manager),
+        search=_search,
+        refresh=lambda companies: manager.refresh_claims([c["id"] for c in companies], WORKER_ID),
+        release=lambda company: manager.release_claim(company["id"], WORKER_ID),
+        should_prefetch=_should_prefetch,
+    )
+
 # --------------------------------------------------
 # ユーティリティ：ジッター付きスリープ秒
 # --------------------------------------------------
@@ -2683,14 +2730,50 @@ async def maybe_skip_if_unchanged(
     prev_url = (company.get("homepage_check_url") or "").strip()
     prev_logic_hash = (company.get("homepage_check_logic_hash") or "").strip()
     current_logic_hash = CURRENT_UPDATE_CHECK_LOGIC_HASH
+    prev_fp = (company.get("homepage_fingerprint") or "").strip()
+    url_matches = (not prev_url) or (prev_url == url)
+    logic_matches = (not prev_logic_hash) or (prev_logic_hash == current_logic_hash)
+    # 前回と同じURL/判定ロジックで指紋がある場合のみ、ETag/Last-Modified で条件付き取得する
+    validators = None
+    if prev_fp and url_matches and logic_matches:
+        validators = {
+            "etag": (company.get("homepage_etag") or "").strip(),
+            "last_modified": (company.get("homepage_last_modified") or "").strip(),
+            "content_length": company.get("homepage_http_content_length"),
+        }
+        if not (validators["etag"] or validators["last_modified"]):
+            validators = None
     try:
         info = await scraper._fetch_http_info(  # type: ignore[attr-defined]
             url,
             timeout_ms=UPDATE_CHECK_TIMEOUT_MS,
             allow_slow=UPDATE_CHECK_ALLOW_SLOW,
+            use_disk_cache=False,
+            validators=validators,
         )
     except Exception:
         return False
+    now_str = _now_utc_str()
+    etag = (info.get("etag") or "").strip()
+    last_modified = (info.get("last_modified") or "").strip()
+    http_content_length = info.get("content_length")
+    if validators and info.get("not_modified"):
+        manager.save_update_check_result(
+            company_id=int(company.get("id") or 0),
+            status="done",
+            homepage_fingerprint=prev_fp,
+            homepage_content_length=company.get("homepage_content_length"),
+            homepage_checked_at=now_str,
+            homepage_check_url=url,
+            homepage_check_source=url_source,
+            homepage_check_logic_hash=current_logic_hash,
+            skip_reason="homepage_unchanged",
+            homepage_etag=etag,
+            homepage_last_modified=last_modified,
+            homepage_http_content_length=http_content_length,
+        )
+        log.info("[skip] homepage unchanged (validator) -> done (id=%s url=%s)", company.get("id"), url)
+        return True
     html = info.get("html") or ""
     text = info.get("text") or ""
     if not (html or text):
@@ -2698,22 +2781,10 @@ async def maybe_skip_if_unchanged(
     fingerprint = scraper.compute_homepage_fingerprint(html, text)
     if not fingerprint:
         return False
-    now_str = _now_utc_str()
     content_length = len(html or text)
-    prev_fp = (company.get("homepage_fingerprint") or "").strip()
-    if not prev_fp:
-        company["homepage_check_url"] = url
-        company["homepage_checked_at"] = now_str
-        company["homepage_content_length"] = content_length
-        company["homepage_fingerprint"] = fingerprint
-        company["homepage_check_source"] = url_source
-        company["homepage_check_logic_hash"] = current_logic_hash
-        return False
-    url_matches = (not prev_url) or (prev_url == url)
-    logic_matches = (not prev_logic_hash) or (prev_logic_hash == current_logic_hash)
-    unchanged = bool(url_matches and logic_matches and prev_fp == fingerprint)
+    unchanged = bool(prev_fp and url_matches and logic_matches and prev_fp == fingerprint)
     if not unchanged:
-        if url_matches and prev_fp == fingerprint and not logic_matches:
+        if prev_fp and url_matches and prev_fp == fingerprint and not logic_matches:
             log.info(
                 "[skip-check] logic hash changed -> force recrawl (id=%s prev=%s current=%s)",
                 company.get("id"),
@@ -2726,6 +2797,9 @@ async def maybe_skip_if_unchanged(
         company["homepage_fingerprint"] = fingerprint
         company["homepage_check_source"] = url_source
         company["homepage_check_logic_hash"] = current_logic_hash
+        company["homepage_etag"] = etag
+        company["homepage_last_modified"] = last_modified
+        company["homepage_http_content_length"] = http_content_length
         return False
     manager.save_update_check_result(
         company_id=int(company.get("id") or 0),
@@ -2737,6 +2811,9 @@ async def maybe_skip_if_unchanged(
         homepage_check_source=url_source,
         homepage_check_logic_hash=current_logic_hash,
         skip_reason="homepage_unchanged",
+        homepage_etag=etag,
+        homepage_last_modified=last_modified,
+        homepage_http_content_length=http_content_length,
     )
     log.info("[skip] homepage unchanged -> done (id=%s url=%s)", company.get("id"), url)
     return True
@@ -2756,6 +2833,7 @@ async def process():
     log.info("update-check logic hash: %s", CURRENT_UPDATE_CHECK_LOGIC_HASH)
 
     scraper = CompanyScraper(headless=HEADLESS)
+    scraper.start_worker_warmup()
     base_page_timeout_ms = getattr(scraper, "page_timeout_ms", 9000) or 9000
     normal_page_timeout_ms = getattr(scraper, "page_timeout_ms", base_page_timeout_ms)
     normal_slow_page_threshold_ms = getattr(scraper, "slow_page_threshold_ms", base_page_timeout_ms)
@@ -2775,6 +2853,7 @@ async def process():
 
     csv_file = None
     csv_writer = None
+    lookahead: SearchLookahead | None = None
     try:
         if MIRROR_TO_CSV:
             os.makedirs(os.path.dirname(OUTPUT_CSV_PATH) or ".", exist_ok=True)
@@ -2793,12 +2872,17 @@ async def process():
             manager.retry_statuses = []
         timeouts_extended = False
 
+        first_company = True
+        lookahead = build_search_lookahead(manager, scraper)
         while True:
             if MAX_ROWS and processed >= MAX_ROWS:
                 log.info("MAX_ROWS=%s に到達。", MAX_ROWS)
                 break
+            if not first_company:
+                await scraper.on_company_boundary()
+            first_company = False
 
-            company = claim_next(manager)
+            company = await lookahead.next_company() if lookahead is not None else claim_next(manager)
             if not company:
                 if SECOND_PASS_ENABLED and not second_pass:
                     # セカンドパス: 長めのタイムアウトで retry_statuses を再処理
@@ -2821,13 +2905,9 @@ async def process():
 
             cid = company.get("id")
             name = (company.get("company_name") or "").strip()
-            # 入力住所は csv_address を優先（古いDBは address に入っているためフォールバック）
-            addr_raw_original = (company.get("csv_address") or company.get("address") or "").strip()
+            addr_raw_original, addr_raw, addr = input_address_parts(company)
             if not (company.get("csv_address") or "").strip():
                 company["csv_address"] = addr_raw_original
-            # 照合用は「混入ノイズ」を落としたものを使う（DBの生値は保持）
-            addr_raw = sanitize_input_address_raw(addr_raw_original) or addr_raw_original
-            addr = normalize_address(addr_raw) or ""
             input_addr_has_zip = bool(ZIP_CODE_RE.search(addr))
             input_addr_has_city = bool(CITY_RE.search(addr))
             input_addr_has_pref = any(pref in addr for pref in CompanyScraper.PREFECTURE_NAMES) if addr else False
@@ -3179,15 +3259,28 @@ async def process():
                 try:
                     candidate_limit = SEARCH_CANDIDATE_LIMIT
                     company_tokens = scraper._company_tokens(name)  # type: ignore
+
+                    guessed_urls: list[str] = []
+
+                    async def discover_candidates() -> list[str]:
+                        # 推測ドメインで社名+住所の一致が取れれば検索エンジンを使わない（外れたら通常の検索。
+                        # 公式判定で全部落ちた場合も後段で検索する）
+                        guessed = await scraper.guess_official_urls(name, addr)
+                        if guessed:
+                            log.info("[%s] domain guess hit -> skip search: %s", cid, guessed)
+                            guessed_urls.extend(guessed)
+                            return guessed
+                        return await scraper.search_company(name, addr, num_results=candidate_limit)
+
                     try:
                         if SEARCH_PHASE_TIMEOUT_SEC > 0:
                             urls = await asyncio.wait_for(
-                                scraper.search_company(name, addr, num_results=candidate_limit),
+                                discover_candidates(),
                                 timeout=clamp_timeout(SEARCH_PHASE_TIMEOUT_SEC),
                             )
                         else:
                             ensure_global_time("search_company_start")
-                            urls = await scraper.search_company(name, addr, num_results=candidate_limit)
+                            urls = await discover_candidates()
                         ensure_global_time("search_company_end")
                     except asyncio.TimeoutError:
                         log.info(
@@ -3375,7 +3468,7 @@ async def process():
                             domain_score_for_flag = scraper._domain_score(company_tokens, url_for_flag)  # type: ignore
                         candidate_text = candidate_info.get("text", "") or ""
                         candidate_html = candidate_info.get("html") or ""
-                        extracted = scraper.extract_candidates(candidate_text, candidate_html)
+                        extracted = await scraper.extract_candidates_async(candidate_text, candidate_html)
                         rule_details = scraper.is_likely_official_site(
                             name, candidate, candidate_info, addr, extracted, return_details=True
                         )
@@ -3496,6 +3589,36 @@ async def process():
                     initial_records, timed_out = await _prepare_batch(first_pairs, search_deadline)
                     candidate_records.extend(initial_records)
                     prepare_timed_out = prepare_timed_out or timed_out
+                    if guessed_urls and not any(
+                        bool((rec.get("rule") or {}).get("is_official")) for rec in initial_records
+                    ):
+                        # 推測ドメインが公式判定で全部落ちたら、検索を省いたままにせず通常の検索候補も評価する
+                        log.info("[%s] domain guess rejected by official judgement -> search", cid)
+                        try:
+                            if SEARCH_PHASE_TIMEOUT_SEC > 0:
+                                searched = await asyncio.wait_for(
+                                    scraper.search_company(name, addr, num_results=candidate_limit),
+                                    timeout=clamp_timeout(SEARCH_PHASE_TIMEOUT_SEC),
+                                )
+                            else:
+                                searched = await scraper.search_company(name, addr, num_results=candidate_limit)
+                        except asyncio.TimeoutError:
+                            log.info("[%s] search_company timeout after domain guess", cid)
+                            searched = []
+                        searched = [u for u in searched if u not in urls][:max_candidates]
+                        if searched:
+                            extra_flags, extra_host_flags = manager.get_url_flags_batch(searched)
+                            url_flags_map.update(extra_flags)
+                            host_flags_map.update(extra_host_flags)
+                            searched_pairs = list(enumerate(searched, start=len(urls)))
+                            urls = urls + searched
+                            remaining_pairs = remaining_pairs + searched_pairs[3:]
+                            search_deadline = (
+                                time.monotonic() + SEARCH_PHASE_TIMEOUT_SEC if SEARCH_PHASE_TIMEOUT_SEC > 0 else None
+                            )
+                            searched_records, timed_out = await _prepare_batch(searched_pairs[:3], search_deadline)
+                            candidate_records.extend(searched_records)
+                            prepare_timed_out = prepare_timed_out or timed_out
                     search_phase_end = elapsed()
 
                     if prepare_timed_out and not candidate_records:
@@ -3624,8 +3747,8 @@ async def process():
                                     base_text = info_payload.get("text", "") or ""
                                     base_html = info_payload.get("html", "") or ""
                                     try:
-                                        base_pt = scraper.classify_page_type(
-                                            base_url, text=base_text, html=base_html
+                                        base_pt = (
+                                            await scraper.classify_page_type_async(base_url, text=base_text, html=base_html)
                                         ).get("page_type") or "OTHER"
                                     except Exception:
                                         base_pt = "OTHER"
@@ -3704,7 +3827,7 @@ async def process():
                                         ptext = page_info.get("text", "") or ""
                                         phtml = page_info.get("html", "") or ""
                                         try:
-                                            pt = scraper.classify_page_type(url, text=ptext, html=phtml).get("page_type") or "OTHER"
+                                            pt = (await scraper.classify_page_type_async(url, text=ptext, html=phtml)).get("page_type") or "OTHER"
                                         except Exception:
                                             pt = "OTHER"
                                         snippet_full = build_official_ai_text(ptext, phtml)
@@ -4484,11 +4607,11 @@ async def process():
                             provisional_evidence_score = int(rule_details.get("official_evidence_score") or 0)
                             if provisional_info:
                                 try:
-                                    pt = scraper.classify_page_type(
+                                    pt = (await scraper.classify_page_type_async(
                                         normalized_url,
                                         text=provisional_info.get("text", "") or "",
                                         html=provisional_info.get("html", "") or "",
-                                    ).get("page_type") or "OTHER"
+                                    )).get("page_type") or "OTHER"
                                     page_type_per_url[normalized_url] = str(pt)
                                     provisional_profile_hit = (pt == "COMPANY_PROFILE")
                                 except Exception:
@@ -4609,7 +4732,7 @@ async def process():
                             }
                         if priority_docs:
                             for url, pdata in priority_docs.items():
-                                absorb_doc_data(url, pdata)
+                                await absorb_doc_data(url, pdata)
                     # 候補フェーズで取得した profile_docs があれば再利用し、不要な巡回を減らす
                     if homepage:
                         for rec in candidate_records:
@@ -4728,7 +4851,7 @@ async def process():
                     DEEP_ALLOW_RULE_OFFICIAL = (os.getenv("DEEP_ALLOW_RULE_OFFICIAL", "true") or "true").strip().lower() == "true"
                     deep_allowed = bool(ai_official_selected or (docs_allowed and DEEP_ALLOW_RULE_OFFICIAL))
 
-                    def absorb_doc_data(url: str, pdata: dict[str, Any]) -> None:
+                    async def absorb_doc_data(url: str, pdata: dict[str, Any]) -> None:
                         nonlocal rule_phone, rule_address, rule_rep
                         nonlocal src_phone, src_addr, src_rep
                         nonlocal listing_val, need_listing
@@ -4743,7 +4866,7 @@ async def process():
                         text_val = pdata.get("text", "") or ""
                         html_val = pdata.get("html", "") or ""
                         try:
-                            pt_rec = scraper.classify_page_type(url, text=text_val, html=html_val) or {}
+                            pt_rec = await scraper.classify_page_type_async(url, text=text_val, html=html_val) or {}
                             pt = pt_rec.get("page_type") or "OTHER"
                             try:
                                 page_score_per_url[url] = int(pt_rec.get("score") or 0)
@@ -4754,7 +4877,7 @@ async def process():
                             page_score_per_url[url] = 0
                         page_type_per_url[url] = str(pt)
 
-                        cc = scraper.extract_candidates(text_val, html_val, page_type_hint=str(pt))
+                        cc = await scraper.extract_candidates_async(text_val, html_val, page_type_hint=str(pt))
                         try:
                             candidates_brief_by_url[url] = {
                                 "page_type": str(pt),
@@ -4985,7 +5108,7 @@ async def process():
                             pass
 
                     if homepage and info_dict:
-                        absorb_doc_data(info_url, info_dict)
+                        await absorb_doc_data(info_url, info_dict)
 
                     missing_contact, missing_extra = refresh_need_flags()
 
@@ -5082,7 +5205,7 @@ async def process():
                                 early_priority_docs = {}
                             for url, pdata in early_priority_docs.items():
                                 priority_docs[url] = pdata
-                                absorb_doc_data(url, pdata)
+                                await absorb_doc_data(url, pdata)
                             # 会社概要/企業情報ページに到達できている場合は、以降の抽出の起点をそちらに寄せる
                             # （トップページだけでは代表者等が載っていないケースが多いため）
                             try:
@@ -5095,7 +5218,7 @@ async def process():
                                     info_dict = {"url": adopted_url, "text": adopted.get("text", "") or "", "html": adopted.get("html", "") or ""}
                                     try:
                                         pt_hint = str((page_type_per_url or {}).get(adopted_url) or "OTHER")
-                                        primary_cands = scraper.extract_candidates(
+                                        primary_cands = await scraper.extract_candidates_async(
                                             info_dict.get("text", "") or "",
                                             info_dict.get("html", "") or "",
                                             page_type_hint=pt_hint,
@@ -5249,7 +5372,7 @@ async def process():
                             site_docs = {}
                         for url, pdata in site_docs.items():
                             priority_docs[url] = pdata
-                            absorb_doc_data(url, pdata)
+                            await absorb_doc_data(url, pdata)
                         if site_docs:
                             # provisional起点が会社概要でない場合、会社概要ページに到達できたら採用元URLを切り替える
                             try:
@@ -5272,7 +5395,7 @@ async def process():
                                             provisional_host_token = provisional_host_token or scraper._host_token_hit(company_tokens, adopted_url)  # type: ignore
                                         text_val = adopted.get("text", "") or ""
                                         html_val = adopted.get("html", "") or ""
-                                        extracted = scraper.extract_candidates(text_val, html_val, page_type_hint=str(page_type_per_url.get(adopted_url) or "OTHER"))
+                                        extracted = await scraper.extract_candidates_async(text_val, html_val, page_type_hint=str(page_type_per_url.get(adopted_url) or "OTHER"))
                                         adopted_rule = scraper.is_likely_official_site(
                                             name,
                                             adopted_url,
@@ -5412,7 +5535,7 @@ async def process():
                                             timeout=bulk_timeout(6.0, count=discover_max_links),
                                         )
                                         for u, pdata in (discovered or {}).items():
-                                            absorb_doc_data(u, pdata)
+                                            await absorb_doc_data(u, pdata)
                                         profile_urls = [
                                             u for u, pt in (page_type_per_url or {}).items() if str(pt) == "COMPANY_PROFILE"
                                         ]
@@ -5543,14 +5666,14 @@ async def process():
                                     text = data.get("text", "") or ""
                                     html_content = data.get("html", "") or ""
                                     try:
-                                        pt_info = scraper.classify_page_type(url, text=text, html=html_content) or {}
+                                        pt_info = await scraper.classify_page_type_async(url, text=text, html=html_content) or {}
                                         pt = pt_info.get("page_type") or "OTHER"
                                         pt_score = int(pt_info.get("score") or 0)
                                     except Exception:
                                         pt = "OTHER"
                                         pt_score = 0
                                     page_type_per_url[url] = str(pt)
-                                    cc = scraper.extract_candidates(text, html_content, page_type_hint=str(pt))
+                                    cc = await scraper.extract_candidates_async(text, html_content, page_type_hint=str(pt))
                                     deep_phone_candidates += len(cc.get("phone_numbers") or [])
                                     deep_address_candidates += len(cc.get("addresses") or [])
                                     deep_rep_candidates += len(cc.get("rep_names") or [])
@@ -5725,7 +5848,7 @@ async def process():
                                     extra_docs = {}
                                 for url, pdata in extra_docs.items():
                                     priority_docs[url] = pdata
-                                    absorb_doc_data(url, pdata)
+                                    await absorb_doc_data(url, pdata)
 
                             deep_phase_end = elapsed()
                             # ---- AI (final, max 1 call/company) ----
@@ -5768,9 +5891,9 @@ async def process():
                                     scored_urls: list[tuple[int, str]] = []
                                     for u, d in docs_by_url.items():
                                         try:
-                                            pt = page_type_per_url.get(u) or scraper.classify_page_type(
+                                            pt = page_type_per_url.get(u) or (await scraper.classify_page_type_async(
                                                 u, text=d.get("text", ""), html=d.get("html", "")
-                                            ).get("page_type") or "OTHER"
+                                            )).get("page_type") or "OTHER"
                                         except Exception:
                                             pt = page_type_per_url.get(u) or "OTHER"
                                         page_type_per_url[u] = str(pt)
@@ -5778,7 +5901,7 @@ async def process():
                                     scored_urls.sort(key=lambda x: (x[0], x[1]))
                                     top_urls_for_ai = [u for _, u in scored_urls if u][:3]
 
-                                    def _pack_candidates(urls_for_ai: list[str]) -> dict[str, Any]:
+                                    async def _pack_candidates(urls_for_ai: list[str]) -> dict[str, Any]:
                                         out: dict[str, Any] = {
                                             "company_name": name,
                                             "csv_address": addr_raw,
@@ -5797,7 +5920,7 @@ async def process():
                                             h = d.get("html", "") or ""
                                             pt = page_type_per_url.get(u) or "OTHER"
                                             out["urls"].append({"url": u, "page_type": pt})
-                                            cc = scraper.extract_candidates(t, h, page_type_hint=str(pt))
+                                            cc = await scraper.extract_candidates_async(t, h, page_type_hint=str(pt))
                                             for p in (cc.get("phone_numbers") or [])[:10]:
                                                 out["candidates"]["phone_numbers"].append({"value": p, "url": u, "page_type": pt})
                                             for a in (cc.get("addresses") or [])[:10]:
@@ -5815,7 +5938,7 @@ async def process():
                                                 out["business_snippets"].append({"url": u, "snippet": biz[:800], "page_type": pt})
                                         return out
 
-                                    ai_payload = _pack_candidates(top_urls_for_ai)
+                                    ai_payload = await _pack_candidates(top_urls_for_ai)
                                     screenshot_payload = None
                                     if info_url:
                                         info_dict = await ensure_info_has_screenshot(
@@ -7152,6 +7275,23 @@ async def process():
     finally:
         if csv_file:
             csv_file.close()
+        if lookahead is not None:
+            # 先行確保したまま処理しなかった会社は pending に戻す
+            await lookahead.close()
+            log.info("[lookahead] prefetched=%d lost_leases=%d", lookahead.prefetched, lookahead.lost_leases)
+        try:
+            scraper.log_page_cache_stats()
+            scraper.log_host_limiter_stats()
+            scraper.log_pdf_extractor_stats()
+            if scraper.fetch_archive is not None:
+                log.info("[archive] %s", scraper.fetch_archive.stats())
+            log.info(
+                "[browser] recycles=%d by_reason=%s",
+                scraper.browser_recycles,
+                scraper.browser_recycle_reasons,
+            )
+        except Exception:
+            pass
         if hasattr(scraper, "close") and callable(getattr(scraper, "close")):
             try:
                 await scraper.close()
@@ -6,6 +6,24 @@ MIN=1
 MAX=$(sqlite3 data/companies.db 'select max(id) from companies;')
 R=$(( (MAX - MIN + 1 + N -1)/N ))
 mkdir -p logs
+# SHARED_BROWSER=1 で Chromium を1つだけ起動し、全 shard から CDP で接続する（shard 数に比例したメモリ増を避ける）
+if [ "${SHARED_BROWSER:-0}" = "1" ] && [ -z "${BROWSER_CDP_URL:-}" ]; then
+  PORT=${BROWSER_SERVER_PORT:-9222}
+  rm -f logs/browser_endpoint.txt
+  nohup python scripts/browser_server.py --port "$PORT" --endpoint-file logs/browser_endpoint.txt > logs/browser-server.log 2>&1 &
+  for _ in $(seq 1 100); do
+    [ -s logs/browser_endpoint.txt ] && break
+    sleep 0.2
+  done
+  if [ -s logs/browser_endpoint.txt ]; then
+    export BROWSER_CDP_URL=$(cat logs/browser_endpoint.txt)
+    echo "shared browser: $BROWSER_CDP_URL"
+  else
+    echo "shared browser failed to start (logs/browser-server.log). 各 shard で個別に起動します。"
+  fi
+fi
+# 検索エンジンの健全性（サーキットブレーカー）を shard 間で共有する
+export SEARCH_ENGINE_HEALTH_DB_PATH=${SEARCH_ENGINE_HEALTH_DB_PATH:-logs/search_engine_health.sqlite3}
 for i in $(seq 0 $((N-1))); do
   S=$(( MIN + i*R ))
   E=$(( S + R - 1 ))
@@ -19,4 +37,4 @@ for i in $(seq 0 $((N-1))); do
   WORKER_ID="w$((i+1))" ID_MIN=$S ID_MAX=$E FETCH_CONCURRENCY=$PER \
     nohup bash -c ": > logs/app-$i.log; python main.py >> logs/app-$i.log 2>&1" &
 done
-echo "起動完了。進捗は logs/app-*.log を参照。停止は: pkill -f 'python main.py'"
+echo "起動完了。進捗は logs/app-*.log を参照。停止は: pkill -f 'python main.py'（共有ブラウザは pkill -f browser_server.py）"
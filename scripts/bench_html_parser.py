@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+HTML パーサー（html.parser / lxml）ごとの1ページあたりのパース時間を測る。
+
+使い方:
+    python scripts/bench_html_parser.py                              # リポジトリ直下の *_sample.html 等
+    python scripts/bench_html_parser.py --files 'data/pages/*.html'
+    python scripts/bench_html_parser.py --archive data/bench_archive.sqlite3 --limit 500   # fetch archive の記録ページ
+
+--analyze を付けると、パースに加えて公式判定/ページ分類/候補抽出/リンク選別までの1ページ処理時間も測る。
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src import html_backend  # noqa: E402
+from src.html_backend import LXML_AVAILABLE, PARSER_HTML, PARSER_LXML, make_soup  # noqa: E402
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * pct
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return values[int(k)]
+    return values[int(f)] * (c - k) + values[int(c)] * (k - f)
+
+
+def load_pages(args: argparse.Namespace) -> List[Tuple[str, str]]:
+    pages: List[Tuple[str, str]] = []
+    if args.archive:
+        conn = sqlite3.connect(args.archive)
+        try:
+            rows = conn.execute(
+                "SELECT key, payload FROM fetch_archive WHERE kind IN ('page', 'http') LIMIT ?",
+                (args.limit,),
+            ).fetchall()
+        finally:
+            conn.close()
+        for key, payload in rows:
+            try:
+                html = (json.loads(zlib.decompress(payload).decode("utf-8")) or {}).get("html") or ""
+            except Exception:
+                continue
+            if html:
+                pages.append((key, html))
+    # 既定の ROOT/*.html は --files も --archive も指定されていないときだけ使う（アーカイブ計測に手元の HTML を混ぜない）
+    if args.files is not None:
+        patterns = args.files
+    elif args.archive:
+        patterns = []
+    else:
+        patterns = [str(ROOT / "*.html")]
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern))[: args.limit]:
+            pages.append((path, Path(path).read_text(encoding="utf-8", errors="replace")))
+    return pages[: args.limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-page HTML parse time by parser backend")
+    parser.add_argument("--files", nargs="*", default=None, help="Glob(s) of HTML files")
+    parser.add_argument("--archive", default="", help="Fetch archive (FETCH_ARCHIVE_PATH) to read pages from")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3, help="Parses per page (best of N)")
+    parser.add_argument("--analyze", action="store_true", help="Also time the full per-page analyzers")
+    args = parser.parse_args()
+
+    pages = load_pages(args)
+    if not pages:
+        print("No pages found.")
+        return
+    backends = [PARSER_HTML] + ([PARSER_LXML] if LXML_AVAILABLE else [])
+    scraper = None
+    if args.analyze:
+        os.environ.setdefault("PAGE_PARSED_CACHE_SIZE", "8")
+        from src.company_scraper import CompanyScraper
+
+        scraper = CompanyScraper(headless=True)
+
+    total_kb = sum(len(html) for _, html in pages) / 1024
+    print(f"pages={len(pages)} avg_kb={total_kb / len(pages):.1f}")
+    print("backend,stage,count,avg_ms,p50_ms,p95_ms,max_ms")
+    for backend in backends:
+        html_backend.HTML_PARSER = backend
+        stages = {"parse": []}
+        if scraper is not None:
+            stages["analyze"] = []
+        for url, html in pages:
+            best = float("inf")
+            for _ in range(max(1, args.repeat)):
+                started = time.perf_counter()
+                make_soup(html)
+                best = min(best, (time.perf_counter() - started) * 1000)
+            stages["parse"].append(best)
+            if scraper is not None:
+                scraper.page_cache.clear()
+                started = time.perf_counter()
+                scraper.classify_page_type(url, "", html)
+                scraper.extract_candidates("", html)
+                scraper._find_priority_links(url, html)
+                scraper.is_likely_official_site("", url, {"url": url, "text": "", "html": html})
+                stages["analyze"].append((time.perf_counter() - started) * 1000)
+        for stage, values in stages.items():
+            print(
+                f"{backend},{stage},{len(values)},{sum(values) / len(values):.2f},"
+                f"{percentile(values, 0.5):.2f},{percentile(values, 0.95):.2f},{max(values):.2f}"
+            )
+    if not LXML_AVAILABLE:
+        print("lxml is not installed; only html.parser was measured.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+shard 間で共有する Chromium を1つだけ起動し、CDP エンドポイント（ローカル websocket）を公開するランチャー。
+
+各 main.py は BROWSER_CDP_URL にこのエンドポイントを指定すると、自前で Chromium を起動せずに接続し、
+それぞれ独自の BrowserContext を作って使う（shard を増やしてもブラウザ本体のメモリはほぼ一定）。
+Python 版 Playwright には launch_server が無いため、Playwright 同梱の Chromium を
+--remote-debugging-port 付きで直接起動する。
+
+使い方:
+    python scripts/browser_server.py --port 9222
+    BROWSER_CDP_URL=http://127.0.0.1:9222 python main.py
+"""
+
+import argparse
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+
+def wait_for_endpoint(host: str, port: int, timeout_sec: float) -> str:
+    """/json/version が応答するまで待ち、websocket の URL を返す。"""
+    deadline = time.monotonic() + timeout_sec
+    url = f"http://{host}:{port}/json/version"
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1.0) as resp:
+                data = json.loads(resp.read().decode("utf-8"))
+                return data.get("webSocketDebuggerUrl") or ""
+        except Exception:
+            time.sleep(0.2)
+    raise TimeoutError(f"browser endpoint did not come up: {url}")
+
+
+def chromium_executable() -> str:
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        return p.chromium.executable_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Launch one shared Chromium for all shard workers (CDP).")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address for the debugging endpoint")
+    parser.add_argument("--port", type=int, default=int(os.getenv("BROWSER_SERVER_PORT", "9222")))
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--endpoint-file", default="logs/browser_endpoint.txt", help="Write the CDP URL here")
+    parser.add_argument("--startup-timeout", type=float, default=20.0)
+    args = parser.parse_args()
+
+    executable = chromium_executable()
+    if not os.path.exists(executable):
+        print(f"chromium not found: {executable} (run: playwright install chromium)", file=sys.stderr)
+        sys.exit(1)
+    user_data_dir = tempfile.mkdtemp(prefix="shared-chromium-")
+    cmd = [
+        executable,
+        f"--remote-debugging-address={args.host}",
+        f"--remote-debugging-port={args.port}",
+        f"--user-data-dir={user_data_dir}",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-dev-shm-usage",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-background-networking",
+        "--disable-extensions",
+        "--mute-audio",
+    ]
+    if not args.headed:
+        cmd.append("--headless=new")
+    cmd.append("about:blank")
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def _shutdown(*_args) -> None:
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    try:
+        ws_url = wait_for_endpoint(args.host, args.port, args.startup_timeout)
+    except TimeoutError as exc:
+        print(str(exc), file=sys.stderr)
+        _shutdown()
+        return
+    cdp_url = f"http://{args.host}:{args.port}"
+    if args.endpoint_file:
+        directory = os.path.dirname(args.endpoint_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.endpoint_file, "w", encoding="utf-8") as f:
+            f.write(cdp_url + "\n")
+    print(f"shared browser ready: BROWSER_CDP_URL={cdp_url} ws={ws_url} pid={proc.pid}", flush=True)
+    proc.wait()
+    shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from bs4 import BeautifulSoup
-
 from src.ai_verifier import AIVerifier
 from src.company_scraper import CompanyScraper
+from src.html_backend import make_soup
 
 CONTACT_KEYWORDS = (
     "お問い合わせ",
@@ -172,7 +171,7 @@ def _is_external_form_host(host: str) -> bool:
 def _parse_candidates(base_url: str, html: str, scraper: CompanyScraper) -> List[Dict[str, Any]]:
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     candidates: Dict[str, Dict[str, Any]] = {}
 
     def add_candidate(url: str, token: str, source: str) -> None:
@@ -299,7 +298,7 @@ def _homepage_is_contact(scraper: CompanyScraper, url: str, html: str, text: str
 def _form_choice_flags(html: str) -> Tuple[bool, bool, bool]:
     if not html:
         return False, False, False
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     forms = soup.find_all("form")
     if not forms:
         return False, False, _email_present(html)
@@ -356,7 +355,7 @@ def _build_ai_signals(homepage: str, url: str, html: str) -> str:
     title = ""
     general_option, recruit_only, email_present = _form_choice_flags(html)
     if html:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         if soup.title and soup.title.string:
             title = soup.title.string.strip()
         forms = soup.find_all("form")
@@ -129,12 +129,22 @@ class FetchResult:
     error: str = ""
 
 
+def _make_soup(html: str) -> Any:
+    # HTML_PARSER=lxml/auto なら lxml（未導入/失敗時は html.parser）。src/html_backend.py と同じ選択
+    if os.getenv("HTML_PARSER", "html.parser").strip().lower() in ("lxml", "auto"):
+        try:
+            return BeautifulSoup(html, "lxml")
+        except Exception:
+            pass
+    return BeautifulSoup(html, "html.parser")
+
+
 def _html_to_text(html: str) -> str:
     if not html:
         return ""
     if BeautifulSoup is None:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _make_soup(html)
     for tag in soup(["script", "style", "noscript"]):
         try:
             tag.decompose()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+固定コーパス（companies DB + fetch archive）で main.py の process() を end-to-end に実行し、スループットを測る。
+
+1) 記録（ネットワークあり。コーパスの DB は複製して使うので元は変わらない）:
+    python scripts/replay_benchmark.py --db data/bench_companies.db --archive data/bench_archive.sqlite3 --mode record
+2) 再生（ネットワークなし。コミット間の比較用）:
+    python scripts/replay_benchmark.py --db data/bench_companies.db --archive data/bench_archive.sqlite3 --profile logs/bench.prof
+
+- DB は毎回一時ディレクトリへ複製し、slow host/正規オリジン/描画モード等の学習状態も一時ディレクトリに閉じ込める
+- AI 呼び出しとディスクキャッシュは無効化する（記録も再生も同じ条件）。ドメイン推測（DNS）は記録対象外なので無効
+- 結果は JSON 1行（処理社数・経過秒・社/秒・ステータス内訳・archive の miss 数）
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# 記録/再生で揃える設定（呼び出し側の環境変数より優先）
+FIXED_ENV = {
+    "USE_AI": "false",
+    "INDUSTRY_AI_ENABLED": "false",
+    "INDUSTRY_FACTCHECK_AI_ENABLED": "false",
+    "CONTACT_URL_AI_ENABLED": "false",
+    "MIRROR_TO_CSV": "false",
+    "SLEEP_BETWEEN_SEC": "0",
+    "PAGE_DISK_CACHE_ENABLED": "false",
+    "SEARCH_DISK_CACHE_ENABLED": "false",
+    "DOMAIN_GUESS_ENABLED": "false",
+    "SEARCH_ENGINE_HEALTH_DB_PATH": "",
+}
+
+
+def _status_counts(db_path: str) -> Dict[str, int]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT status, COUNT(*) FROM companies GROUP BY status").fetchall()
+    finally:
+        conn.close()
+    return {str(status): int(count) for status, count in rows}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark process() on a recorded corpus")
+    parser.add_argument("--db", required=True, help="Corpus companies DB (copied, never modified)")
+    parser.add_argument("--archive", required=True, help="Fetch archive path (SQLite)")
+    parser.add_argument("--mode", choices=("record", "replay"), default="replay")
+    parser.add_argument("--rows", type=int, default=0, help="MAX_ROWS (0 = all pending rows)")
+    parser.add_argument("--id-min", type=int, default=0)
+    parser.add_argument("--id-max", type=int, default=0)
+    parser.add_argument("--latency-scale", type=float, default=0.0, help="Replay recorded latency x scale (0 = none)")
+    parser.add_argument("--profile", default="", help="Write cProfile stats to this path")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary work directory")
+    args = parser.parse_args()
+
+    if args.mode == "replay" and not os.path.exists(args.archive):
+        print(f"archive not found: {args.archive}", file=sys.stderr)
+        return 2
+
+    workdir = tempfile.mkdtemp(prefix="replay-bench-")
+    db_copy = os.path.join(workdir, "companies.db")
+    shutil.copy2(args.db, db_copy)
+    before = _status_counts(db_copy)
+
+    env = os.environ.copy()
+    env.update(FIXED_ENV)
+    env.update(
+        {
+            "COMPANIES_DB_PATH": db_copy,
+            "FETCH_ARCHIVE_MODE": args.mode,
+            "FETCH_ARCHIVE_PATH": os.path.abspath(args.archive),
+            "FETCH_ARCHIVE_REPLAY_LATENCY_SCALE": str(args.latency_scale),
+            "MAX_ROWS": str(max(0, args.rows)),
+            "ID_MIN": str(max(0, args.id_min)),
+            "ID_MAX": str(max(0, args.id_max)),
+            "HOST_HEALTH_DB_PATH": os.path.join(workdir, "host_health.sqlite3"),
+            "SLOW_HOSTS_PATH": os.path.join(workdir, "slow_hosts.txt"),
+            "CANONICAL_ORIGINS_PATH": os.path.join(workdir, "canonical_origins.txt"),
+            "RENDER_MODES_PATH": os.path.join(workdir, "render_modes.txt"),
+        }
+    )
+    cmd = [sys.executable]
+    if args.profile:
+        cmd += ["-m", "cProfile", "-o", os.path.abspath(args.profile)]
+    cmd.append(str(ROOT / "main.py"))
+
+    log_path = os.path.join(workdir, "run.log")
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        completed = subprocess.run(cmd, env=env, cwd=ROOT, stdout=log_file, stderr=subprocess.STDOUT, check=False)
+    elapsed = time.perf_counter() - started
+
+    after = _status_counts(db_copy)
+    processed = max(0, before.get("pending", 0) - after.get("pending", 0))
+    misses = 0
+    with open(log_path, encoding="utf-8", errors="replace") as log_file:
+        for line in log_file:
+            m = re.search(r"\[archive\] \{.*'misses': (\d+)", line)
+            if m:
+                misses = int(m.group(1))
+    print(
+        json.dumps(
+            {
+                "mode": args.mode,
+                "returncode": completed.returncode,
+                "companies": processed,
+                "elapsed_sec": round(elapsed, 3),
+                "companies_per_sec": round(processed / elapsed, 4) if elapsed > 0 else 0.0,
+                "status": after,
+                "archive_misses": misses,
+                "log": log_path if args.keep else "",
+            },
+            ensure_ascii=False,
+        )
+    )
+    if not args.keep:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return completed.returncode
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
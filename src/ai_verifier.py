@@ -11,6 +11,7 @@ import html as html_mod
 from typing import Optional, Dict, Any
 
 from .jp_number import normalize_kanji_numbers
+from .screenshot_profile import image_mime_type
 
 # ---- .env -------------------------------------------------------
 try:
@@ -709,7 +710,7 @@ class AIVerifier:
             if use_image and screenshot:
                 try:
                     b64 = base64.b64encode(screenshot).decode("utf-8")
-                    out.append({"inline_data": {"mime_type": "image/png", "data": b64}})
+                    out.append({"inline_data": {"mime_type": image_mime_type(screenshot), "data": b64}})
                 except Exception:
                     pass
             return out
@@ -863,7 +864,7 @@ class AIVerifier:
             if use_image and screenshot:
                 try:
                     b64 = base64.b64encode(screenshot).decode("utf-8")
-                    payload.append({"inline_data": {"mime_type": "image/png", "data": b64}})
+                    payload.append({"inline_data": {"mime_type": image_mime_type(screenshot), "data": b64}})
                 except Exception:
                     log.warning("Failed to encode screenshot; proceeding text-only.")
             return payload
@@ -1017,7 +1018,7 @@ class AIVerifier:
             if use_image and screenshot:
                 try:
                     b64 = base64.b64encode(screenshot).decode("utf-8")
-                    payload.append({"inline_data": {"mime_type": "image/png", "data": b64}})
+                    payload.append({"inline_data": {"mime_type": image_mime_type(screenshot), "data": b64}})
                 except Exception:
                     pass
             return payload
@@ -1094,7 +1095,7 @@ class AIVerifier:
             if use_image and screenshot:
                 try:
                     b64 = base64.b64encode(screenshot).decode("utf-8")
-                    payload.append({"inline_data": {"mime_type": "image/png", "data": b64}})
+                    payload.append({"inline_data": {"mime_type": image_mime_type(screenshot), "data": b64}})
                 except Exception:
                     pass
             return payload
@@ -1278,7 +1279,7 @@ class AIVerifier:
                 for shot in images:
                     try:
                         b64 = base64.b64encode(shot).decode("utf-8")
-                        payload.append({"inline_data": {"mime_type": "image/png", "data": b64}})
+                        payload.append({"inline_data": {"mime_type": image_mime_type(shot), "data": b64}})
                     except Exception:
                         continue
             return payload
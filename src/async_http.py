@@ -0,0 +1,402 @@
+# src/async_http.py
+"""
+asyncio ネイティブな HTTP 取得エンジン（aiohttp 利用時のみ有効）。
+
+requests.Session.get を asyncio.to_thread で包む方式はスレッドプールを食い潰し、
+ページごとにスレッド切替の遅延が乗るため、イベントループ上で直接 I/O する経路を用意する。
+- 呼び出し側の互換性のため、戻り値は requests.Response（url/status_code/headers/content/text 等）に詰め替える
+- 例外も requests.exceptions.* に寄せる（既存の except / SSL 判定をそのまま使えるようにする）
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp as _aiohttp  # type: ignore
+except Exception:
+    _aiohttp = None
+
+log = logging.getLogger(__name__)
+
+
+def aiohttp_available() -> bool:
+    return _aiohttp is not None
+
+
+# skip_body_if で本文を読まずに返したときの body_aborted 値（条件付きGETの検証子一致など）
+BODY_SKIPPED_VALIDATOR = "validator_match"
+
+# 先頭何バイトで本文種別（HTML/PDF/その他）を判定するか
+SNIFF_BYTES = 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+_HTML_CONTENT_TYPES = {
+    "text/html",
+    "application/xhtml+xml",
+    "application/xml",
+    "text/xml",
+    "text/plain",
+}
+_UNKNOWN_CONTENT_TYPES = {
+    "",
+    "application/octet-stream",
+    "binary/octet-stream",
+    "application/unknown",
+    "application/x-unknown",
+}
+# ZIP/Office, 画像, gzip, RAR, 7z, MP3, Ogg, RIFF(WAV/AVI/WebP), Matroska/WebM
+_BINARY_MAGICS = (
+    b"PK\x03\x04",
+    b"\x89PNG",
+    b"\xff\xd8\xff",
+    b"GIF8",
+    b"\x1f\x8b",
+    b"Rar!",
+    b"7z\xbc\xaf",
+    b"ID3",
+    b"OggS",
+    b"RIFF",
+    b"\x1aE\xdf\xa3",
+)
+
+
+@dataclass(frozen=True)
+class BodyLimit:
+    """
+    ストリーミング取得時の本文上限。
+    - max_bytes: HTML/テキストはここで読み止め、途中までのHTMLを返す（0以下で無制限）
+    - max_pdf_bytes: PDF は途中までだと解析できないため、超過時は本文を捨てる（0以下で無制限）
+    """
+
+    max_bytes: int = 2_000_000
+    max_pdf_bytes: int = 8_000_000
+
+
+def sniff_body_kind(content_type: str, head: bytes) -> str:
+    """
+    Content-Type と先頭バイトから本文種別を返す: "html" / "pdf" / "other"。
+    Content-Type が無い/汎用（octet-stream）の場合のみ先頭バイトで推定する。
+    """
+    ct = (content_type or "").split(";")[0].strip().lower()
+    head = head or b""
+    if ct == "application/pdf" or head.startswith(b"%PDF"):
+        return "pdf"
+    if ct in _HTML_CONTENT_TYPES or ct.startswith("text/") or ct.endswith("+xml"):
+        return "html"
+    if ct not in _UNKNOWN_CONTENT_TYPES:
+        return "other"
+    stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if stripped.startswith(b"<"):
+        return "html"
+    if head.startswith(_BINARY_MAGICS) or head[4:8] == b"ftyp":
+        return "other"
+    if b"\x00" in head[:512]:
+        return "other"
+    return "html"
+
+
+def trim_html_prefix(raw: bytes) -> bytes:
+    """
+    途中で打ち切ったHTMLを、直近のタグ終端（>）までに揃えて壊れたタグ断片を残さない。
+    """
+    if not raw:
+        return raw
+    cut = raw.rfind(b">", max(0, len(raw) - 4096))
+    if cut <= 0:
+        return raw
+    return raw[: cut + 1]
+
+
+class _LimitedBody:
+    """
+    チャンクを受け取りつつ、本文種別の判定と上限バイト数での読み止めを行う。
+    sync(requests)/async(aiohttp) の両経路で共用する。
+    """
+
+    def __init__(self, limit: BodyLimit, content_type: str, content_length: Optional[int] = None) -> None:
+        self.limit = limit
+        self.content_type = content_type or ""
+        self.content_length = content_length
+        self.parts: list[bytes] = []
+        self.size = 0
+        self.kind = ""
+        self.truncated = False
+        self.aborted = ""
+
+    def _decide(self) -> None:
+        head = b"".join(self.parts)[:SNIFF_BYTES]
+        self.kind = sniff_body_kind(self.content_type, head)
+        if self.kind == "other":
+            self.aborted = "content_type"
+        elif (
+            self.kind == "pdf"
+            and self.limit.max_pdf_bytes > 0
+            and self.content_length
+            and self.content_length > self.limit.max_pdf_bytes
+        ):
+            self.aborted = "pdf_too_large"
+
+    def feed(self, chunk: bytes) -> bool:
+        """続けて読むべきなら True。"""
+        if self.aborted or self.truncated:
+            return False
+        if chunk:
+            self.parts.append(chunk)
+            self.size += len(chunk)
+        if not self.kind and self.size >= SNIFF_BYTES:
+            self._decide()
+            if self.aborted:
+                return False
+        if not self.kind:
+            return True
+        cap = self.limit.max_pdf_bytes if self.kind == "pdf" else self.limit.max_bytes
+        if cap > 0 and self.size > cap:
+            if self.kind == "pdf":
+                self.aborted = "pdf_too_large"
+            else:
+                self.truncated = True
+            return False
+        return True
+
+    def finish(self) -> bytes:
+        if not self.kind:
+            self._decide()
+        if self.aborted:
+            return b""
+        raw = b"".join(self.parts)
+        if self.truncated:
+            raw = trim_html_prefix(raw[: self.limit.max_bytes])
+        return raw
+
+    def apply(self, resp: requests.Response) -> requests.Response:
+        resp._content = self.finish()
+        resp.body_kind = self.kind  # type: ignore[attr-defined]
+        resp.body_truncated = self.truncated  # type: ignore[attr-defined]
+        resp.body_aborted = self.aborted  # type: ignore[attr-defined]
+        resp.body_bytes_read = self.size  # type: ignore[attr-defined]
+        return resp
+
+
+def _content_length(headers: Any) -> Optional[int]:
+    try:
+        raw = headers.get("Content-Length")
+        return int(raw) if raw not in (None, "") else None
+    except Exception:
+        return None
+
+
+def read_limited_sync(
+    resp: Any,
+    limit: BodyLimit,
+    skip_body_if: Optional[Callable[[int, Any], bool]] = None,
+) -> Any:
+    """
+    requests.get(..., stream=True) のレスポンスを上限付きで読み、_content に詰め直す。
+    skip_body_if(status, headers) が True なら本文を読まずに閉じる。
+    iter_content を持たない互換オブジェクトはそのまま返す。
+    """
+    if not hasattr(resp, "iter_content"):
+        return resp
+    if skip_body_if is not None and skip_body_if(int(getattr(resp, "status_code", 0) or 0), resp.headers):
+        try:
+            resp.close()
+        except Exception:
+            pass
+        resp._content = b""
+        resp.body_aborted = BODY_SKIPPED_VALIDATOR
+        return resp
+    headers = getattr(resp, "headers", {}) or {}
+    body = _LimitedBody(limit, headers.get("Content-Type") or "", _content_length(headers))
+    try:
+        for chunk in resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+            if not body.feed(chunk):
+                break
+    finally:
+        try:
+            resp.close()
+        except Exception:
+            pass
+    return body.apply(resp)
+
+
+def _to_client_timeout(timeout: Any):
+    """
+    requests 形式の timeout（秒 or (connect, read)）を aiohttp.ClientTimeout へ変換する。
+    requests と同様に「全体」の上限は掛けない（全体上限は呼び出し側の wait_for が担う）。
+    """
+    if timeout is None:
+        return _aiohttp.ClientTimeout(total=None)
+    if isinstance(timeout, (tuple, list)) and len(timeout) == 2:
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return _aiohttp.ClientTimeout(
+        total=None,
+        connect=float(connect) if connect else None,
+        sock_read=float(read) if read else None,
+    )
+
+
+def _to_ssl_option(verify: Any) -> Any:
+    """requests の verify（bool / CA バンドルのパス）を aiohttp の ssl= へ変換する。"""
+    if verify is False:
+        return False
+    if isinstance(verify, str) and verify:
+        return ssl.create_default_context(cafile=verify)
+    return True
+
+
+def _to_proxy(url: str, proxies: Optional[Dict[str, str]]) -> Optional[str]:
+    """requests の proxies（スキーム→URL）から url に使うプロキシを選ぶ。"""
+    if not proxies:
+        return None
+    scheme = url.split(":", 1)[0].lower()
+    return proxies.get(scheme) or proxies.get("all") or None
+
+
+class AsyncHttpClient:
+    """
+    aiohttp.ClientSession を1本だけ持ち、ホスト単位のコネクションプール/keep-alive を使い回す。
+    - limit: プロセス全体の同時接続上限
+    - limit_per_host: 同一ホストへの同時接続上限
+    - セッションは作成時のイベントループに紐づくため、ループが変わったら古いセッションを閉じてから作り直す
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+    ) -> None:
+        if _aiohttp is None:
+            raise RuntimeError("aiohttp is not installed")
+        self.limit = max(1, int(limit))
+        self.limit_per_host = max(1, int(limit_per_host))
+        self.keepalive_timeout = max(0.0, float(keepalive_timeout))
+        self.dns_cache_ttl = max(0, int(dns_cache_ttl))
+        self._session = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self):
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+        stale, stale_loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if stale is not None and not stale.closed:
+            await self._close_stale(stale, stale_loop)
+            # 閉じている間に並行呼び出しが作り直していればそれを使う
+            if self._session is not None and not self._session.closed and self._loop is loop:
+                return self._session
+        connector = _aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout or None,
+            ttl_dns_cache=self.dns_cache_ttl or None,
+            enable_cleanup_closed=True,
+        )
+        # 既存 requests 経路と同じく環境変数のプロキシ設定を尊重する
+        self._session = _aiohttp.ClientSession(connector=connector, trust_env=True)
+        self._loop = loop
+        return self._session
+
+    async def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Any = None,
+        allow_redirects: bool = True,
+        verify: Any = True,
+        stream: bool = False,
+        cookies: Optional[Dict[str, str]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        body_limit: Optional[BodyLimit] = None,
+        skip_body_if: Optional[Callable[[int, Any], bool]] = None,
+    ) -> requests.Response:
+        """
+        requests.Session.get と同じ引数で取得する（対応していない引数は TypeError）。
+        stream は受け付けるだけ（本文は常に読み切るか body_limit で打ち切って Response に詰める）。
+        """
+        session = await self._get_session()
+        try:
+            async with session.get(
+                url,
+                params=params,
+                headers=headers,
+                cookies=cookies,
+                proxy=_to_proxy(url, proxies),
+                ssl=_to_ssl_option(verify),
+                timeout=_to_client_timeout(timeout),
+                allow_redirects=allow_redirects,
+            ) as resp:
+                if skip_body_if is not None and skip_body_if(int(resp.status), resp.headers):
+                    resp.close()
+                    out = self._build_response(resp, b"")
+                    out.body_aborted = BODY_SKIPPED_VALIDATOR  # type: ignore[attr-defined]
+                    return out
+                if body_limit is None:
+                    raw = await resp.read()
+                    return self._build_response(resp, raw)
+                body = _LimitedBody(body_limit, resp.headers.get("Content-Type") or "", resp.content_length)
+                async for chunk in resp.content.iter_chunked(_STREAM_CHUNK_BYTES):
+                    if not body.feed(chunk):
+                        # 読み残しがある接続は再利用できないため明示的に閉じる
+                        resp.close()
+                        break
+                return body.apply(self._build_response(resp, b""))
+        except _aiohttp.ClientSSLError as exc:
+            raise requests.exceptions.SSLError(str(exc)) from exc
+        except ssl.SSLError as exc:
+            raise requests.exceptions.SSLError(str(exc)) from exc
+        except asyncio.TimeoutError as exc:
+            raise requests.exceptions.Timeout(f"timeout url={url}") from exc
+        except _aiohttp.InvalidURL as exc:
+            raise requests.exceptions.InvalidURL(str(exc)) from exc
+        except _aiohttp.ClientError as exc:
+            raise requests.exceptions.ConnectionError(str(exc)) from exc
+
+    @staticmethod
+    def _build_response(resp: Any, raw: bytes) -> requests.Response:
+        out = requests.Response()
+        out.status_code = int(resp.status)
+        out.reason = resp.reason or ""
+        out.url = str(resp.url)
+        out.headers = CaseInsensitiveDict({k: v for k, v in resp.headers.items()})
+        out._content = raw or b""
+        out.encoding = get_encoding_from_headers(out.headers)
+        return out
+
+    @staticmethod
+    async def _close_stale(session: Any, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # 前のループのセッション（コネクタ/keep-alive 接続）を閉じる。閉じずに差し替えると接続が漏れ
+        # "Unclosed client session" 警告になる。前のループが別スレッドで動いていればそのループ上で閉じる
+        try:
+            if loop is not None and loop.is_running() and not loop.is_closed():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                await session.close()
+        except Exception:
+            log.debug("failed to close stale aiohttp session", exc_info=True)
+
+    async def close(self) -> None:
+        session = self._session
+        self._session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except Exception:
+            log.debug("failed to close aiohttp session", exc_info=True)
@@ -0,0 +1,141 @@
+# src/browser_page_pool.py
+"""
+get_page_info のブラウザ経路で使うページ（タブ）プール。
+
+- 毎回 new_page/close すると短いページ予算（既定7秒）の中でタブ生成のオーバーヘッドが目立つため、
+  使い終わったページは about:blank に戻して再利用する
+- プールのサイズが同時にブラウザ操作できるページ数の上限を兼ねる（従来の BROWSER_CONCURRENCY セマフォ相当）
+- start() で size 枚のページを先に作っておき、最初の取得でタブ生成を待たない（作れなかった分は acquire 時に作る）
+- 複数の BrowserContext を渡すと、新規ページはコンテキストへ順番に割り振る
+- 取得待ち時間（wait）を数え、stats() で取り出せる
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Sequence
+
+log = logging.getLogger(__name__)
+
+
+class BrowserPagePool:
+    def __init__(self, contexts: Sequence[Any], size: int = 1, reset_timeout_ms: int = 1500) -> None:
+        if not contexts:
+            raise ValueError("BrowserPagePool requires at least one context")
+        self.contexts: List[Any] = list(contexts)
+        self.size = max(1, int(size))
+        self.reset_timeout_ms = max(100, int(reset_timeout_ms))
+        self._sem = asyncio.Semaphore(self.size)
+        self._idle: List[Any] = []
+        self._all: List[Any] = []
+        self._next_context = 0
+        self._closed = False
+        self.acquires = 0
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    async def start(self) -> None:
+        """
+        size 枚のページを先に作って空きページにしておく。失敗した分は諦め、acquire 時の生成に任せる。
+        """
+        while len(self._all) < self.size and not self._closed:
+            try:
+                page = await self._new_page()
+            except Exception:
+                log.debug("page pre-create failed; creating on demand", exc_info=True)
+                return
+            self._idle.append(page)
+
+    async def _new_page(self) -> Any:
+        context = self.contexts[self._next_context % len(self.contexts)]
+        self._next_context += 1
+        page = await context.new_page()
+        self._all.append(page)
+        self.created += 1
+        return page
+
+    async def acquire(self) -> Any:
+        """
+        空きページを返す（無ければ作る）。プールが埋まっている間は release まで待つ。
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPagePool is closed")
+        started = time.monotonic()
+        await self._sem.acquire()
+        wait_ms = (time.monotonic() - started) * 1000
+        self.acquires += 1
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        try:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.is_closed():
+                    self.reused += 1
+                    return page
+                self._forget(page)
+            return await self._new_page()
+        except Exception:
+            self._sem.release()
+            raise
+
+    async def release(self, page: Any, *, reusable: bool = True) -> None:
+        """
+        ページを返却する。reusable=False（タイムアウト/例外後など）や about:blank への遷移失敗時は閉じて捨てる。
+        """
+        try:
+            if reusable and not self._closed and not page.is_closed():
+                try:
+                    await page.goto("about:blank", timeout=self.reset_timeout_ms)
+                    self._idle.append(page)
+                    return
+                except Exception:
+                    log.debug("page reset failed; discarding", exc_info=True)
+            await self._discard(page)
+        finally:
+            self._sem.release()
+
+    async def _discard(self, page: Any) -> None:
+        self.discarded += 1
+        self._forget(page)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
+
+    def _forget(self, page: Any) -> None:
+        try:
+            self._all.remove(page)
+        except ValueError:
+            pass
+
+    async def close(self) -> None:
+        """
+        プールが持つページを全て閉じる（コンテキスト自体は呼び出し側が閉じる）。
+        """
+        self._closed = True
+        pages, self._all, self._idle = self._all, [], []
+        for page in pages:
+            try:
+                if not page.is_closed():
+                    await page.close()
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "contexts": len(self.contexts),
+            "pages": len(self._all),
+            "idle": len(self._idle),
+            "acquires": self.acquires,
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "wait_ms_avg": round(self.wait_ms_total / self.acquires, 1) if self.acquires else 0.0,
+            "wait_ms_max": round(self.wait_ms_max, 1),
+        }
@@ -0,0 +1,204 @@
+# src/canonical_origin_map.py
+"""
+ホストの正規オリジン（http→https, apex→www 等）の学習マップ。
+
+_fetch_http_info / get_page_info はリダイレクト後の URL で _rewrite_to_www_preserve_path を判定し、
+パスが落ちた場合は www+元パスで2回目の GET を出す。同じサイトの次のリンクでも毎回同じリダイレクトを辿るため、
+一度観測した「元オリジン → 正規オリジン」を覚えて、取得前に URL を書き換える。
+
+- 学習するのは同一サイト内の正規化だけ（ホストが同じ / www の有無だけが違う）。別ドメインへの転送は覚えない
+- パスが保たれたリダイレクト（または www+元パスでの再試行成功）のときだけ学習する
+- 1行1オリジン: origin,canonical,last_ts。learn/forget は印を付けるだけで、書き出しは会社の区切りで flush_async()
+  （ファイルの読み直し/書き直しはワーカースレッド）。書き出し前に他 shard の行をマージする
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+def _origin(url: str) -> Tuple[str, str, str]:
+    """(scheme, host, origin) を返す。解釈できなければ空文字列。"""
+    try:
+        parsed = urllib.parse.urlparse(url)
+    except Exception:
+        return "", "", ""
+    scheme = (parsed.scheme or "").lower()
+    netloc = (parsed.netloc or "").lower()
+    if scheme not in ("http", "https") or not netloc or "@" in netloc:
+        return "", "", ""
+    return scheme, netloc.split(":")[0], f"{scheme}://{netloc}"
+
+
+def _same_site(host_a: str, host_b: str) -> bool:
+    strip = lambda h: h[4:] if h.startswith("www.") else h  # noqa: E731
+    return bool(host_a) and strip(host_a) == strip(host_b)
+
+
+def _same_path(url_a: str, url_b: str) -> bool:
+    try:
+        a = urllib.parse.urlparse(url_a)
+        b = urllib.parse.urlparse(url_b)
+    except Exception:
+        return False
+    return (a.path or "/").rstrip("/") == (b.path or "/").rstrip("/")
+
+
+class CanonicalOriginMap:
+    def __init__(self, path: str = "", *, ttl_sec: int = 30 * 24 * 3600) -> None:
+        self.path = (path or "").strip()
+        self.ttl_sec = max(0, int(ttl_sec))
+        self.origins: Dict[str, Dict[str, object]] = {}
+        self.rewrites = 0
+        self._dirty = False
+        self._removed: set[str] = set()
+        self.load()
+
+    def _read_file(self) -> Dict[str, Dict[str, object]]:
+        out: Dict[str, Dict[str, object]] = {}
+        if not self.path or not os.path.exists(self.path):
+            return out
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = [p.strip() for p in line.strip().split(",")]
+                if len(parts) < 3 or not parts[0] or not parts[1]:
+                    continue
+                try:
+                    out[parts[0]] = {"canonical": parts[1], "last_ts": int(float(parts[2]))}
+                except Exception:
+                    continue
+        return out
+
+    def _merge(self, other: Dict[str, Dict[str, object]]) -> None:
+        for origin, meta in other.items():
+            cur = self.origins.get(origin)
+            if cur is None or int(meta["last_ts"]) > int(cur["last_ts"]):
+                self.origins[origin] = dict(meta)
+
+    def _expired(self, meta: Dict[str, object]) -> bool:
+        return self.ttl_sec > 0 and int(time.time()) - int(meta.get("last_ts", 0)) > self.ttl_sec
+
+    def load(self) -> None:
+        try:
+            self._merge(self._read_file())
+        except Exception:
+            log.warning("failed to load canonical origins", exc_info=True)
+
+    def canonical_origin(self, url: str) -> Optional[str]:
+        _, _, origin = _origin(url)
+        meta = self.origins.get(origin) if origin else None
+        if not meta:
+            return None
+        if self._expired(meta):
+            self.origins.pop(origin, None)
+            return None
+        return str(meta["canonical"])
+
+    def rewrite(self, url: str) -> str:
+        """学習済みなら正規オリジンに差し替えた URL を返す（パス/クエリはそのまま）。"""
+        canonical = self.canonical_origin(url)
+        if not canonical:
+            return url
+        try:
+            parsed = urllib.parse.urlparse(url)
+            target = urllib.parse.urlparse(canonical)
+            rewritten = urllib.parse.urlunparse(parsed._replace(scheme=target.scheme, netloc=target.netloc))
+        except Exception:
+            return url
+        if rewritten != url:
+            self.rewrites += 1
+        return rewritten
+
+    def learn(self, requested_url: str, final_url: str, *, path_checked: bool = False) -> bool:
+        """
+        requested_url → final_url のリダイレクトから正規オリジンを学習する。
+        path_checked=True は「www+元パスでの再試行が成功した」等、呼び出し側でパス維持を確認済みの場合。
+        """
+        _, req_host, req_origin = _origin(requested_url)
+        _, fin_host, fin_origin = _origin(final_url)
+        if not req_origin or not fin_origin or req_origin == fin_origin:
+            return False
+        if not _same_site(req_host, fin_host):
+            return False
+        if not path_checked and not _same_path(requested_url, final_url):
+            return False
+        now_ts = int(time.time())
+        cur = self.origins.get(req_origin)
+        changed = cur is None or cur.get("canonical") != fin_origin
+        self.origins[req_origin] = {"canonical": fin_origin, "last_ts": now_ts}
+        self._removed.discard(req_origin)
+        # 正規オリジン自身が古い別マッピングを持っていたら消す（A→B と B→A のループ防止）
+        if self.origins.pop(fin_origin, None) is not None:
+            self._removed.add(fin_origin)
+            changed = True
+        if changed:
+            self._dirty = True
+            log.info("[canonical] %s -> %s", req_origin, fin_origin)
+        return changed
+
+    def forget(self, url: str) -> None:
+        """書き換え先での取得に失敗したときなど、学習結果を捨てる。"""
+        _, _, origin = _origin(url)
+        if origin and self.origins.pop(origin, None) is not None:
+            self._removed.add(origin)
+            self._dirty = True
+
+    def _write(self, origins: Dict[str, Dict[str, object]], removed: set[str]) -> Dict[str, Dict[str, object]]:
+        """
+        origins（呼び出し時点の写し）に他 shard の行を足してファイルを書き直し、取り込んだ他 shard の行を返す。
+        自分が変更/削除した行はファイル側より優先する。
+        """
+        others = {
+            origin: meta
+            for origin, meta in self._read_file().items()
+            if origin not in origins and origin not in removed
+        }
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for origin, meta in sorted({**origins, **others}.items()):
+                if self._expired(meta):
+                    continue
+                f.write(f"{origin},{meta['canonical']},{int(meta['last_ts'])}\n")
+        os.replace(tmp_path, self.path)
+        return others
+
+    def _snapshot(self) -> Optional[Tuple[Dict[str, Dict[str, object]], set[str]]]:
+        if not self.path or not self._dirty:
+            return None
+        self._dirty = False
+        return {origin: dict(meta) for origin, meta in self.origins.items()}, set(self._removed)
+
+    def _merge_others(self, others: Dict[str, Dict[str, object]]) -> None:
+        for origin, meta in others.items():
+            if origin not in self.origins and origin not in self._removed:
+                self.origins[origin] = meta
+
+    def flush(self) -> None:
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return
+        try:
+            self._merge_others(self._write(*snapshot))
+        except Exception:
+            self._dirty = True
+            log.debug("failed to persist canonical origins", exc_info=True)
+
+    async def flush_async(self) -> None:
+        """flush() のファイル読み書きをワーカースレッドで行う（メモリ上のマップは写しを渡すので並行して更新してよい）。"""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return
+        try:
+            others = await asyncio.to_thread(self._write, *snapshot)
+        except Exception:
+            self._dirty = True
+            log.debug("failed to persist canonical origins", exc_info=True)
+            return
+        self._merge_others(others)
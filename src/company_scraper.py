@@ -1,6 +1,7 @@
 # src/company_scraper.py
 import re, urllib.parse, json, os, time, logging, ssl, hashlib
 import asyncio
+import contextlib
 import unicodedata
 from collections import deque
 from typing import List, Dict, Any, Optional, Iterable
@@ -13,9 +14,39 @@ from playwright.async_api import (
     async_playwright, Browser, BrowserContext, Page,
     TimeoutError as PlaywrightTimeoutError, Route
 )
-import io
 
 from .site_validator import extract_name_signals, score_name_match
+from .async_http import (
+    AsyncHttpClient,
+    BODY_SKIPPED_VALIDATOR,
+    BodyLimit,
+    aiohttp_available,
+    read_limited_sync,
+)
+from .page_disk_cache import PageDiskCache, SOURCE_HTTP, SOURCE_PAGE
+from .page_memory_cache import PageMemoryCache
+from .browser_page_pool import BrowserPagePool
+from .process_rss import chromium_root_pids, pids_tree_rss_bytes
+from .render_mode_registry import MODE_BROWSER, MODE_HTTP, RenderModeRegistry
+from .host_health_store import HostHealthStore
+from .host_limiter import HostLimiter
+from .canonical_origin_map import CanonicalOriginMap
+from .screenshot_profile import ScreenshotProfile
+from .pdf_extractor import PdfTextExtractor, extract_pdf_text
+from .cpu_stage import CpuStage
+from .search_result_cache import SearchResultCache
+from .domain_guess import guess_domain_origins, parse_tlds
+from .fetch_archive import FetchArchive
+from .parsed_page import HtmlLike, ParsedPage, as_parsed_page, html_of
+from .html_backend import make_soup
+from .keyword_matcher import KeywordMatcher, KeywordTagger
+from .search_engine_health import (
+    OUTCOME_CHALLENGE,
+    OUTCOME_ERROR,
+    OUTCOME_OK,
+    OUTCOME_RATE_LIMITED,
+    SearchEngineHealth,
+)
 
 try:
     from pykakasi import kakasi as _kakasi_constructor
@@ -455,6 +486,7 @@ class CompanyScraper:
         # 企業DBまとめ系（公式ではない）
         "founded-today.com",
     ]
+    EXCLUDE_DOMAINS_MATCHER = KeywordMatcher(EXCLUDE_DOMAINS)
 
     PRIORITY_PATHS = [
         *PROFILE_PRIORITY_PATHS,
@@ -607,12 +639,14 @@ class CompanyScraper:
         "recipe", "cooking", "food", "gourmet", "kitchen", "steak", "bbq", "grill",
         "university", "blog", "press", "news",
     }
+    NON_OFFICIAL_MATCHER = KeywordMatcher(sorted(NON_OFFICIAL_KEYWORDS))
 
     NON_OFFICIAL_SNIPPET_KEYWORDS = (
         "口コミ", "求人", "求人情報", "転職", "派遣", "予約", "地図", "アクセスマップ",
         "リストス", "上場区分", "企業情報サイト", "まとめ", "一覧", "ランキング", "プラン",
         "sales promotion", "booking", "reservation", "hotel", "travel", "camp",
     )
+    NON_OFFICIAL_SNIPPET_MATCHER = KeywordMatcher(NON_OFFICIAL_SNIPPET_KEYWORDS)
     # 企業DB/ディレクトリ系の強いシグナル（URLパス＋本文）
     CORPORATE_NUMBER_RE = re.compile(r"(?<!\d)\d{13}(?!\d)")
     DIRECTORY_URL_PATTERNS = (
@@ -658,6 +692,7 @@ class CompanyScraper:
         "この企業情報は",
         "掲載している企業",
     )
+    DIRECTORY_TEXT_MATCHER = KeywordMatcher(DIRECTORY_TEXT_KEYWORDS_STRONG, ignore_case=True)
     DIRECTORY_TEXT_PATTERNS = (
         re.compile(r"(企業|会社).{0,6}(一覧|検索|データベース|db)", re.IGNORECASE),
         re.compile(r"(掲載|登録).{0,8}(企業|会社)", re.IGNORECASE),
@@ -666,6 +701,22 @@ class CompanyScraper:
         "代表取締役", "代表理事", "代表者", "社長", "会長", "理事長", "学長",
         "園長", "校長", "院長", "組合長", "議長", "知事", "市長", "区長", "町長", "村長",
     )
+    EXEC_TITLE_MATCHER = KeywordMatcher(EXEC_TITLE_KEYWORDS)
+    # 電話番号の前後文脈 → 部署/本社タグ（extract_candidates の _phone_context_tags。規則の順がタグの順）
+    PHONE_CONTEXT_TAGGER = KeywordTagger(
+        (
+            # 優先: 本社/代表/管理系
+            ("HQ", ("本社", "本店", "本部", "本社所在地", "本店所在地")),
+            ("REP", ("代表電話", "代表番号", "代表TEL", "代表", "代表取締役")),
+            ("SOUMU", ("総務",)),
+            ("KEIRI", ("経理",)),
+            ("ADMIN", ("管理", "管理部", "管理本部")),
+            # 低優先/避けたい: 拠点/採用/サポート等
+            ("BRANCH", ("支店", "営業所", "出張所", "事業所", "工場", "倉庫", "物流センター", "センター", "店舗")),
+            ("RECRUIT", ("採用", "求人", "リクルート", "応募", "エントリー")),
+            ("SUPPORT", ("サポート", "カスタマー", "コールセンター", "ヘルプデスク")),
+        )
+    )
 
     CORP_SUFFIXES = [
         "株式会社", "（株）", "(株)", "有限会社", "合同会社", "合名会社", "合資会社",
@@ -713,12 +764,110 @@ class CompanyScraper:
         self.slow_hosts_path = os.getenv("SLOW_HOSTS_PATH", "logs/slow_hosts.txt")
         self.slow_host_ttl_sec = int(os.getenv("SLOW_HOST_TTL_SEC", str(7 * 24 * 3600)))
         self.slow_host_hits = max(1, int(os.getenv("SLOW_HOST_HITS", "2")))
-        self.page_cache: Dict[str, Dict[str, Any]] = {}
+        # slow host は SQLite の共有ストアで shard 間に即時共有する（SLOW_HOSTS_STORE=file で従来のテキストファイル）
+        self.host_health: HostHealthStore | None = None
+        if os.getenv("SLOW_HOSTS_STORE", "sqlite").lower() == "sqlite":
+            try:
+                self.host_health = HostHealthStore(
+                    os.getenv("HOST_HEALTH_DB_PATH", "logs/host_health.sqlite3"),
+                    ttl_sec=self.slow_host_ttl_sec,
+                )
+            except Exception:
+                log.warning("host health store unavailable -> fallback to slow_hosts file", exc_info=True)
+        # リダイレクトで学習した正規オリジン（http→https, apex→www）。取得前に URL を書き換えて往復を省く
+        self.canonical_origins: CanonicalOriginMap | None = None
+        if os.getenv("CANONICAL_ORIGIN_ENABLED", "true").lower() == "true":
+            self.canonical_origins = CanonicalOriginMap(
+                os.getenv("CANONICAL_ORIGINS_PATH", "logs/canonical_origins.txt"),
+                ttl_sec=int(os.getenv("CANONICAL_ORIGIN_TTL_SEC", str(30 * 24 * 3600))),
+            )
+        # 他 shard の slow host はバックグラウンドタスクで SLOW_HOSTS_REFRESH_SEC ごとに取り込む（0 なら会社の区切りごと）
+        self.slow_hosts_refresh_sec = max(0.0, float(os.getenv("SLOW_HOSTS_REFRESH_SEC", "5")))
+        self._slow_hosts_refreshed_at = 0.0
+        # 前回の取り込み開始時刻（次回はこれ以降に記録された行だけ読む）。0 なら全件
+        self._slow_hosts_cursor = 0
+        self._slow_hosts_refresh_task: asyncio.Task | None = None
+        # 遅延観測/レイテンシはメモリに貯め、flush_host_health でまとめて to_thread で書く
+        self._pending_slow: List[tuple[str, float, bool, int]] = []
+        self._host_latency: Dict[str, List[float]] = {}
+        # ホストごとに「HTTPで足りる / ブラウザ必須」を記憶し、HTTP→ブラウザの二度取りや不要なブラウザ起動を避ける
+        self.render_modes: RenderModeRegistry | None = None
+        if os.getenv("RENDER_MODE_MEMORY_ENABLED", "true").lower() == "true":
+            self.render_modes = RenderModeRegistry(
+                os.getenv("RENDER_MODES_PATH", "logs/render_modes.txt"),
+                min_hits=max(1, int(os.getenv("RENDER_MODE_MIN_HITS", "2"))),
+                ttl_sec=int(os.getenv("RENDER_MODE_TTL_SEC", str(14 * 24 * 3600))),
+            )
+        # プロセス内ページキャッシュ（バイト上限付きLRU。スクショは別予算で保持）
+        self.page_cache = PageMemoryCache.from_mb(
+            float(os.getenv("PAGE_CACHE_MAX_MB", "256")),
+            float(os.getenv("PAGE_CACHE_SCREENSHOT_MAX_MB", "64")),
+            max_parsed=int(os.getenv("PAGE_PARSED_CACHE_SIZE", "8")),
+        )
+        self.page_cache_stats_every = max(0, int(os.getenv("PAGE_CACHE_STATS_EVERY", "20")))
+        self._companies_done = 0
+        # shard/セカンドパス/再実行/スクリプト間で共有するディスクキャッシュ（既定OFF）
+        self.page_disk_cache: Optional[PageDiskCache] = None
+        if os.getenv("PAGE_DISK_CACHE_ENABLED", "false").lower() == "true":
+            try:
+                self.page_disk_cache = PageDiskCache(
+                    os.getenv("PAGE_DISK_CACHE_PATH", "data/page_cache.sqlite3"),
+                    ttl_sec=int(os.getenv("PAGE_DISK_CACHE_TTL_SEC", str(3 * 24 * 3600))),
+                    max_bytes=int(float(os.getenv("PAGE_DISK_CACHE_MAX_MB", "1024")) * 1024 * 1024),
+                )
+            except Exception:
+                log.warning("page disk cache disabled (init failed)", exc_info=True)
+                self.page_disk_cache = None
         self.use_http_first = os.getenv("USE_HTTP_FIRST", "true").lower() == "true"
         self.http_timeout_ms = int(os.getenv("HTTP_TIMEOUT_MS", "6000"))
         self.search_cache: Dict[tuple[str, str], List[str]] = {}
+        self._search_inflight: Dict[tuple[str, str], "asyncio.Future[List[str]]"] = {}
+        # 検索結果（エンジン×正規化クエリ→抽出URL）の永続キャッシュ。既定は companies DB と同じディレクトリ（既定OFF）
+        self.search_disk_cache: Optional[SearchResultCache] = None
+        if os.getenv("SEARCH_DISK_CACHE_ENABLED", "false").lower() == "true":
+            default_search_cache_path = os.path.join(
+                os.path.dirname(os.getenv("COMPANIES_DB_PATH", "data/companies.db")) or ".",
+                "search_cache.sqlite3",
+            )
+            try:
+                self.search_disk_cache = SearchResultCache(
+                    os.getenv("SEARCH_DISK_CACHE_PATH", default_search_cache_path),
+                    ttl_sec=int(os.getenv("SEARCH_DISK_CACHE_TTL_SEC", str(14 * 24 * 3600))),
+                )
+                self.search_disk_cache.evict()
+            except Exception:
+                log.warning("search disk cache disabled (init failed)", exc_info=True)
+                self.search_disk_cache = None
         # 共有 HTTP セッションでコネクションを再利用し、検索/HTTP取得のレイテンシを抑える
         self.http_session: Optional[requests.Session] = requests.Session()
+        # HTTP取得エンジン（HTTP_ENGINE=aiohttp|requests。既定は aiohttp が入っていれば aiohttp）
+        # requests はスレッド経由（asyncio.to_thread）になるため、高並列時は aiohttp の方がスループットが出る。
+        raw_engine = (os.getenv("HTTP_ENGINE", "auto") or "auto").strip().lower()
+        if raw_engine in {"auto", "aiohttp", "async"} and aiohttp_available():
+            self.http_engine = "aiohttp"
+        else:
+            if raw_engine in {"aiohttp", "async"}:
+                log.warning("HTTP_ENGINE=%s but aiohttp is not installed -> fallback to requests", raw_engine)
+            self.http_engine = "requests"
+        self.http_max_connections = max(1, int(os.getenv("HTTP_MAX_CONNECTIONS", "100")))
+        self.http_max_per_host = max(1, int(os.getenv("HTTP_MAX_PER_HOST", "8")))
+        self.http_keepalive_sec = float(os.getenv("HTTP_KEEPALIVE_SEC", "30"))
+        self._async_http: Optional[AsyncHttpClient] = None
+        # ページ本文のストリーミング取得（先頭で種別判定し、HTML/PDF以外は読み捨て・上限超過は打ち切り）
+        self.http_stream_enabled = os.getenv("HTTP_STREAM_ENABLED", "true").lower() == "true"
+        self.http_body_limit = BodyLimit(
+            max_bytes=int(os.getenv("HTTP_MAX_BODY_BYTES", "2000000")),
+            max_pdf_bytes=int(os.getenv("HTTP_MAX_PDF_BYTES", "8000000")),
+        )
+        # PDF のテキスト抽出（pypdf）は別プロセスで行う。ページ/バイト上限・1文書タイムアウト・内容ハッシュのキャッシュ付き
+        self.pdf_extractor = PdfTextExtractor(
+            max_workers=max(0, int(os.getenv("PDF_EXTRACT_WORKERS", "2"))),
+            max_pages=max(0, int(os.getenv("PDF_EXTRACT_MAX_PAGES", "30"))),
+            max_bytes=max(0, int(os.getenv("PDF_EXTRACT_MAX_BYTES", str(self.http_body_limit.max_pdf_bytes)))),
+            timeout_sec=float(os.getenv("PDF_EXTRACT_TIMEOUT_SEC", "20")),
+            cache_size=max(0, int(os.getenv("PDF_EXTRACT_CACHE_SIZE", "256"))),
+        )
+        self._worker_warmup_task: asyncio.Task | None = None
         # 検索エンジン（環境変数 SEARCH_ENGINES=startpage,bing 等で指定。既定は startpage）
         raw_engines = os.getenv("SEARCH_ENGINES", "startpage")
         engines: list[str] = []
@@ -742,11 +891,96 @@ class CompanyScraper:
             self.search_engine_timeout_sec = 12.0
         if self.search_engine_timeout_sec <= 0:
             self.search_engine_timeout_sec = 0.0
+        # 検索の並列ファンアウト: クエリ×エンジンを同時に投げ、エンジンごとの同時数は SEARCH_FANOUT_PER_ENGINE に抑える。
+        # 候補の採用順は逐次モードと同じ（クエリ順→エンジン順→順位）なので、結果は完了順に依存しない
+        self.search_fanout_enabled = os.getenv("SEARCH_FANOUT_ENABLED", "false").lower() == "true"
+        self.search_fanout_per_engine = max(1, int(os.getenv("SEARCH_FANOUT_PER_ENGINE", "2")))
+        self._search_engine_sems: Dict[str, asyncio.Semaphore] = {}
+        self._search_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        # 検索エンジンの健全性（レイテンシ/チャレンジ率/429率）とサーキットブレーカー。
+        # SEARCH_ENGINE_HEALTH_DB_PATH を指定すると worker 間で共有する（run_sharded.sh は既定で指定）
+        self.search_engine_health: Optional[SearchEngineHealth] = None
+        self.search_engine_adaptive_order = os.getenv("SEARCH_ENGINE_ADAPTIVE_ORDER", "true").lower() == "true"
+        if os.getenv("SEARCH_ENGINE_HEALTH_ENABLED", "true").lower() == "true":
+            try:
+                self.search_engine_health = SearchEngineHealth(
+                    os.getenv("SEARCH_ENGINE_HEALTH_DB_PATH", ""),
+                    worker_id=os.getenv("WORKER_ID", ""),
+                    failure_threshold=max(1, int(os.getenv("SEARCH_CIRCUIT_FAILURES", "3"))),
+                    open_sec=float(os.getenv("SEARCH_CIRCUIT_OPEN_SEC", "120")),
+                    max_open_sec=float(os.getenv("SEARCH_CIRCUIT_MAX_OPEN_SEC", "1800")),
+                    refresh_sec=float(os.getenv("SEARCH_ENGINE_HEALTH_REFRESH_SEC", "5")),
+                )
+            except Exception:
+                # 共有ストアが使えなくてもプロセス内のサーキットブレーカーは動かす
+                log.warning("search engine health store disabled (init failed)", exc_info=True)
+                self.search_engine_health = SearchEngineHealth("")
+        # 検索前のドメイン推測: 社名トークン+TLD の候補を並列に確認し、社名が一致すれば検索エンジンを使わずに公式判定へ進む
+        self.domain_guess_enabled = os.getenv("DOMAIN_GUESS_ENABLED", "false").lower() == "true"
+        self.domain_guess_tlds = parse_tlds(os.getenv("DOMAIN_GUESS_TLDS", ".co.jp,.jp,.com"))
+        self.domain_guess_max_tokens = max(1, int(os.getenv("DOMAIN_GUESS_MAX_TOKENS", "2")))
+        self.domain_guess_max_probes = max(1, int(os.getenv("DOMAIN_GUESS_MAX_PROBES", "6")))
+        self.domain_guess_timeout_ms = max(500, int(os.getenv("DOMAIN_GUESS_TIMEOUT_MS", "5000")))
+        self.domain_guess_dns_timeout_sec = max(0.1, float(os.getenv("DOMAIN_GUESS_DNS_TIMEOUT_SEC", "2")))
+        self.domain_guess_min_name_ratio = float(os.getenv("DOMAIN_GUESS_MIN_NAME_RATIO", "0.85"))
+        self.domain_guess_stats = {"companies": 0, "candidates": 0, "fetched": 0, "hits": 0}
+        self.domain_guess_cache: Dict[tuple[str, str], List[str]] = {}
         # 代表者は構造化ソース（テーブル/ラベル/JSON-LD）のみ許可するか
         self.rep_strict_sources = os.getenv("REP_STRICT_SOURCES", "true").lower() == "true"
         # ブラウザ操作専用セマフォ（HTTPとは別枠で制御し渋滞を防ぐ）
         self.browser_concurrency = max(1, int(os.getenv("BROWSER_CONCURRENCY", "1")))
         self._browser_sem: asyncio.Semaphore | None = None
+        # 全取得経路（HTTP/ブラウザ/検索）共通のホスト単位の同時実行数・取得レート制限
+        self.host_limiter: HostLimiter | None = None
+        if os.getenv("HOST_LIMITER_ENABLED", "true").lower() == "true":
+            self.host_limiter = HostLimiter(
+                max_in_flight=int(os.getenv("HOST_MAX_IN_FLIGHT", "2")),
+                rate_per_sec=float(os.getenv("HOST_RATE_PER_SEC", "4")),
+                burst=max(1, int(os.getenv("HOST_BURST", "4"))),
+            )
+        # ページ（タブ）プール: 使い終わったページを about:blank に戻して再利用する。
+        # プールサイズが同時ブラウザ操作数の上限を兼ねる（既定は BROWSER_CONCURRENCY と同じ）
+        self.page_pool_enabled = os.getenv("BROWSER_PAGE_POOL_ENABLED", "true").lower() == "true"
+        self.page_pool_size = max(1, int(os.getenv("BROWSER_PAGE_POOL_SIZE", str(self.browser_concurrency))))
+        # プールのページを複数の BrowserContext に分散する（1コンテキストへの集中を避ける）
+        self.browser_contexts_count = max(1, int(os.getenv("BROWSER_CONTEXTS", "1")))
+        self._extra_contexts: list[BrowserContext] = []
+        self._page_pool: BrowserPagePool | None = None
+        # 共有ブラウザ（scripts/browser_server.py）の CDP エンドポイント。空ならプロセスごとに Chromium を起動する
+        self.browser_cdp_url = (os.getenv("BROWSER_CDP_URL", "") or "").strip()
+        # HTTP で取得済みの HTML をブラウザへそのまま渡して描画する（本体HTMLの二重取得を避ける）
+        self.browser_reuse_http_html = os.getenv("BROWSER_REUSE_HTTP_HTML", "true").lower() == "true"
+        self._browser_shared = False
+        # 自分で起動した Chromium 本体の pid（RSS 判定はこの配下だけを測る。CDP 接続時は空）
+        self._browser_pids: set[int] = set()
+        # 長時間運転での Chromium のメモリ肥大/劣化対策: ページ数 or RSS が閾値を超えたら会社の切れ目で作り直す（0で無効）
+        self.browser_recycle_pages = max(0, int(os.getenv("BROWSER_RECYCLE_PAGES", "300")))
+        self.browser_recycle_rss_mb = max(0, int(os.getenv("BROWSER_RECYCLE_RSS_MB", "2048")))
+        self.browser_pages_since_recycle = 0
+        self.browser_recycles = 0
+        self.browser_recycle_reasons: Dict[str, int] = {}
+        # AI 判定用スクショ: 高さ上限/縮小/JPEG・WebP/要素切り出し（page_cache のメモリと AI 送信量を抑える）
+        self.screenshot_profile = ScreenshotProfile.build(
+            image_format=os.getenv("SCREENSHOT_FORMAT", "jpeg"),
+            quality=int(os.getenv("SCREENSHOT_QUALITY", "60")),
+            max_height=int(os.getenv("SCREENSHOT_MAX_HEIGHT", "4000")),
+            scale=float(os.getenv("SCREENSHOT_SCALE", "1.0")),
+            crop_selectors=os.getenv("SCREENSHOT_CROP_SELECTORS", ""),
+        )
+        self.screenshot_crops = 0
+        # HTML 解析（本文クリーニング/候補抽出/ページ種別/ディレクトリ判定）を別プロセスで行う（0で無効＝従来どおりループ上で処理）
+        cpu_stage_workers = max(0, int(os.getenv("CPU_STAGE_WORKERS", "0")))
+        self.cpu_stage: CpuStage | None = None
+        if cpu_stage_workers > 0:
+            self.cpu_stage = CpuStage(
+                workers=cpu_stage_workers,
+                min_chars=max(0, int(os.getenv("CPU_STAGE_MIN_CHARS", "20000"))),
+                rep_strict_sources=self.rep_strict_sources,
+            )
+        # 検索応答/ページ取得の記録・再生（FETCH_ARCHIVE_MODE=record|replay。既定は無効）
+        self.fetch_archive: FetchArchive | None = FetchArchive.from_env()
+        if self.fetch_archive is not None:
+            self.fetch_archive.install(self)
         self._load_slow_hosts()
 
     @staticmethod
@@ -813,6 +1047,40 @@ class CompanyScraper:
         except Exception:
             return url
 
+    async def _disk_cache_get(self, cache_key: str, *, sources: tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        if self.page_disk_cache is None or not cache_key:
+            return None
+        try:
+            return await asyncio.to_thread(self.page_disk_cache.get, cache_key, sources=sources)
+        except Exception:
+            log.debug("page disk cache read failed: %s", cache_key, exc_info=True)
+            return None
+
+    async def _disk_cache_put(self, cache_key: str, html: str, text: str, source: str) -> None:
+        if self.page_disk_cache is None or not cache_key:
+            return
+        try:
+            await asyncio.to_thread(self.page_disk_cache.put, cache_key, html=html, text=text, source=source)
+        except Exception:
+            log.debug("page disk cache write failed: %s", cache_key, exc_info=True)
+
+    async def _search_disk_cache_get(self, engine: str, query: str) -> Optional[List[str]]:
+        if self.search_disk_cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.search_disk_cache.get, engine, query)
+        except Exception:
+            log.debug("search disk cache get failed", exc_info=True)
+            return None
+
+    async def _search_disk_cache_put(self, engine: str, query: str, urls: List[str]) -> None:
+        if self.search_disk_cache is None or not urls:
+            return
+        try:
+            await asyncio.to_thread(self.search_disk_cache.put, engine, query, urls)
+        except Exception:
+            log.debug("search disk cache put failed", exc_info=True)
+
     @staticmethod
     def _looks_js_heavy_template(html: str, text: str) -> bool:
         if not html:
@@ -839,6 +1107,18 @@ class CompanyScraper:
             return True
         return False
 
+    def _get_search_engine_sem(self, engine: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._search_sem_loop is not loop:
+            # Semaphore はイベントループに紐づくため、ループが変わったら作り直す
+            self._search_engine_sems = {}
+            self._search_sem_loop = loop
+        sem = self._search_engine_sems.get(engine)
+        if sem is None:
+            sem = asyncio.Semaphore(self.search_fanout_per_engine)
+            self._search_engine_sems[engine] = sem
+        return sem
+
     def _get_browser_sem(self) -> asyncio.Semaphore:
         if self._browser_sem is None:
             self._browser_sem = asyncio.Semaphore(self.browser_concurrency)
@@ -852,6 +1132,101 @@ class CompanyScraper:
             return self.http_session.get(url, **kwargs)
         return requests.get(url, **kwargs)
 
+    def _get_async_http(self) -> AsyncHttpClient:
+        if self._async_http is None:
+            self._async_http = AsyncHttpClient(
+                limit=self.http_max_connections,
+                limit_per_host=self.http_max_per_host,
+                keepalive_timeout=self.http_keepalive_sec,
+            )
+        return self._async_http
+
+    def _session_get_limited(
+        self,
+        url: str,
+        body_limit: Optional[BodyLimit],
+        skip_body_if: Any = None,
+        **kwargs: Any,
+    ):
+        resp = self._session_get(url, stream=True, **kwargs)
+        return read_limited_sync(resp, body_limit or BodyLimit(max_bytes=0, max_pdf_bytes=0), skip_body_if)
+
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, url: str):
+        """
+        url のホストへの取得枠を確保する（HostLimiter）。待った ms を返す。
+        呼び出し側は待ち時間を slow host 判定の経過時間から除くこと（順番待ちで遅いホスト扱いしない）。
+        """
+        if self.host_limiter is None:
+            yield 0.0
+            return
+        try:
+            host = (urllib.parse.urlparse(url).netloc or "").lower().split(":")[0]
+        except Exception:
+            host = ""
+        async with self.host_limiter.slot(host) as wait_ms:
+            yield wait_ms
+
+    def log_host_limiter_stats(self) -> None:
+        if self.host_limiter is None:
+            return
+        stats = self.host_limiter.stats()
+        log.info(
+            "[host_limiter] hosts=%d in_flight=%d acquires=%d waited=%d wait_ms_avg=%.1f wait_ms_max=%.1f in_flight_max=%d",
+            stats["hosts"],
+            stats["in_flight"],
+            stats["acquires"],
+            stats["waited"],
+            stats["wait_ms_avg"],
+            stats["wait_ms_max"],
+            stats["in_flight_max"],
+        )
+
+    def log_pdf_extractor_stats(self) -> None:
+        stats = self.pdf_extractor.stats()
+        if not (stats["extracted"] or stats["cache_hits"] or stats["skipped_large"]):
+            return
+        log.info(
+            "[pdf] extracted=%d cache_hits=%d cache_entries=%d skipped_large=%d timeouts=%d failures=%d retries=%d",
+            stats["extracted"],
+            stats["cache_hits"],
+            stats["cache_entries"],
+            stats["skipped_large"],
+            stats["timeouts"],
+            stats["failures"],
+            stats["retries"],
+        )
+
+    async def _session_get_async(
+        self,
+        url: str,
+        *,
+        body_limit: Optional[BodyLimit] = None,
+        skip_body_if: Any = None,
+        host_limited: bool = True,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        HTTP GET の非同期入口。戻り値は requests.Response 互換。
+        - HTTP_ENGINE=aiohttp: イベントループ上で直接取得（ホスト単位の接続プール/keep-alive）
+        - HTTP_ENGINE=requests: 従来どおり _session_get をスレッドで実行
+        - body_limit 指定時はストリーミングで読み、body_kind/body_truncated/body_aborted を付与する
+        - skip_body_if(status, headers) が True ならヘッダだけで本文を読まずに返す
+        - host_limited=True ならホスト単位の取得枠（_host_slot）の中で取得する。呼び出し側で枠を取る場合は False
+        """
+        if host_limited and self.host_limiter is not None:
+            async with self._host_slot(url):
+                return await self._session_get_async(
+                    url, body_limit=body_limit, skip_body_if=skip_body_if, host_limited=False, **kwargs
+                )
+        if self.http_engine == "aiohttp":
+            return await self._get_async_http().get(
+                url, body_limit=body_limit, skip_body_if=skip_body_if, **kwargs
+            )
+        if body_limit is not None or skip_body_if is not None:
+            return await asyncio.to_thread(self._session_get_limited, url, body_limit, skip_body_if, **kwargs)
+        return await asyncio.to_thread(self._session_get, url, **kwargs)
+
     @staticmethod
     def _rewrite_to_www_preserve_path(original_url: str, final_url: str) -> str:
         """
@@ -985,7 +1360,7 @@ class CompanyScraper:
         if not label:
             return False
         normalized = unicodedata.normalize("NFKC", label)
-        return any(keyword in normalized for keyword in cls.EXEC_TITLE_KEYWORDS)
+        return cls.EXEC_TITLE_MATCHER.search(normalized)
 
     @classmethod
     def _romanize(cls, text: str) -> str:
@@ -1959,7 +2334,7 @@ class CompanyScraper:
                 break
 
         lowered = host_no_port + path_lower
-        if any(kw in lowered for kw in self.NON_OFFICIAL_KEYWORDS):
+        if self.NON_OFFICIAL_MATCHER.search(lowered):
             score -= 3
         return score
 
@@ -1986,7 +2361,7 @@ class CompanyScraper:
 
     def _is_excluded(self, url: str) -> bool:
         lowered = (url or "").lower()
-        if any(ex in lowered for ex in self.EXCLUDE_DOMAINS):
+        if self.EXCLUDE_DOMAINS_MATCHER.search(lowered):
             return True
         # fetch前に企業DB/ディレクトリ臭が強いURLを弾く（多少の未取得は許容、誤爆回避優先）
         try:
@@ -2048,34 +2423,14 @@ class CompanyScraper:
         return href
 
     @staticmethod
-    def _extract_pdf_text(raw: bytes) -> str:
+    def _extract_pdf_text(raw: bytes, max_pages: int = 0) -> str:
         """
-        PDF(bytes)からテキスト抽出（pypdf が利用可能な場合のみ）。
+        PDF(bytes)からテキスト抽出（pypdf が利用可能な場合のみ）。同期版（取得経路では pdf_extractor を使う）。
         - 失敗時は空文字（システム全体を落とさない）
         """
-        if not raw:
-            return ""
         if _PdfReader is None:
             return ""
-        try:
-            reader = _PdfReader(io.BytesIO(raw))
-        except Exception:
-            return ""
-        texts: list[str] = []
-        try:
-            for page in getattr(reader, "pages", []) or []:
-                try:
-                    t = page.extract_text() or ""
-                except Exception:
-                    t = ""
-                if t:
-                    texts.append(t)
-        except Exception:
-            return ""
-        joined = "\n".join(texts)
-        joined = unicodedata.normalize("NFKC", joined)
-        joined = re.sub(r"\s+", " ", joined).strip()
-        return joined
+        return extract_pdf_text(raw, max_pages)
 
     def _is_ddg_challenge(self, html: str) -> bool:
         if not html:
@@ -2097,6 +2452,29 @@ class CompanyScraper:
             and ("are you human" in lowered or "verify you are human" in lowered or "robot" in lowered)
         ) or "captcha-delivery.com" in lowered
 
+    def _search_engine_open(self, engine: str) -> bool:
+        return self.search_engine_health is not None and self.search_engine_health.is_open(engine)
+
+    def _note_search_outcome(self, engine: str, outcome: Any, started: Optional[float] = None) -> None:
+        """
+        検索リクエスト1回分の結果を健全性トラッカーへ記録する。outcome は OUTCOME_* か HTTP ステータス。
+        """
+        if self.search_engine_health is None:
+            return
+        if isinstance(outcome, int):
+            outcome = OUTCOME_RATE_LIMITED if outcome == 429 else OUTCOME_ERROR
+        latency_ms = (time.monotonic() - started) * 1000 if started is not None else 0.0
+        self.search_engine_health.record(engine, outcome, latency_ms)
+
+    def _ordered_search_engines(self) -> list[str]:
+        engines = self.search_engines or ["startpage"]
+        if self.search_engine_health is None or not self.search_engine_adaptive_order or len(engines) <= 1:
+            return list(engines)
+        ordered = self.search_engine_health.order(engines)
+        if ordered != list(engines):
+            log.info("[search_health] engine order %s -> %s", engines, ordered)
+        return ordered
+
     async def _fetch_startpage_via_proxy(self, query: str) -> str:
         """
         StartpageがBot対策/JS構成で通常取得できない場合の退避経路。
@@ -2104,8 +2482,7 @@ class CompanyScraper:
         """
         try:
             proxy_url = "https://r.jina.ai/https://www.startpage.com/sp/search"
-            resp = await asyncio.to_thread(
-                self._session_get,
+            resp = await self._session_get_async(
                 proxy_url,
                 params={"query": query, "cat": "web", "language": "japanese"},
                 headers={"User-Agent": "Mozilla/5.0"},
@@ -2129,24 +2506,31 @@ class CompanyScraper:
         )
         for attempt in range(3):
             for endpoint, params in endpoint_params:
+                if self._search_engine_open("startpage"):
+                    # サーキットが開いている（チャレンジ/429 が続いている）間は再試行の梯子を登らずプロキシへ
+                    return await self._fetch_startpage_via_proxy(query)
+                started = time.monotonic()
                 try:
-                    resp = await asyncio.to_thread(
-                        self._session_get,
+                    resp = await self._session_get_async(
                         endpoint,
                         params=params,
                         headers=headers,
                         timeout=(5, 30),
                     )
                     if resp.status_code in (429, 500, 502, 503, 504):
+                        self._note_search_outcome("startpage", resp.status_code)
                         continue
                     resp.raise_for_status()
                     text = resp.text or ""
                     if self._is_startpage_challenge(text):
                         log.info("[search] startpage challenge detected endpoint=%s", endpoint)
+                        self._note_search_outcome("startpage", OUTCOME_CHALLENGE)
                         continue
                     if text:
+                        self._note_search_outcome("startpage", OUTCOME_OK, started)
                         return text
                 except Exception:
+                    self._note_search_outcome("startpage", OUTCOME_ERROR)
                     continue
             if attempt < 2:
                 await asyncio.sleep(0.8 * (2 ** attempt))
@@ -2155,8 +2539,7 @@ class CompanyScraper:
     async def _fetch_duckduckgo_via_proxy(self, query: str) -> str:
         try:
             proxy_url = "https://r.jina.ai/https://duckduckgo.com/html/"
-            resp = await asyncio.to_thread(
-                self._session_get,
+            resp = await self._session_get_async(
                 proxy_url,
                 params={"q": query, "kl": "jp-jp"},
                 headers={"User-Agent": "Mozilla/5.0"},
@@ -2168,7 +2551,7 @@ class CompanyScraper:
             return ""
 
     def _extract_search_urls(self, html: str) -> Iterable[str]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         anchors = soup.select("a.result__a")
         if anchors:
             for a in anchors:
@@ -2186,7 +2569,7 @@ class CompanyScraper:
             yield cleaned
 
     def _extract_startpage_urls(self, html: str) -> Iterable[str]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         seen_cleaned: set[str] = set()
         selectors = (
             "a.w-gl__result-title",
@@ -2225,7 +2608,7 @@ class CompanyScraper:
             yield cleaned
 
     def _extract_bing_urls(self, html: str) -> Iterable[str]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         for block in soup.select("li.b_algo h2 a"):
             href = block.get("href")
             if not href:
@@ -2262,27 +2645,33 @@ class CompanyScraper:
             "Referer": "https://duckduckgo.com/",
         }
         for attempt in range(3):
+            if self._search_engine_open("ddg"):
+                return await self._fetch_duckduckgo_via_proxy(query)
+            started = time.monotonic()
             try:
-                resp = await asyncio.to_thread(
-                    self._session_get,
+                resp = await self._session_get_async(
                     "https://html.duckduckgo.com/html",
                     params={"q": query, "kl": "jp-jp"},
                     headers=headers,
                     timeout=(3, 10),
                 )
                 if resp.status_code in (429, 500, 502, 503, 504):
+                    self._note_search_outcome("ddg", resp.status_code)
                     await asyncio.sleep(0.8 * (2 ** attempt))
                     continue
                 resp.raise_for_status()
                 text = resp.text
                 if self._is_ddg_challenge(text):
+                    self._note_search_outcome("ddg", OUTCOME_CHALLENGE)
                     proxy_html = await self._fetch_duckduckgo_via_proxy(query)
                     if proxy_html:
                         return proxy_html
                     await asyncio.sleep(0.8 * (2 ** attempt))
                     continue
+                self._note_search_outcome("ddg", OUTCOME_OK, started)
                 return text
             except Exception:
+                self._note_search_outcome("ddg", OUTCOME_ERROR)
                 if attempt == 1:
                     return await self._fetch_duckduckgo_via_proxy(query)
                 await asyncio.sleep(0.8 * (2 ** attempt))
@@ -2296,25 +2685,50 @@ class CompanyScraper:
         }
         params = {"q": query, "setlang": "ja", "mkt": "ja-JP"}
         for attempt in range(3):
+            if self._search_engine_open("bing"):
+                return ""
+            started = time.monotonic()
             try:
-                resp = await asyncio.to_thread(
-                    self._session_get,
+                resp = await self._session_get_async(
                     "https://www.bing.com/search",
                     params=params,
                     headers=headers,
                     timeout=(5, 30),
                 )
                 if resp.status_code in (429, 500, 502, 503, 504):
+                    self._note_search_outcome("bing", resp.status_code)
                     await asyncio.sleep(0.8 * (2 ** attempt))
                     continue
                 resp.raise_for_status()
+                self._note_search_outcome("bing", OUTCOME_OK, started)
                 return resp.text
             except Exception:
+                self._note_search_outcome("bing", OUTCOME_ERROR)
                 if attempt == 2:
                     return ""
                 await asyncio.sleep(0.8 * (2 ** attempt))
         return ""
 
+    @classmethod
+    def for_analysis(cls, *, rep_strict_sources: bool = True) -> "CompanyScraper":
+        """
+        解析メソッド（CpuStage.TASKS）だけを使うインスタンス（CpuStage のワーカー用）。
+        __init__ は Playwright/HTTP セッション/永続ストアを準備するため通さない。解析メソッドが参照する
+        インスタンス属性は rep_strict_sources と page_cache だけで、ここで __init__ と同じ意味の値を持たせる
+        （属性を増やしたらここにも足す。tests/test_cpu_stage.py が全タスクを突き合わせる）。
+        """
+        inst = object.__new__(cls)
+        inst.rep_strict_sources = bool(rep_strict_sources)
+        # ワーカーには毎回別の HTML が届くので、ParsedPage は共有せず都度作る
+        inst.page_cache = PageMemoryCache(max_bytes=0, max_screenshot_bytes=0, max_parsed=0)
+        return inst
+
+    def _parsed_page(self, html: HtmlLike) -> ParsedPage:
+        """同じ HTML の ParsedPage を page_cache 経由で共有する。"""
+        if isinstance(html, ParsedPage):
+            return html
+        return self.page_cache.parsed(html or "")
+
     def _page_hints(self, page: Optional[Dict[str, Any]]) -> tuple[str, str]:
         if isinstance(page, dict):
             return str(page.get("text") or ""), str(page.get("html") or "")
@@ -2345,11 +2759,16 @@ class CompanyScraper:
         return "\n".join(lines).strip()
 
     @classmethod
-    def _clean_text_from_html(cls, html: str, fallback_text: str = "") -> str:
+    def _clean_text_from_html(cls, html: HtmlLike, fallback_text: str = "") -> str:
+        if isinstance(html, ParsedPage):
+            # 共有 soup は壊せない（ここでは decompose する）ので、結果だけをページ単位で覚える
+            page = html
+            cleaned = page.memo("clean_text", lambda: cls._clean_text_from_html(page.html))
+            return cleaned or cls._filter_noise_lines(fallback_text or "")
         if not html:
             return cls._filter_noise_lines(fallback_text or "")
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html)
         except Exception:
             # BeautifulSoup が落ちる/壊れたHTMLのとき、raw HTML をそのまま流すと
             # <div...> 等の断片が住所に混入しやすいので、雑にタグを落としてから通す。
@@ -2415,24 +2834,27 @@ class CompanyScraper:
         return text or cls._filter_noise_lines(fallback_text or "")
 
     @staticmethod
-    def _meta_strings(html: str) -> str:
-        if not html:
+    def _meta_strings(html: HtmlLike) -> str:
+        page = as_parsed_page(html)
+        if not page:
             return ""
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-        except Exception:
-            return ""
-        hints: List[str] = []
-        title = soup.title.string if soup.title and soup.title.string else ""
-        if title:
-            hints.append(title)
-        for attr in ("description", "keywords", "og:site_name", "og:title"):
-            node = soup.find("meta", attrs={"name": attr}) or soup.find("meta", attrs={"property": attr})
-            if node:
-                content = node.get("content")
-                if content:
-                    hints.append(content)
-        return " \n".join(hints)
+
+        def _build() -> str:
+            soup = page.soup
+            if soup is None:
+                return ""
+            hints: List[str] = []
+            if page.title:
+                hints.append(page.title)
+            for attr in ("description", "keywords", "og:site_name", "og:title"):
+                node = soup.find("meta", attrs={"name": attr}) or soup.find("meta", attrs={"property": attr})
+                if node:
+                    content = node.get("content")
+                    if content:
+                        hints.append(content)
+            return " \n".join(hints)
+
+        return page.memo("meta_strings", _build)
 
     @staticmethod
     def _safe_json_loads(candidate: str) -> Optional[Any]:
@@ -2444,12 +2866,15 @@ class CompanyScraper:
             return None
 
     @classmethod
-    def _extract_jsonld_objects(cls, html: str) -> List[Dict[str, Any]]:
-        if not html:
+    def _extract_jsonld_objects(cls, html: HtmlLike) -> List[Dict[str, Any]]:
+        page = as_parsed_page(html)
+        if not page:
             return []
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-        except Exception:
+        return list(page.memo("jsonld", lambda: cls._jsonld_objects_from_soup(page.soup)))
+
+    @classmethod
+    def _jsonld_objects_from_soup(cls, soup: Optional[BeautifulSoup]) -> List[Dict[str, Any]]:
+        if soup is None:
             return []
         out: List[Dict[str, Any]] = []
         for node in soup.find_all("script", attrs={"type": lambda v: v and "ld+json" in str(v).lower()}):
@@ -2479,7 +2904,7 @@ class CompanyScraper:
         url: str,
         *,
         text: str = "",
-        html: str = "",
+        html: HtmlLike = "",
     ) -> Dict[str, Any]:
         """
         企業DB/ディレクトリ系ページを強制除外するための判定。
@@ -2544,17 +2969,11 @@ class CompanyScraper:
 
         sample_text = (text or "")
         if not sample_text and html:
-            try:
-                soup = BeautifulSoup(html, "html.parser")
-                sample_text = soup.get_text(" ", strip=True)
-            except Exception:
-                sample_text = ""
+            sample_text = as_parsed_page(html).text
         t = unicodedata.normalize("NFKC", sample_text)[:7000]
-        t_low = t.lower()
-        for kw in cls.DIRECTORY_TEXT_KEYWORDS_STRONG:
-            if kw.lower() in t_low:
-                score += 2
-                reasons.append(f"text:{kw}")
+        for kw in cls.DIRECTORY_TEXT_MATCHER.ordered_hits(t):
+            score += 2
+            reasons.append(f"text:{kw}")
         for pat in cls.DIRECTORY_TEXT_PATTERNS:
             if pat.search(t):
                 score += 3
@@ -2563,7 +2982,7 @@ class CompanyScraper:
         # 多数の企業リンクがある（/companies/ 等）場合はディレクトリUIとみなす
         if html:
             try:
-                hits = len(re.findall(r"href=[\"'][^\"']*(?:/companies/|/company/|/detail/)\d+", html, flags=re.I))
+                hits = len(re.findall(r"href=[\"'][^\"']*(?:/companies/|/company/|/detail/)\d+", html_of(html), flags=re.I))
             except Exception:
                 hits = 0
             if hits >= 4:
@@ -2582,7 +3001,7 @@ class CompanyScraper:
         company_name: str,
         *,
         url: str,
-        html: str,
+        html: HtmlLike,
     ) -> Dict[str, Any]:
         """
         ドメイン一致より「公式らしさの根拠」を重視するための加点。
@@ -2595,9 +3014,9 @@ class CompanyScraper:
         name_variants = [v for v in (full_name, norm_name) if v]
         if not html:
             return {"official_evidence_score": 0, "official_evidence": []}
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-        except Exception:
+        page = as_parsed_page(html)
+        soup = page.soup
+        if soup is None:
             return {"official_evidence_score": 0, "official_evidence": []}
 
         def _name_hit(s: str) -> float:
@@ -2611,8 +3030,7 @@ class CompanyScraper:
                 best = max(best, SequenceMatcher(None, nv, s).ratio())
             return best
 
-        title = soup.title.string if soup.title and soup.title.string else ""
-        title_ratio = _name_hit(title)
+        title_ratio = _name_hit(page.title)
         if title_ratio >= 0.92:
             score += 3
             evidence.append("title")
@@ -2646,7 +3064,7 @@ class CompanyScraper:
             evidence.append("og:site_name")
 
         # JSON-LD Organization
-        jsonld_objs = cls._extract_jsonld_objects(html)
+        jsonld_objs = cls._extract_jsonld_objects(page)
         org_matched = False
         org_has_addr = False
         org_has_tel = False
@@ -2679,17 +3097,14 @@ class CompanyScraper:
                 break
 
         # 同一ドメイン内の「会社概要/お問い合わせ/アクセス」リンク
-        try:
-            links = soup.find_all("a", href=True)
-        except Exception:
-            links = []
+        links = page.anchors
         if links:
             got_profile = False
             got_contact = False
             got_access = False
-            for a in links:
-                href = (a.get("href") or "").strip()
-                text = (a.get_text(" ", strip=True) or "").strip()
+            for raw_href, anchor_text, _, _ in links:
+                href = (raw_href or "").strip()
+                text = (anchor_text or "").strip()
                 blob = f"{href} {text}".lower()
                 if not got_profile and any(k in blob for k in ("会社概要", "企業情報", "会社情報", "about", "corporate", "profile", "overview")):
                     got_profile = True
@@ -2876,17 +3291,18 @@ class CompanyScraper:
 
         norm_name = self._normalize_company_name(company_name)
         text_snippet, html = self._page_hints(page_info)
-        directory = self._detect_directory_like(url, text=text_snippet or "", html=html or "")
+        parsed_page = self._parsed_page(html)
+        directory = self._detect_directory_like(url, text=text_snippet or "", html=parsed_page)
         directory_like = bool(directory.get("is_directory_like"))
         directory_score = int(directory.get("directory_score") or 0)
         directory_reasons = directory.get("directory_reasons") or []
-        evidence = self._compute_official_evidence(company_name, url=url, html=html or "")
+        evidence = self._compute_official_evidence(company_name, url=url, html=parsed_page)
         official_evidence_score = int(evidence.get("official_evidence_score") or 0)
         official_evidence = evidence.get("official_evidence") or []
-        meta_snippet = self._meta_strings(html)
+        meta_snippet = self._meta_strings(parsed_page)
         combined = f"{text_snippet}\n{meta_snippet}".strip()
         lowered = combined.lower()
-        signals = extract_name_signals(html or "", text_snippet or "")
+        signals = extract_name_signals(parsed_page, text_snippet or "")
         name_match = score_name_match(company_name or "", signals)
         entity_tags = self._detect_entity_tags(company_name)
         def _entity_suffix_hit(tag: str) -> bool:
@@ -2917,9 +3333,9 @@ class CompanyScraper:
             score += 2
         if "公式" in combined or "official" in lowered:
             score += 2
-        if any(kw in lowered for kw in self.NON_OFFICIAL_SNIPPET_KEYWORDS):
+        if self.NON_OFFICIAL_SNIPPET_MATCHER.search(lowered):
             score -= 2
-        if any(kw in host for kw in self.NON_OFFICIAL_KEYWORDS):
+        if self.NON_OFFICIAL_MATCHER.search(host):
             score -= 3
 
         # タイトル/h1/og:site_name/body冒頭の一致度（部分一致だけは除外寄りにする）
@@ -3376,10 +3792,7 @@ class CompanyScraper:
         if isinstance(page_info, dict):
             html = page_info.get("html") or ""
         if html:
-            try:
-                soup = BeautifulSoup(html, "html.parser")
-            except Exception:
-                soup = None
+            soup = as_parsed_page(html).soup
             if soup:
                 canonical = soup.find("link", rel=lambda v: v and "canonical" in v.lower())
                 if canonical and canonical.get("href"):
@@ -3443,16 +3856,42 @@ class CompanyScraper:
         if self.browser:
             return
         self._pw = await async_playwright().start()
-        self.browser = await self._pw.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",  # sandbox無しで起動（制限環境での立ち上げ失敗を防ぐ）
-                "--disable-dev-shm-usage",  # /dev/shm不足でのクラッシュ回避
-                "--single-process",  # 制限コンテナでのfork失敗対策
-            ],
-        )
-        self.context = await self.browser.new_context(
+        self.browser = None
+        self._browser_shared = False
+        if self.browser_cdp_url:
+            # scripts/browser_server.py で起動した共有 Chromium に接続し、コンテキストだけ自前で持つ
+            try:
+                self.browser = await self._pw.chromium.connect_over_cdp(self.browser_cdp_url, timeout=10000)
+                self._browser_shared = True
+                log.info("[browser] connected to shared browser %s", self.browser_cdp_url)
+            except Exception:
+                log.warning(
+                    "[browser] shared browser connect failed (%s) -> launch local",
+                    self.browser_cdp_url,
+                    exc_info=True,
+                )
+        if self.browser is None:
+            chromium_before = await asyncio.to_thread(chromium_root_pids)
+            self.browser = await self._pw.chromium.launch(
+                headless=self.headless,
+                args=[
+                    "--no-sandbox",
+                    "--disable-setuid-sandbox",  # sandbox無しで起動（制限環境での立ち上げ失敗を防ぐ）
+                    "--disable-dev-shm-usage",  # /dev/shm不足でのクラッシュ回避
+                    "--single-process",  # 制限コンテナでのfork失敗対策
+                ],
+            )
+            self._browser_pids = await asyncio.to_thread(chromium_root_pids) - chromium_before
+        self.context = await self._new_browser_context()
+        self._extra_contexts = []
+        if self.page_pool_enabled:
+            for _ in range(min(self.browser_contexts_count, self.page_pool_size) - 1):
+                self._extra_contexts.append(await self._new_browser_context())
+            self._page_pool = BrowserPagePool([self.context, *self._extra_contexts], size=self.page_pool_size)
+            await self._page_pool.start()
+
+    async def _new_browser_context(self) -> BrowserContext:
+        context = await self.browser.new_context(
             locale="ja-JP",
             user_agent=(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -3461,34 +3900,286 @@ class CompanyScraper:
             ),
         )
         # 軽量化：画像/フォント/メディア/スタイルをブロック
-        await self.context.route("**/*", self._handle_route)
+        await context.route("**/*", self._handle_route)
+        return context
+
+    @contextlib.asynccontextmanager
+    async def _browser_page(self):
+        """
+        ブラウザ操作用のページを借りる。プール有効時は再利用し、無効時は従来どおり毎回作って閉じる。
+        ブロック内で例外が出たページは再利用せず捨てる。
+        """
+        self.browser_pages_since_recycle += 1
+        pool = self._page_pool
+        if pool is None:
+            async with self._get_browser_sem():
+                page = await self.context.new_page()
+                try:
+                    yield page
+                finally:
+                    await page.close()
+            return
+        page = await pool.acquire()
+        ok = False
+        try:
+            yield page
+            ok = True
+        finally:
+            await pool.release(page, reusable=ok)
+
+    @contextlib.asynccontextmanager
+    async def _serve_prefetched_html(self, page: Page, url: str, html: str):
+        """
+        ブロック内の最初のトップレベル document リクエストに、取得済み HTML を返す（route.fulfill）。
+        URL/オリジンは元のままなので相対パスや JS は通常どおり動き、サブリソースだけがネットワークへ出る。
+        HTML は str で持っているため charset=utf-8 を明示する（HTTPヘッダの charset は meta より優先される）。
+        """
+        target_key = self._cache_key_url(url)
+        served = False
+
+        def _matches(request_url: str) -> bool:
+            return not served and self._cache_key_url(request_url) == target_key
+
+        async def _handler(route: Route) -> None:
+            nonlocal served
+            request = route.request
+            if not served and request.resource_type == "document" and request.frame.parent_frame is None:
+                served = True
+                await route.fulfill(status=200, content_type="text/html; charset=utf-8", body=html)
+                return
+            await route.fallback()
+
+        await page.route(_matches, _handler)
+        try:
+            yield
+        finally:
+            try:
+                await page.unroute(_matches, _handler)
+            except Exception:
+                pass
+
+    async def _capture_screenshot(self, page: Page, timeout_ms: int) -> bytes:
+        """
+        screenshot_profile に従ってスクショを撮る。
+        - crop_selectors の要素が見つかればその要素だけ（会社概要テーブル/フッター等）
+        - それ以外は full_page を max_height で上から切る（clip はページ外が自動で切り詰められる）
+        """
+        profile = self.screenshot_profile
+        options: Dict[str, Any] = dict(profile.capture_options())
+        options["scale"] = "css"
+        data = b""
+        for selector in profile.crop_selectors:
+            try:
+                locator = page.locator(selector).first
+                if await locator.count() <= 0:
+                    continue
+                data = await locator.screenshot(timeout=timeout_ms, **options)
+                if data:
+                    self.screenshot_crops += 1
+                    break
+            except Exception:
+                data = b""
+        if not data:
+            if profile.max_height > 0:
+                width = int((page.viewport_size or {}).get("width") or 1366)
+                options["clip"] = {"x": 0, "y": 0, "width": width, "height": profile.max_height}
+            data = await page.screenshot(full_page=True, timeout=timeout_ms, **options)
+        if profile.needs_postprocess:
+            data = await asyncio.to_thread(profile.postprocess, data)
+        return data or b""
 
     async def close(self):
+        if self.render_modes is not None:
+            self.render_modes.flush()
+        if self.canonical_origins is not None:
+            await self.canonical_origins.flush_async()
+        if self.search_engine_health is not None:
+            await self.search_engine_health.aclose()
+        if self._slow_hosts_refresh_task is not None:
+            self._slow_hosts_refresh_task.cancel()
+            self._slow_hosts_refresh_task = None
+        if self._worker_warmup_task is not None:
+            self._worker_warmup_task.cancel()
+            self._worker_warmup_task = None
+        await self.flush_host_health()
+        try:
+            await self._close_browser()
+        finally:
+            if self.http_session:
+                try:
+                    self.http_session.close()
+                except Exception:
+                    pass
+            if self._async_http is not None:
+                await self._async_http.close()
+            self.http_session = None
+            self.pdf_extractor.close()
+            if self.cpu_stage is not None:
+                self.cpu_stage.close()
+
+    async def warm_worker_pools(self) -> None:
+        """別プロセスのワーカー（PDF 抽出 / CpuStage）を先に起動しておく。起動時間は各処理のタイムアウトに含めない。"""
+        await self.pdf_extractor.warm()
+        if self.cpu_stage is not None:
+            await self.cpu_stage.warm()
+
+    def start_worker_warmup(self) -> None:
+        """warm_worker_pools をバックグラウンドで始める（起動直後に1回。会社の処理は待たせない）。"""
+        task = self._worker_warmup_task
+        if task is None or task.done():
+            self._worker_warmup_task = asyncio.get_running_loop().create_task(self.warm_worker_pools())
+
+    async def _close_browser(self) -> None:
+        """
+        ページプール/コンテキスト/ブラウザ/Playwright を閉じる（HTTP セッションは残す）。
+        共有ブラウザに接続している場合はブラウザ本体を閉じず、自分のコンテキストだけ閉じて切断する。
+        """
+        pool, self._page_pool = self._page_pool, None
+        if pool is not None:
+            self.log_browser_pool_stats(pool)
+            await pool.close()
+        extra_contexts, self._extra_contexts = self._extra_contexts, []
+        for extra in extra_contexts:
+            try:
+                await extra.close()
+            except Exception:
+                pass
         try:
             if self.context:
                 await self.context.close()
         finally:
             try:
-                if self.browser:
+                if self.browser and not self._browser_shared:
                     await self.browser.close()
             finally:
                 if self._pw:
                     await self._pw.stop()
-        if self.http_session:
-            try:
-                self.http_session.close()
-            except Exception:
-                pass
-        self._pw = None
-        self.browser = None
-        self.context = None
-        self.http_session = None
+                self._pw = None
+                self.browser = None
+                self.context = None
+                self._browser_shared = False
+                self._browser_pids = set()
+
+    def log_page_cache_stats(self) -> None:
+        stats = self.page_cache.stats()
+        log.info(
+            "[page_cache] entries=%d mb=%.1f screenshots=%d screenshot_mb=%.1f hits=%d misses=%d hit_rate=%.3f "
+            "evictions=%d screenshot_evictions=%d parsed_pages=%d parsed_hits=%d parsed_misses=%d",
+            stats["entries"],
+            stats["mb"],
+            stats["screenshots"],
+            stats["screenshot_mb"],
+            stats["hits"],
+            stats["misses"],
+            stats["hit_rate"],
+            stats["evictions"],
+            stats["screenshot_evictions"],
+            stats["parsed_pages"],
+            stats["parsed_hits"],
+            stats["parsed_misses"],
+        )
+
+    def log_browser_pool_stats(self, pool: BrowserPagePool | None = None) -> None:
+        pool = pool or self._page_pool
+        if pool is None:
+            return
+        stats = pool.stats()
+        log.info(
+            "[page_pool] size=%d contexts=%d pages=%d idle=%d acquires=%d created=%d reused=%d discarded=%d "
+            "wait_ms_avg=%.1f wait_ms_max=%.1f",
+            stats["size"],
+            stats["contexts"],
+            stats["pages"],
+            stats["idle"],
+            stats["acquires"],
+            stats["created"],
+            stats["reused"],
+            stats["discarded"],
+            stats["wait_ms_avg"],
+            stats["wait_ms_max"],
+        )
+
+    async def on_company_boundary(self) -> None:
+        """
+        1社の処理が終わって次の会社へ進む直前に呼ぶ（main.process のループ先頭）。
+        会社をまたいで良い後処理（統計ログ等）はここにまとめる。
+        """
+        self._companies_done += 1
+        if self.page_cache_stats_every > 0 and self._companies_done % self.page_cache_stats_every == 0:
+            self.log_page_cache_stats()
+            self.log_browser_pool_stats()
+            self.log_host_limiter_stats()
+            self.log_pdf_extractor_stats()
+            if self.cpu_stage is not None:
+                log.info("[cpu_stage] %s", self.cpu_stage.stats())
+            if self.search_engine_health is not None:
+                log.info("[search_health] %s", self.search_engine_health.snapshot())
+            if self.domain_guess_enabled:
+                log.info("[domain_guess] %s", self.domain_guess_stats)
+        if self.search_engine_health is not None:
+            self.search_engine_health.ensure_refresher()
+            if self.search_engine_health.refresh_sec <= 0:
+                await self.search_engine_health.refresh_async()
+            else:
+                await self.search_engine_health.flush_async()
+        await self.flush_host_health()
+        if self.canonical_origins is not None:
+            await self.canonical_origins.flush_async()
+        self._ensure_slow_hosts_refresher()
+        if self.slow_hosts_refresh_sec <= 0:
+            await self.refresh_slow_hosts(force=True)
+        await self.maybe_recycle_browser()
+
+    def _browser_rss_mb(self) -> float:
+        # 共有ブラウザ（CDP 接続）は自分のプロセスではないので測らない。pid を特定できなかった場合も 0
+        if self._browser_shared or not self._browser_pids:
+            return 0.0
+        return pids_tree_rss_bytes(self._browser_pids) / (1024 * 1024)
+
+    def _browser_recycle_reason(self, rss_mb: float) -> str:
+        if self.browser_recycle_pages > 0 and self.browser_pages_since_recycle >= self.browser_recycle_pages:
+            return "pages"
+        if self.browser_recycle_rss_mb > 0 and rss_mb >= self.browser_recycle_rss_mb:
+            return "rss"
+        return ""
+
+    async def maybe_recycle_browser(self) -> bool:
+        """
+        ブラウザを作り直すべきか判定し、必要なら閉じる（次の get_page_info で遅延起動される）。
+        処理中のページを壊さないよう、on_company_boundary（会社の切れ目）からのみ呼ぶ。
+        """
+        if self.browser is None:
+            return False
+        rss_mb = 0.0
+        if self.browser_recycle_rss_mb > 0 and not self._browser_shared:
+            rss_mb = await asyncio.to_thread(self._browser_rss_mb)
+        reason = self._browser_recycle_reason(rss_mb)
+        if not reason:
+            return False
+        pages = self.browser_pages_since_recycle
+        try:
+            await self._close_browser()
+        except Exception:
+            log.warning("[browser] recycle close failed", exc_info=True)
+        self.browser_pages_since_recycle = 0
+        self.browser_recycles += 1
+        self.browser_recycle_reasons[reason] = self.browser_recycle_reasons.get(reason, 0) + 1
+        log.info(
+            "[browser] recycled (reason=%s pages=%d rss_mb=%.0f) total=%d by_reason=%s",
+            reason,
+            pages,
+            rss_mb,
+            self.browser_recycles,
+            self.browser_recycle_reasons,
+        )
+        return True
 
     async def reset_context(self):
         try:
-            await self.close()
+            await self._close_browser()
         except Exception:
             pass
+        self.browser_pages_since_recycle = 0
         try:
             await self.start()
         except Exception:
@@ -3498,6 +4189,8 @@ class CompanyScraper:
         try:
             path = self.slow_hosts_path
             if not path or not os.path.exists(path):
+                if self.host_health is not None:
+                    self._merge_slow_hosts(self.host_health.slow_hosts_since(0))
                 return
             with open(path, "r", encoding="utf-8") as f:
                 for line in f:
@@ -3529,11 +4222,16 @@ class CompanyScraper:
                     else:
                         self.slow_hosts[host] = {"count": count, "last_ts": ts}
             self._prune_slow_hosts()
+            if self.host_health is not None:
+                # 旧ファイルの内容はストアへ取り込み、以後はストアを正とする
+                self.host_health.merge_slow_counts(self.slow_hosts)
+                self._merge_slow_hosts(self.host_health.slow_hosts_since(0))
+                return
             self._persist_slow_hosts()
         except Exception:
             log.warning("failed to load slow hosts", exc_info=True)
 
-    def _add_slow_host(self, host: str) -> None:
+    def _add_slow_host(self, host: str, elapsed_ms: float = 0.0, timeout: bool = False) -> None:
         if not host:
             return
         now_ts = int(time.time())
@@ -3544,11 +4242,103 @@ class CompanyScraper:
         else:
             self.slow_hosts[host] = {"count": 1, "last_ts": now_ts}
         self._prune_slow_hosts()
+        if self.host_health is not None:
+            # ストアへの UPSERT は flush_host_health でまとめて行う（イベントループ上で sqlite を触らない）
+            self._pending_slow.append((host, float(elapsed_ms or 0.0), bool(timeout), now_ts))
+            return
         try:
             self._persist_slow_hosts()
         except Exception:
             log.debug("failed to persist slow host: %s", host, exc_info=True)
 
+    def _merge_slow_hosts(self, rows: Dict[str, Dict[str, int]]) -> None:
+        for host, meta in rows.items():
+            cur = self.slow_hosts.get(host)
+            if cur is None or int(meta["last_ts"]) > int(cur.get("last_ts", 0)):
+                self.slow_hosts[host] = meta
+            elif int(meta["last_ts"]) == int(cur.get("last_ts", 0)):
+                cur["count"] = max(int(cur.get("count", 1)), int(meta["count"]))
+
+    # 差分取り込みの重なり（秒）。書き込みのコミット遅れや shard 間の時計ずれで取りこぼさないよう少し遡って読む
+    SLOW_HOSTS_REFRESH_OVERLAP_SEC = 60
+
+    async def refresh_slow_hosts(self, force: bool = False) -> None:
+        """
+        共有ストアから他 shard が記録した slow host を取り込む（SELECT は to_thread）。
+        前回の取り込み以降（少し遡る）に記録された行だけを読む。
+        """
+        if self.host_health is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._slow_hosts_refreshed_at < self.slow_hosts_refresh_sec:
+            return
+        self._slow_hosts_refreshed_at = now
+        started_ts = int(time.time())
+        since = max(0, self._slow_hosts_cursor - self.SLOW_HOSTS_REFRESH_OVERLAP_SEC) if self._slow_hosts_cursor else 0
+        try:
+            rows = await asyncio.to_thread(self.host_health.slow_hosts_since, since)
+        except Exception:
+            log.debug("failed to refresh slow hosts", exc_info=True)
+            return
+        self._slow_hosts_cursor = started_ts
+        self._merge_slow_hosts(rows)
+
+    def _ensure_slow_hosts_refresher(self) -> None:
+        if self.host_health is None or self.slow_hosts_refresh_sec <= 0:
+            return
+        task = self._slow_hosts_refresh_task
+        if task is not None and not task.done():
+            return
+        self._slow_hosts_refresh_task = asyncio.get_running_loop().create_task(self._slow_hosts_refresh_loop())
+
+    async def _slow_hosts_refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.slow_hosts_refresh_sec)
+            # 自分の観測を先に書いてから読む（会社の区切りを待たずに他 shard へ共有する）
+            await self._flush_pending_slow()
+            await self.refresh_slow_hosts(force=True)
+
+    def _note_host_latency(self, host: str, elapsed_ms: float) -> None:
+        """取得レイテンシをメモリに貯める（flush_host_health でまとめてストアへ書く）。"""
+        if not host or self.host_health is None:
+            return
+        agg = self._host_latency.get(host)
+        if agg is None:
+            self._host_latency[host] = [1, float(elapsed_ms), float(elapsed_ms)]
+        else:
+            agg[0] += 1
+            agg[1] += float(elapsed_ms)
+            agg[2] = max(agg[2], float(elapsed_ms))
+
+    async def flush_host_health(self) -> None:
+        """貯めた遅延観測とレイテンシをストアへ書く（sqlite はワーカースレッドで触る）。"""
+        if self.host_health is None:
+            return
+        await self._flush_pending_slow()
+        await self.flush_host_latency()
+
+    async def _flush_pending_slow(self) -> None:
+        if self.host_health is None or not self._pending_slow:
+            return
+        # 記録時刻は書き込み時刻にそろえる（他 shard の差分取り込みが前回読んだ時刻以降だけを見るため）
+        now_ts = int(time.time())
+        events = [(host, elapsed_ms, timeout, max(ts, now_ts)) for host, elapsed_ms, timeout, ts in self._pending_slow]
+        self._pending_slow = []
+        try:
+            await asyncio.to_thread(self.host_health.record_slow_many, events)
+        except Exception:
+            log.debug("failed to flush slow hosts", exc_info=True)
+
+    async def flush_host_latency(self) -> None:
+        if self.host_health is None or not self._host_latency:
+            return
+        samples = [(host, int(agg[0]), agg[1], agg[2]) for host, agg in self._host_latency.items()]
+        self._host_latency = {}
+        try:
+            await asyncio.to_thread(self.host_health.add_latencies, samples)
+        except Exception:
+            log.debug("failed to flush host latency", exc_info=True)
+
     def _persist_slow_hosts(self) -> None:
         path = self.slow_hosts_path
         if not path:
@@ -3835,6 +4625,104 @@ class CompanyScraper:
 
         return result
 
+    def _domain_guess_address_hit(self, address: str, text: str) -> bool:
+        """入力住所の都道府県か郵便番号がページ本文に出ているか（同名の別会社のドメインを当たりにしない）。"""
+        if not address or not text:
+            return False
+        body = unicodedata.normalize("NFKC", text)
+        pref = self._extract_prefecture(unicodedata.normalize("NFKC", address))
+        if pref and pref in body:
+            return True
+        postal = self._extract_postal_code(unicodedata.normalize("NFKC", address))
+        return bool(postal and re.search(rf"(?<!\d){postal[:3]}\s*[-‐－ー]?\s*{postal[3:]}(?!\d)", body))
+
+    def _domain_guess_hit(self, company_name: str, url: str, info: Dict[str, Any], address: str = "") -> bool:
+        text = info.get("text", "") or ""
+        html = info.get("html", "") or ""
+        if not text and not html:
+            return False
+        # 駐車ドメイン/ポータルは社名を含んでいても公式ではない
+        if self._detect_directory_like(url, text=text, html=html).get("is_directory_like"):
+            return False
+        # 社名だけでは同名他社（三和/大和 等）と区別できないので、住所の裏付けを必須にする
+        if not self._domain_guess_address_hit(address, text):
+            return False
+        match = score_name_match(company_name or "", extract_name_signals(html, text))
+        if match.ratio >= self.domain_guess_min_name_ratio and not match.partial_only:
+            return True
+        norm_name = self._normalize_company_name(company_name)
+        head = unicodedata.normalize("NFKC", text[:2000])
+        return len(norm_name) >= 3 and norm_name in re.sub(r"[\s　]+", "", head)
+
+    async def guess_official_urls(self, company_name: str, address: str = "") -> List[str]:
+        """
+        社名トークンから推測したドメイン（<token>.co.jp 等）を並列に確認し、社名が一致し、かつ入力住所の都道府県/郵便番号が
+        本文に出ているトップURLを返す。住所が無い会社は推測しない（同名他社と区別できないため）。
+        DNS で引けない候補（裸ドメインも www. も無い）は GET しない。1件も当たらなければ空を返す（呼び出し側は検索へ進む）。
+        当たったページはメモリキャッシュに入れ、公式判定での再取得を省く。結果は社名+住所ごとに覚える（lookahead の先行分を再利用）。
+        """
+        if not self.domain_guess_enabled or not company_name or not (address or "").strip():
+            return []
+        key = (unicodedata.normalize("NFKC", company_name).strip(), self._addr_key(address))
+        if key in self.domain_guess_cache:
+            return list(self.domain_guess_cache[key])
+        origins = guess_domain_origins(
+            self._company_tokens(company_name),
+            self.domain_guess_tlds,
+            max_tokens=self.domain_guess_max_tokens,
+            max_probes=self.domain_guess_max_probes,
+        )
+        if not origins:
+            return []
+        self.domain_guess_stats["companies"] += 1
+        self.domain_guess_stats["candidates"] += len(origins)
+        loop = asyncio.get_running_loop()
+
+        async def _resolves(host: str) -> bool:
+            try:
+                await asyncio.wait_for(loop.getaddrinfo(host, 443), timeout=self.domain_guess_dns_timeout_sec)
+                return True
+            except Exception:
+                return False
+
+        async def _probe(origin: str) -> str:
+            host = urllib.parse.urlparse(origin).netloc
+            target = origin
+            if not await _resolves(host):
+                if not await _resolves(f"www.{host}"):
+                    return ""
+                target = f"https://www.{host}/"
+            self.domain_guess_stats["fetched"] += 1
+            # 推測先の遅さで slow host 判定を汚さない（allow_slow=True）
+            info = await self._fetch_http_info(target, timeout_ms=self.domain_guess_timeout_ms, allow_slow=True)
+            if not self._domain_guess_hit(company_name, target, info, address):
+                return ""
+            cache_key = self._cache_key_url(target)
+            if self.page_cache.get(cache_key) is None:
+                self.page_cache[cache_key] = {
+                    "url": target,
+                    "text": info.get("text", "") or "",
+                    "html": info.get("html", "") or "",
+                    "screenshot": b"",
+                }
+            return target
+
+        results = await asyncio.gather(*(_probe(origin) for origin in origins), return_exceptions=True)
+        hits: List[str] = []
+        for result in results:
+            if isinstance(result, str) and result and result not in hits:
+                hits.append(result)
+        if hits:
+            self.domain_guess_stats["hits"] += 1
+        self.domain_guess_cache[key] = list(hits)
+        log.info(
+            "[domain_guess] company=%s probes=%d hits=%s",
+            company_name,
+            len(origins),
+            hits or "-",
+        )
+        return hits
+
     async def search_company(self, company_name: str, address: str, num_results: int = 3) -> List[str]:
         """
         検索エンジンで検索し、候補URLを返す（会社概要/企業情報/会社情報の固定クエリ）。
@@ -3849,6 +4737,30 @@ class CompanyScraper:
             if debug_search:
                 log.info("[search_debug] cache_hit company=%s count=%d", company_name, len(cached))
             return list(cached)
+        # 同じ会社の検索が進行中（lookahead の先行検索など）なら、その結果に合流する
+        inflight = self._search_inflight.get(key)
+        if inflight is not None and not inflight.done():
+            if debug_search:
+                log.info("[search_debug] join inflight company=%s", company_name)
+            try:
+                return list(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                cancelling = getattr(asyncio.current_task(), "cancelling", None)  # Python 3.11+
+                if not inflight.cancelled() or (cancelling is not None and cancelling()):
+                    raise
+                # 合流先（先行検索）だけが取り消された場合は自分で検索し直す
+        task = asyncio.ensure_future(self._search_company_uncached(company_name, address, num_results, key))
+        self._search_inflight[key] = task
+        try:
+            return list(await task)
+        finally:
+            if self._search_inflight.get(key) is task:
+                self._search_inflight.pop(key, None)
+
+    async def _search_company_uncached(
+        self, company_name: str, address: str, num_results: int, key: tuple[str, str]
+    ) -> List[str]:
+        debug_search = os.getenv("SEARCH_QUERY_DEBUG", "false").lower() == "true"
         queries = self._build_company_queries(company_name, address)
         if not queries:
             return []
@@ -3871,7 +4783,7 @@ class CompanyScraper:
         async def run_queries(qs: list[str]) -> list[Dict[str, Any]]:
             candidates: List[Dict[str, Any]] = []
             seen: set[str] = set()
-            engines = self.search_engines or ["startpage"]
+            engines = self._ordered_search_engines()
 
             async def run_engine(engine: str, q_idx: int, query: str) -> str:
                 if engine == "bing":
@@ -3895,39 +4807,98 @@ class CompanyScraper:
                         return ""
                 return await fetcher(query)
 
-            for q_idx, query in enumerate(qs):
-                for eng in engines:
-                    try:
-                        html = await run_engine(eng, q_idx, query)
-                    except Exception:
-                        continue
-                    if not html:
+            def extract_urls(eng: str, q_idx: int, query: str, html: str) -> list[str]:
+                if not html:
+                    return []
+                if eng == "bing":
+                    extractor = self._extract_bing_urls
+                elif eng == "ddg":
+                    extractor = self._extract_search_urls
+                else:
+                    extractor = self._extract_startpage_urls
+                extracted_urls = list(extractor(html))
+                if debug_search:
+                    log.info(
+                        "[search_debug] company=%s engine=%s qidx=%d extracted=%d query=%s",
+                        company_name,
+                        eng,
+                        q_idx,
+                        len(extracted_urls),
+                        query,
+                    )
+                return extracted_urls
+
+            def merge(eng: str, q_idx: int, extracted_urls: list[str]) -> bool:
+                """候補へ追加し、max_candidates に達したら True。"""
+                for rank, url in enumerate(extracted_urls):
+                    if url in seen:
                         continue
-                    if eng == "bing":
-                        extractor = self._extract_bing_urls
-                    elif eng == "ddg":
-                        extractor = self._extract_search_urls
-                    else:
-                        extractor = self._extract_startpage_urls
-                    extracted_urls = list(extractor(html))
+                    seen.add(url)
+                    candidates.append({"url": url, "query_idx": q_idx, "rank": rank, "engine": eng})
+                    if len(candidates) >= max_candidates:
+                        return True
+                return False
+
+            async def fetch_urls(eng: str, q_idx: int, query: str, *, limited: bool) -> list[str]:
+                cached_urls = await self._search_disk_cache_get(eng, query)
+                if cached_urls is not None:
                     if debug_search:
-                        log.info(
-                            "[search_debug] company=%s engine=%s qidx=%d extracted=%d query=%s",
-                            company_name,
-                            eng,
-                            q_idx,
-                            len(extracted_urls),
-                            query,
-                        )
-                    for rank, url in enumerate(extracted_urls):
-                        if url in seen:
-                            continue
-                        seen.add(url)
-                        candidates.append({"url": url, "query_idx": q_idx, "rank": rank, "engine": eng})
-                        if len(candidates) >= max_candidates:
-                            return candidates
-                if len(candidates) >= max_candidates:
-                    break
+                        log.info("[search_debug] disk_cache_hit engine=%s qidx=%d count=%d", eng, q_idx, len(cached_urls))
+                    return cached_urls
+                try:
+                    if limited:
+                        async with self._get_search_engine_sem(eng):
+                            html = await run_engine(eng, q_idx, query)
+                    else:
+                        html = await run_engine(eng, q_idx, query)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    return []
+                extracted_urls = extract_urls(eng, q_idx, query, html)
+                await self._search_disk_cache_put(eng, query, extracted_urls)
+                return extracted_urls
+
+            if self.search_fanout_enabled and len(qs) * len(engines) > 1:
+                slots = [(q_idx, query, eng) for q_idx, query in enumerate(qs) for eng in engines]
+
+                async def run_slot(slot_idx: int) -> tuple[int, list[str]]:
+                    q_idx, query, eng = slots[slot_idx]
+                    return slot_idx, await fetch_urls(eng, q_idx, query, limited=True)
+
+                tasks = [asyncio.create_task(run_slot(i)) for i in range(len(slots))]
+                done_slots: Dict[int, list[str]] = {}
+                next_slot = 0
+                try:
+                    for fut in asyncio.as_completed(tasks):
+                        slot_idx, extracted_urls = await fut
+                        done_slots[slot_idx] = extracted_urls
+                        # 完了順ではなくスロット順（クエリ順→エンジン順）に取り込み、先頭から埋まった分だけ確定させる
+                        while next_slot in done_slots:
+                            q_idx, _, eng = slots[next_slot]
+                            full = merge(eng, q_idx, done_slots.pop(next_slot))
+                            next_slot += 1
+                            if full:
+                                if debug_search:
+                                    log.info(
+                                        "[search_debug] company=%s fanout early stop slots=%d/%d",
+                                        company_name,
+                                        next_slot,
+                                        len(slots),
+                                    )
+                                return candidates
+                finally:
+                    pending = [t for t in tasks if not t.done()]
+                    for t in pending:
+                        t.cancel()
+                    if pending:
+                        await asyncio.gather(*pending, return_exceptions=True)
+                return candidates
+
+            for q_idx, query in enumerate(qs):
+                for eng in engines:
+                    if merge(eng, q_idx, await fetch_urls(eng, q_idx, query, limited=False)):
+                        return candidates
             return candidates
 
         queries = _unique_queries(queries)
@@ -3974,6 +4945,55 @@ class CompanyScraper:
         s = re.sub(r"\s+", " ", s).strip()
         return s
 
+    @staticmethod
+    def _response_validators(resp: Any) -> Dict[str, Any]:
+        """
+        応答ヘッダから更新判定用の検証子（ETag/Last-Modified/Content-Length）を取り出す。
+        """
+        try:
+            headers = getattr(resp, "headers", None) or {}
+            etag = str(headers.get("ETag") or "").strip()
+            last_modified = str(headers.get("Last-Modified") or "").strip()
+            raw_length = headers.get("Content-Length")
+        except Exception:
+            return {"etag": "", "last_modified": "", "content_length": None}
+        try:
+            content_length = int(raw_length) if raw_length not in (None, "") else None
+        except Exception:
+            content_length = None
+        return {"etag": etag, "last_modified": last_modified, "content_length": content_length}
+
+    @staticmethod
+    def _validators_match(stored: Dict[str, Any], status: int, headers: Any) -> bool:
+        """
+        条件付きGETの応答が「前回から変化なし」を示すか。
+        - 304 は常に一致
+        - 200 でも ETag（弱比較）一致、または Last-Modified 一致（+ Content-Length があれば一致）なら変化なし扱い
+        """
+        if status == 304:
+            return True
+        if status != 200 or not stored:
+            return False
+
+        def _norm_etag(value: Any) -> str:
+            v = str(value or "").strip()
+            return v[2:] if v.startswith("W/") else v
+
+        try:
+            stored_etag = _norm_etag(stored.get("etag"))
+            if stored_etag:
+                return stored_etag == _norm_etag(headers.get("ETag"))
+            stored_lm = str(stored.get("last_modified") or "").strip()
+            if not stored_lm or stored_lm != str(headers.get("Last-Modified") or "").strip():
+                return False
+            stored_len = stored.get("content_length")
+            resp_len = headers.get("Content-Length")
+            if stored_len and resp_len not in (None, ""):
+                return int(stored_len) == int(resp_len)
+            return True
+        except Exception:
+            return False
+
     def compute_homepage_fingerprint(self, html: str, text: str) -> str:
         normalized = self._normalize_for_fingerprint(html, text)
         if not normalized:
@@ -3986,9 +5006,16 @@ class CompanyScraper:
         url: str,
         timeout_ms: int | None = None,
         allow_slow: bool = False,
+        use_disk_cache: bool = True,
+        validators: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         軽量なHTTPリクエストで本文/HTMLのみ取得。失敗時は空を返す。
+        use_disk_cache=False でディスクキャッシュを読まずに必ず取得する（更新チェック用）。
+        validators（前回の etag/last_modified/content_length）を渡すと条件付きGETを行い、
+        304 または検証子一致なら本文を読まずに not_modified=True を返す。
+        取得できた場合は応答の etag/last_modified/content_length も返す。
+        本文が上限で切られた場合は body_truncated=True を付け、ディスクキャッシュには書かない。
         """
         try:
             parsed = urllib.parse.urlparse(url)
@@ -4000,9 +5027,16 @@ class CompanyScraper:
         if host and not whitelist_hit and (host in self.HARD_EXCLUDE_HOSTS or self._is_excluded(host)):
             return {"url": url, "text": "", "html": ""}
         # 公式候補ホストはスキップ対象から除外するため、上位層で呼び分ける
+        # （ディスクキャッシュより先に判定し、キャッシュの有無で slow ホストの扱いが変わらないようにする）
         if host and self.skip_slow_hosts and self._is_slow_host(host) and not allow_slow:
             log.info("[http] skip slow host %s url=%s", host, url)
             return {"url": url, "text": "", "html": ""}
+        disk_key = self._cache_key_url(url) if self.page_disk_cache is not None else ""
+        disk_hit = (
+            await self._disk_cache_get(disk_key, sources=(SOURCE_PAGE, SOURCE_HTTP)) if use_disk_cache else None
+        )
+        if disk_hit:
+            return {"url": url, "text": disk_hit.get("text", ""), "html": disk_hit.get("html", "")}
 
         eff_timeout_ms = self.http_timeout_ms if timeout_ms is None else max(500, int(timeout_ms))
         timeout_sec = max(2, eff_timeout_ms / 1000)
@@ -4012,6 +5046,16 @@ class CompanyScraper:
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "ja,en-US;q=0.9",
         }
+        stored_validators = {k: v for k, v in (validators or {}).items() if v}
+        skip_body_if = None
+        if stored_validators:
+            if stored_validators.get("etag"):
+                headers["If-None-Match"] = str(stored_validators["etag"])
+            if stored_validators.get("last_modified"):
+                headers["If-Modified-Since"] = str(stored_validators["last_modified"])
+
+            def skip_body_if(status: int, resp_headers: Any) -> bool:
+                return self._validators_match(stored_validators, status, resp_headers)
 
         def _is_ssl_error(exc: Exception) -> bool:
             if isinstance(exc, (ssl.SSLError, requests.exceptions.SSLError)):
@@ -4037,40 +5081,82 @@ class CompanyScraper:
             except Exception:
                 return ""
 
+        body_limit = self.http_body_limit if self.http_stream_enabled else None
+
+        host_wait_ms = 0.0
+
         async def _session_get_async(target_url: str):
-            return await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._session_get,
-                    target_url,
-                    timeout=(timeout_sec, timeout_sec),
-                    headers=headers,
-                ),
-                timeout=timeout_sec + 0.5,
-            )
+            nonlocal host_wait_ms
+            # ホスト枠の順番待ちはタイムアウト/slow 判定に含めない
+            async with self._host_slot(target_url) as wait_ms:
+                host_wait_ms += wait_ms
+                return await asyncio.wait_for(
+                    self._session_get_async(
+                        target_url,
+                        timeout=(timeout_sec, timeout_sec),
+                        headers=headers,
+                        body_limit=body_limit,
+                        skip_body_if=skip_body_if,
+                        host_limited=False,
+                    ),
+                    timeout=timeout_sec + 0.5,
+                )
+        # 学習済みの正規オリジンへ先に書き換え、同じリダイレクトを毎回辿らない
+        fetch_url = self.canonical_origins.rewrite(url) if self.canonical_origins is not None else url
         try:
             # requests の timeout は DNS 解決などを完全にはカバーしないことがあるため、
             # asyncio 側でも wait_for で上限を掛け、全体の停滞を防ぐ。
+            ssl_fallback = False
             try:
-                resp = await _session_get_async(url)
+                resp = await _session_get_async(fetch_url)
             except Exception as e:
-                http_alt = _rewrite_https_to_http(url)
+                http_alt = _rewrite_https_to_http(fetch_url)
                 if http_alt and _is_ssl_error(e):
                     resp = await _session_get_async(http_alt)
+                    ssl_fallback = True
                 else:
                     raise
             # リダイレクトでパスが落ちた場合は www+元パスで再試行
             try:
-                alt = self._rewrite_to_www_preserve_path(url, getattr(resp, "url", "") or "")
+                alt = self._rewrite_to_www_preserve_path(fetch_url, getattr(resp, "url", "") or "")
             except Exception:
                 alt = ""
+            alt_ok = False
             if alt:
                 try:
                     resp2 = await _session_get_async(alt)
                     if getattr(resp2, "status_code", 0) and int(resp2.status_code) < 500:
                         resp = resp2
+                        alt_ok = int(resp2.status_code) < 400
                 except Exception:
                     pass
             resp.raise_for_status()
+            # SSL エラーで http に落とした取得は https→http の格下げを学習してしまうので覚えない
+            if self.canonical_origins is not None and not ssl_fallback:
+                if alt_ok:
+                    self.canonical_origins.learn(fetch_url, alt, path_checked=True)
+                else:
+                    self.canonical_origins.learn(fetch_url, getattr(resp, "url", "") or "")
+            aborted = getattr(resp, "body_aborted", "") or ""
+            resp_validators = self._response_validators(resp)
+            status_code = int(getattr(resp, "status_code", 0) or 0)
+            if stored_validators and (status_code == 304 or aborted == BODY_SKIPPED_VALIDATOR):
+                # 304 は検証子を省略することがあるため、欠けた値は前回値で補う
+                merged = {**stored_validators, **{k: v for k, v in resp_validators.items() if v}}
+                log.info("[http] not modified url=%s", url)
+                return {"url": url, "text": "", "html": "", "not_modified": True, **merged}
+            if aborted:
+                # 動画/ZIP/画像や上限超過PDFは本文を読まずに捨てる（帯域/メモリ節約）
+                log.info("[http] skip body (%s) url=%s", aborted, url)
+                return {"url": url, "text": "", "html": ""}
+            # 上限で切った本文は不完全なので、その回の結果としては使うがディスクキャッシュには残さない
+            truncated = bool(getattr(resp, "body_truncated", False))
+            if truncated:
+                log.info(
+                    "[http] body truncated at %d bytes url=%s",
+                    self.http_body_limit.max_bytes,
+                    url,
+                )
             raw = resp.content or b""
             # PDF 等のバイナリは HTML として扱わず、可能ならテキスト抽出する
             try:
@@ -4083,43 +5169,61 @@ class CompanyScraper:
                 or raw.startswith(b"%PDF")
             )
             if is_pdf:
-                text_pdf = self._extract_pdf_text(raw)
-                elapsed_ms = (time.monotonic() - started) * 1000
+                # 抽出時間はホストの遅さではないので、経過時間は抽出前に測る
+                elapsed_ms = (time.monotonic() - started) * 1000 - host_wait_ms
+                text_pdf = await self.pdf_extractor.extract(raw) if _PdfReader is not None else ""
                 if (
                     not allow_slow
                     and self.slow_page_threshold_ms > 0
                     and elapsed_ms > self.slow_page_threshold_ms
                     and host
                 ):
-                    self._add_slow_host(host)
+                    self._add_slow_host(host, elapsed_ms=elapsed_ms)
                     log.info("[http] mark slow host (%.0f ms) %s", elapsed_ms, host)
-                return {"url": url, "text": text_pdf, "html": ""}
+                self._note_host_latency(host, elapsed_ms)
+                info = {"url": url, "text": text_pdf, "html": "", **resp_validators}
+                if truncated:
+                    info["body_truncated"] = True
+                else:
+                    await self._disk_cache_put(disk_key, "", text_pdf, SOURCE_HTTP)
+                return info
             encoding = self._detect_html_encoding(resp, raw)
             decoded = raw.decode(encoding, errors="replace") if raw else ""
             html = decoded or ""
-            text = self._clean_text_from_html(html, fallback_text=decoded or "")
-            elapsed_ms = (time.monotonic() - started) * 1000
+            text = await self.clean_text_from_html_async(html, fallback_text=decoded or "")
+            elapsed_ms = (time.monotonic() - started) * 1000 - host_wait_ms
             if (
                 not allow_slow
                 and self.slow_page_threshold_ms > 0
                 and elapsed_ms > self.slow_page_threshold_ms
                 and host
             ):
-                self._add_slow_host(host)
+                self._add_slow_host(host, elapsed_ms=elapsed_ms)
                 log.info("[http] mark slow host (%.0f ms) %s", elapsed_ms, host)
-            return {"url": url, "text": text, "html": html}
+            self._note_host_latency(host, elapsed_ms)
+            # final_url: 本文を実際に返した URL（リダイレクト/www 再試行の後）。ブラウザへ流用するときの照合用
+            final_url = str(getattr(resp, "url", "") or fetch_url)
+            info = {"url": url, "text": text, "html": html, "final_url": final_url, **resp_validators}
+            if truncated:
+                info["body_truncated"] = True
+            else:
+                await self._disk_cache_put(disk_key, html, text, SOURCE_HTTP)
+            return info
         except Exception as e:
-            elapsed_ms = (time.monotonic() - started) * 1000
+            elapsed_ms = (time.monotonic() - started) * 1000 - host_wait_ms
             if (
                 not allow_slow
                 and self.slow_page_threshold_ms > 0
                 and elapsed_ms > self.slow_page_threshold_ms
                 and host
             ):
-                self._add_slow_host(host)
+                self._add_slow_host(host, elapsed_ms=elapsed_ms, timeout=True)
                 log.warning("[http] timeout/slow (%.0f ms) -> skip host next time: %s", elapsed_ms, host or "")
             if _is_ssl_error(e):
                 log.info("[http] ssl error -> empty html/text url=%s host=%s", url, host or "")
+            if fetch_url != url and self.canonical_origins is not None:
+                # 書き換え先で失敗した場合は学習結果を捨て、次回は元の URL から辿り直す
+                self.canonical_origins.forget(url)
             return {"url": url, "text": "", "html": ""}
 
     # ===== ページ取得（ブラウザ再利用＋軽いリトライ） =====
@@ -4134,19 +5238,39 @@ class CompanyScraper:
             if cached.get("url") == url:
                 return cached
             return {**cached, "url": url}
+        if not cached and not need_screenshot:
+            disk_hit = await self._disk_cache_get(cache_key, sources=(SOURCE_PAGE,))
+            if disk_hit:
+                self.page_cache[cache_key] = {
+                    "url": url,
+                    "text": disk_hit.get("text", ""),
+                    "html": disk_hit.get("html", ""),
+                    "screenshot": b"",
+                }
+                return self.page_cache[cache_key]
 
         eff_timeout = timeout or self.page_timeout_ms
         if self.slow_page_threshold_ms > 0:
             eff_timeout = min(eff_timeout, self.slow_page_threshold_ms)
 
         http_fallback: Dict[str, Any] | None = None
+        http_final_url = ""
+        # HTTP 本文が上限で切られていたら、それを元にした結果はディスクキャッシュに残さない
+        http_truncated = False
         # PDFはブラウザ本文が取りにくい（ビューア/空テキスト）ため、スクショ要否に関わらずHTTPで先に本文抽出する
         try:
             is_pdf_url = (urllib.parse.urlparse(url).path or "").lower().endswith(".pdf")
         except Exception:
             is_pdf_url = False
+        try:
+            render_host = (urllib.parse.urlparse(url).netloc or "").lower().split(":")[0]
+        except Exception:
+            render_host = ""
+        render_mode = self.render_modes.mode(render_host) if self.render_modes is not None else ""
+        # ブラウザ必須と分かっているホストは HTTP を挟まず直接ブラウザで取る（ブラウザが使えない場合を除く）
+        skip_http_first = render_mode == MODE_BROWSER and not is_pdf_url and not self.browser_disabled
         # まずHTTPで軽量取得を試す（スクショ不要、または PDF）
-        if self.use_http_first and (not need_screenshot or is_pdf_url):
+        if self.use_http_first and (not need_screenshot or is_pdf_url) and not skip_http_first:
             # ブラウザ側のタイムアウトを超えてHTTPだけが長く居座らないように上限を合わせる
             http_timeout_ms = min(self.http_timeout_ms, eff_timeout) if eff_timeout > 0 else self.http_timeout_ms
             http_info = await self._fetch_http_info(url, timeout_ms=http_timeout_ms, allow_slow=allow_slow)
@@ -4158,6 +5282,8 @@ class CompanyScraper:
                 "html": html_val,
                 "screenshot": b"",
             }
+            http_final_url = http_info.get("final_url", "") or ""
+            http_truncated = bool(http_info.get("body_truncated"))
             # 軽量取得で十分な本文が取れた場合のみ即返す。
             # JSレンダリング前提のテンプレ（Next.js/Nuxt/React等）は HTML が大きくても本文が薄いことがあるため、
             # 本文が薄い場合はブラウザで再取得して取りこぼしを減らす。
@@ -4168,18 +5294,36 @@ class CompanyScraper:
                     "html": http_fallback["html"],
                     "screenshot": b"",
                 }
+                if not http_truncated:
+                    await self._disk_cache_put(cache_key, http_fallback["html"], http_fallback["text"], SOURCE_PAGE)
                 return self.page_cache[cache_key]
             if (not need_screenshot) and (
                 text_len >= 220 or (text_len >= 120 and not self._looks_js_heavy_template(html_val, http_fallback["text"]))
             ):
+                if self.render_modes is not None and not is_pdf_url:
+                    self.render_modes.record(render_host, MODE_HTTP)
                 self.page_cache[cache_key] = {
                     "url": url,
                     "text": http_fallback["text"],
                     "html": http_fallback["html"],
                     "screenshot": b"",
                 }
+                if not http_truncated:
+                    await self._disk_cache_put(cache_key, http_fallback["html"], http_fallback["text"], SOURCE_PAGE)
                 return self.page_cache[cache_key]
 
+        # HTTP で足りると分かっているホストでは、本文が薄くてもブラウザを起動しない（取得自体の失敗時を除く）
+        if (
+            render_mode == MODE_HTTP
+            and http_fallback is not None
+            and not need_screenshot
+            and (http_fallback.get("text") or "").strip()
+        ):
+            self.page_cache[cache_key] = http_fallback
+            if not http_truncated:
+                await self._disk_cache_put(cache_key, http_fallback["html"], http_fallback["text"], SOURCE_PAGE)
+            return self.page_cache[cache_key]
+
         if not self.context:
             if self.browser_disabled:
                 if http_fallback is not None:
@@ -4230,39 +5374,60 @@ class CompanyScraper:
                 fallback["screenshot"] = cached.get("screenshot", b"") or b""
             return fallback
 
-        browser_sem = self._get_browser_sem()
+        # HTTP が薄くてブラウザへ回る場合、取得済みの本体HTMLを使って描画だけ行う（失敗時の再試行は通常遷移）
+        nav_url = self.canonical_origins.rewrite(url) if self.canonical_origins is not None else url
+        prefetched_html = ""
+        if self.browser_reuse_http_html and http_fallback is not None and not is_pdf_url:
+            # 本文を返した最終 URL が遷移先と同じときだけ流用する（リダイレクトでパスが変わった HTML を
+            # 別の URL で描画すると相対パスの JS/CSS や同一オリジン XHR が壊れる）
+            if http_final_url and self._cache_key_url(http_final_url) == self._cache_key_url(nav_url):
+                prefetched_html = http_fallback.get("html") or ""
         for attempt in range(2):
             remaining_ms = int((total_deadline - time.monotonic()) * 1000)
             if remaining_ms <= 0:
                 break
             attempt_timeout = min(eff_timeout, remaining_ms)
             started = time.monotonic()
-            page: Page | None = None
             goto_ms = 0.0
             network_idle_ms = 0.0
             marked_slow = False
             try:
-                async with browser_sem:
+                async with self._browser_page() as page:
                     # attempt の中でも操作ごとに残り時間を割り当て、合算でタイムアウトを超えないようにする
-                    page = await self.context.new_page()
                     page.set_default_timeout(_cap_timeout_ms(attempt_timeout))
-                    goto_started = time.monotonic()
-                    goto_timeout = _cap_timeout_ms(attempt_timeout)
-                    if goto_timeout <= 0:
-                        raise PlaywrightTimeoutError("deadline exceeded before goto")
-                    await page.goto(url, timeout=goto_timeout, wait_until="domcontentloaded")
-                    # リダイレクトでパスが落ちた場合は www+元パスで再試行（残り時間がある範囲で）
-                    try:
-                        alt = self._rewrite_to_www_preserve_path(url, page.url or "")
-                    except Exception:
-                        alt = ""
-                    if alt and _remaining_ms() > 1200:
+                    # ホスト枠はページを確保してから、遷移（goto）の間だけ持つ（ページ待ちや描画待ちで枠を塞がない）
+                    async with self._host_slot(nav_url) as host_wait_ms:
+                        # ホスト枠の順番待ちは slow 判定の経過時間に含めない
+                        started += host_wait_ms / 1000.0
+                        goto_started = time.monotonic()
+                        goto_timeout = _cap_timeout_ms(attempt_timeout)
+                        if goto_timeout <= 0:
+                            raise PlaywrightTimeoutError("deadline exceeded before goto")
+                        if prefetched_html and attempt == 0:
+                            log.debug("[page] render prefetched html url=%s", nav_url)
+                            async with self._serve_prefetched_html(page, nav_url, prefetched_html):
+                                await page.goto(nav_url, timeout=goto_timeout, wait_until="domcontentloaded")
+                        else:
+                            await page.goto(nav_url, timeout=goto_timeout, wait_until="domcontentloaded")
+                        # リダイレクトでパスが落ちた場合は www+元パスで再試行（残り時間がある範囲で）
                         try:
-                            goto_timeout2 = _cap_timeout_ms(min(attempt_timeout, 6000))
-                            if goto_timeout2 > 0:
-                                await page.goto(alt, timeout=goto_timeout2, wait_until="domcontentloaded")
+                            alt = self._rewrite_to_www_preserve_path(nav_url, page.url or "")
                         except Exception:
-                            pass
+                            alt = ""
+                        alt_ok = False
+                        if alt and _remaining_ms() > 1200:
+                            try:
+                                goto_timeout2 = _cap_timeout_ms(min(attempt_timeout, 6000))
+                                if goto_timeout2 > 0:
+                                    alt_resp = await page.goto(alt, timeout=goto_timeout2, wait_until="domcontentloaded")
+                                    alt_ok = alt_resp is not None and alt_resp.status < 400
+                            except Exception:
+                                pass
+                    if self.canonical_origins is not None:
+                        if alt_ok:
+                            self.canonical_origins.learn(nav_url, alt, path_checked=True)
+                        else:
+                            self.canonical_origins.learn(nav_url, page.url or "")
                     goto_ms = (time.monotonic() - goto_started) * 1000
                     if self.network_idle_timeout_ms > 0:
                         net_started = time.monotonic()
@@ -4348,14 +5513,12 @@ class CompanyScraper:
                             try:
                                 # Playwright 側の timeout を使って待機を制限する。
                                 # create_task+wait_for だと上位キャンセル時に未回収Futureが残ることがあるため回避する。
-                                screenshot = await page.screenshot(
-                                    full_page=True,
-                                    timeout=screenshot_timeout_ms,
-                                )
+                                screenshot = await self._capture_screenshot(page, screenshot_timeout_ms)
                             except Exception:
                                 screenshot = b""
-                cleaned_text = self._clean_text_from_html(html, fallback_text=text or "")
+                cleaned_text = await self.clean_text_from_html_async(html, fallback_text=text or "")
                 result = {"url": url, "text": cleaned_text, "html": html, "screenshot": screenshot}
+                result_truncated = False
                 if cached and not screenshot:
                     # 再訪時にスクショなしなら旧データを活かす
                     if cached.get("screenshot"):
@@ -4364,12 +5527,19 @@ class CompanyScraper:
                         result["text"] = cached.get("text", "")
                     if not html:
                         result["html"] = cached.get("html", "")
+                # HTTP が薄くてブラウザへ回ったページで、ブラウザが本文を大きく増やしたかをホスト単位で記録する
+                if self.render_modes is not None and http_fallback is not None and not need_screenshot and not is_pdf_url:
+                    http_len = len((http_fallback.get("text") or "").strip())
+                    browser_len = len((result.get("text") or "").strip())
+                    needed = browser_len >= 120 and browser_len > http_len * 1.5 + 80
+                    self.render_modes.record(render_host, MODE_BROWSER if needed else MODE_HTTP)
                 # PDF はブラウザ抽出テキストが薄い/空になりやすいので、HTTP抽出（pypdf等）を優先する
                 if is_pdf_url and http_fallback is not None:
                     http_text = (http_fallback.get("text") or "").strip()
                     if http_text and len((result.get("text") or "").strip()) < len(http_text):
                         result["text"] = http_fallback.get("text", "") or ""
                         result["html"] = http_fallback.get("html", "") or ""
+                        result_truncated = http_truncated
                 elapsed_ms = (time.monotonic() - started) * 1000
                 effective_elapsed_ms = max(0.0, elapsed_ms - network_idle_ms)
                 if elapsed_ms >= eff_timeout:
@@ -4387,7 +5557,7 @@ class CompanyScraper:
                     and effective_elapsed_ms > self.slow_page_threshold_ms
                 ):
                     if host:
-                        self._add_slow_host(host)
+                        self._add_slow_host(host, elapsed_ms=effective_elapsed_ms)
                         marked_slow = True
                     log.info(
                         "[page] mark slow host (elapsed=%.0f ms goto=%.0f ms net_idle=%.0f ms) %s",
@@ -4396,7 +5566,10 @@ class CompanyScraper:
                         network_idle_ms,
                         host or "",
                     )
+                self._note_host_latency(host, elapsed_ms)
                 self.page_cache[cache_key] = result
+                if not result_truncated:
+                    await self._disk_cache_put(cache_key, result.get("html", ""), result.get("text", ""), SOURCE_PAGE)
                 return result
 
             except PlaywrightTimeoutError:
@@ -4417,7 +5590,7 @@ class CompanyScraper:
                     and not marked_slow
                 ):
                     if host:
-                        self._add_slow_host(host)
+                        self._add_slow_host(host, elapsed_ms=effective_elapsed_ms, timeout=True)
                     log.warning(
                         "[page] timeout/slow (elapsed=%.0f ms goto=%.0f ms net_idle=%.0f ms) -> skip host next time: %s",
                         effective_elapsed_ms,
@@ -4425,8 +5598,6 @@ class CompanyScraper:
                         network_idle_ms,
                         host or "",
                     )
-                if page:
-                    await page.close()
 
         fallback = {"url": url, "text": "", "html": "", "screenshot": b""}
         if cached:
@@ -4489,42 +5660,37 @@ class CompanyScraper:
             ),
         },
     }
+    # focus ごとのアンカー文言（大小無視）/パス（小文字化したパスに対して）照合
+    FOCUS_ANCHOR_MATCHERS = {
+        key: KeywordMatcher(mapping.get("anchor", ()), ignore_case=True) for key, mapping in FOCUS_KEYWORD_MAP.items()
+    }
+    FOCUS_PATH_MATCHERS = {
+        key: KeywordMatcher(mapping.get("path", ())) for key, mapping in FOCUS_KEYWORD_MAP.items()
+    }
 
-    def _rank_links(self, base: str, html: str, *, focus: Optional[set[str]] = None) -> List[str]:
+    def _rank_links(self, base: str, html: HtmlLike, *, focus: Optional[set[str]] = None) -> List[str]:
         base_host = urlparse(base).netloc
         candidates: List[tuple[int, int, int, str]] = []
         fallback_links: List[str] = []
         seen_links: set[str] = set()
         focus = focus or set()
 
-        try:
-            soup = BeautifulSoup(html or "", "html.parser")
-            anchors = soup.find_all("a", href=True)
-        except Exception:
-            anchors = []
+        page = self._parsed_page(html)
+        anchors = page.anchors
 
         raw_links: List[tuple[str, str]] = []
         if anchors:
-            for anchor in anchors:
-                href = anchor.get("href")
+            for href, text, title, _ in anchors:
                 if not href:
                     continue
-                text = anchor.get_text(separator=" ", strip=True) or ""
-                title = anchor.get("title") or ""
                 anchor_text = text or title
                 raw_links.append((href, anchor_text))
         else:
-            for href in re.findall(r'href=["\']([^"\']+)["\']', html or "", flags=re.I):
+            for href in re.findall(r'href=["\']([^"\']+)["\']', page.html, flags=re.I):
                 raw_links.append((href, ""))
 
-        focus_anchor_words: set[str] = set()
-        focus_path_words: set[str] = set()
-        for key in focus:
-            mapping = self.FOCUS_KEYWORD_MAP.get(key)
-            if not mapping:
-                continue
-            focus_anchor_words.update(mapping.get("anchor", ()))
-            focus_path_words.update(mapping.get("path", ()))
+        focus_anchor_matchers = [self.FOCUS_ANCHOR_MATCHERS[key] for key in focus if key in self.FOCUS_ANCHOR_MATCHERS]
+        focus_path_matchers = [self.FOCUS_PATH_MATCHERS[key] for key in focus if key in self.FOCUS_PATH_MATCHERS]
 
         for href, anchor_text in raw_links:
             url = urljoin(base, href)
@@ -4555,18 +5721,10 @@ class CompanyScraper:
                 if word and (word in anchor_text or word_lower in anchor_lower):
                     score += 8
 
-            if focus_anchor_words:
-                for word in focus_anchor_words:
-                    if not word:
-                        continue
-                    if word.lower() in anchor_lower:
-                        score += 6
-                        break
-            if focus_path_words:
-                for word in focus_path_words:
-                    if word and word in path_lower:
-                        score += 4
-                        break
+            if any(matcher.search(anchor_lower) for matcher in focus_anchor_matchers):
+                score += 6
+            if any(matcher.search(path_lower) for matcher in focus_path_matchers):
+                score += 4
 
             # focusが指定された場合は、目的に直結する導線（contact/access等）を強く優先する
             if "phone" in focus and any(seg in path_lower for seg in ("/contact", "/inquiry", "/toiawase", "/otoiawase", "/contact-us")):
@@ -4607,19 +5765,17 @@ class CompanyScraper:
                 break
         return ordered
 
-    def _find_priority_links(self, base: str, html: str, max_links: int = 4, target_types: Optional[list[str]] = None) -> List[str]:
+    def _find_priority_links(self, base: str, html: HtmlLike, max_links: int = 4, target_types: Optional[list[str]] = None) -> List[str]:
         if not html:
             return []
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-        except Exception:
+        page = self._parsed_page(html)
+        if page.soup is None:
             return []
         base_host = urlparse(base).netloc
         scored: List[tuple[int, int, int, str]] = []
         seen: set[str] = set()
 
-        for anchor in soup.find_all("a", href=True):
-            href = anchor.get("href")
+        for href, anchor_text, anchor_title, anchor in page.anchors:
             if not href:
                 continue
             url = urljoin(base, href)
@@ -4627,8 +5783,8 @@ class CompanyScraper:
             if not parsed.netloc or parsed.netloc != base_host:
                 continue
             token = " ".join([
-                anchor.get_text(separator=" ", strip=True) or "",
-                anchor.get("title") or "",
+                anchor_text,
+                anchor_title,
                 href or "",
             ]).lower()
             score = 0
@@ -5034,7 +6190,32 @@ class CompanyScraper:
                 meta["stop_reason"] = "unknown"
         return (results, meta) if return_meta else results
 
-    def classify_page_type(self, url: str, text: str = "", html: str = "") -> Dict[str, Any]:
+    async def _run_cpu_stage(self, name: str, sizes: tuple, *args: Any, **kwargs: Any) -> Any:
+        """
+        CPU 処理 name を cpu_stage（別プロセス）で実行する。無効/小さいページ/ワーカー失敗時はその場で実行する。
+        """
+        stage = self.cpu_stage
+        if stage is not None and stage.should_offload(*sizes):
+            try:
+                return await stage.run(name, *args, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+        return getattr(self, name)(*args, **kwargs)
+
+    async def clean_text_from_html_async(self, html: str, fallback_text: str = "") -> str:
+        return await self._run_cpu_stage("_clean_text_from_html", (html, fallback_text), html, fallback_text=fallback_text)
+
+    async def extract_candidates_async(
+        self, text: str, html: Optional[str] = None, page_type_hint: Optional[str] = None
+    ) -> Dict[str, List[str]]:
+        return await self._run_cpu_stage("extract_candidates", (text, html), text, html, page_type_hint=page_type_hint)
+
+    async def classify_page_type_async(self, url: str, text: str = "", html: str = "") -> Dict[str, Any]:
+        return await self._run_cpu_stage("classify_page_type", (text, html), url, text=text, html=html)
+
+    def classify_page_type(self, url: str, text: str = "", html: HtmlLike = "") -> Dict[str, Any]:
         """
         AI禁止の軽量ページ分類。
         COMPANY_PROFILE / ACCESS_CONTACT / BASES_LIST / DIRECTORY_DB / OTHER
@@ -5043,7 +6224,8 @@ class CompanyScraper:
         text_nfkc = unicodedata.normalize("NFKC", text or "")
         text_low = text_nfkc.lower()
 
-        directory = self._detect_directory_like(url, text=text_nfkc, html=html or "")
+        page = self._parsed_page(html)
+        directory = self._detect_directory_like(url, text=text_nfkc, html=page)
         if bool(directory.get("is_directory_like")):
             return {
                 "page_type": "DIRECTORY_DB",
@@ -5056,9 +6238,9 @@ class CompanyScraper:
         headings = ""
         has_table_or_dl = False
         try:
-            soup = BeautifulSoup(html or "", "html.parser")
-            if soup.title and soup.title.string:
-                title = soup.title.string.strip()
+            soup = page.soup
+            if soup is not None and page.title:
+                title = page.title.strip()
             hs: list[str] = []
             for tag in ("h1", "h2", "h3"):
                 for node in soup.find_all(tag)[:12]:
@@ -5069,7 +6251,7 @@ class CompanyScraper:
             has_table_or_dl = bool(soup.find("table") or soup.find("dl"))
             if not text_nfkc and html:
                 try:
-                    text_nfkc = unicodedata.normalize("NFKC", soup.get_text(" ", strip=True) or "")
+                    text_nfkc = unicodedata.normalize("NFKC", page.text or "")
                     text_low = text_nfkc.lower()
                 except Exception:
                     pass
@@ -5218,7 +6400,7 @@ class CompanyScraper:
         return {"page_type": "OTHER", "score": label_hits, "reason": "default"}
 
     # ===== 抽出 =====
-    def extract_candidates(self, text: str, html: Optional[str] = None, page_type_hint: Optional[str] = None) -> Dict[str, List[str]]:
+    def extract_candidates(self, text: str, html: HtmlLike = None, page_type_hint: Optional[str] = None) -> Dict[str, List[str]]:
         phones: List[str] = []
         addrs: List[str] = []
         reps: List[str] = []
@@ -5234,27 +6416,7 @@ class CompanyScraper:
             compact = re.sub(r"[\s\u3000]+", "", s)
             if not compact:
                 return []
-            tags: list[str] = []
-            # 優先: 本社/代表/管理系
-            if any(k in compact for k in ("本社", "本店", "本部", "本社所在地", "本店所在地")):
-                tags.append("HQ")
-            if any(k in compact for k in ("代表電話", "代表番号", "代表TEL", "代表", "代表取締役")):
-                tags.append("REP")
-            if "総務" in compact:
-                tags.append("SOUMU")
-            if "経理" in compact:
-                tags.append("KEIRI")
-            if any(k in compact for k in ("管理", "管理部", "管理本部")):
-                tags.append("ADMIN")
-
-            # 低優先/避けたい: 拠点/採用/サポート等
-            if any(k in compact for k in ("支店", "営業所", "出張所", "事業所", "工場", "倉庫", "物流センター", "センター", "店舗")):
-                tags.append("BRANCH")
-            if any(k in compact for k in ("採用", "求人", "リクルート", "応募", "エントリー")):
-                tags.append("RECRUIT")
-            if any(k in compact for k in ("サポート", "カスタマー", "コールセンター", "ヘルプデスク")):
-                tags.append("SUPPORT")
-            return tags
+            return self.PHONE_CONTEXT_TAGGER.tags(compact)
 
         def _normalize_label_text(raw: str) -> tuple[str, str]:
             cleaned = unicodedata.normalize("NFKC", raw or "")
@@ -5457,10 +6619,7 @@ class CompanyScraper:
         sequential_texts: List[str] = []
 
         if html:
-            try:
-                soup = BeautifulSoup(html, "html.parser")
-            except Exception:
-                soup = None
+            soup = self._parsed_page(html).soup
             if soup:
                 # フッター/隅の情報に住所だけが載っているケース対策:
                 # table/dl のラベル抽出に乗らない住所を <footer>/<address> 等から拾う
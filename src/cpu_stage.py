@@ -0,0 +1,109 @@
+# src/cpu_stage.py
+"""
+HTML 解析系（本文クリーニング / 候補抽出 / ページ種別判定）をプロセスプールで行うステージ。
+
+これらは純粋な CPU 処理で、高並列時にイベントループ上で走ると他の取得の wait_for/タイマーが遅れて
+偽のタイムアウトが出るため、大きなページだけ別プロセスへ渡してループは取得を続けられるようにする。
+
+- 入力は str/bool のみ（pickle 可能）。ワーカー側では CompanyScraper.for_analysis()（ブラウザ/DB/ファイルを触らない
+  解析専用インスタンス）で同じメソッドを呼ぶ
+- ディレクトリ判定（_detect_directory_like）は親側で他の解析と ParsedPage を共有して呼ばれるため対象にしない
+  （別プロセスへ渡すと同じ HTML をもう一度パースすることになる）
+- min_chars 未満の小さいページはプロセス間転送の方が高くつくので呼び出し側でその場で処理する
+- ワーカーの起動（spawn で数秒）は warm() で先に済ませる
+- ワーカーが落ちた/プールが壊れた場合は例外を呼び出し側へ返し、呼び出し側はインラインで処理し直す
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from .spawn_pool import new_spawn_pool, warm_pool
+
+log = logging.getLogger(__name__)
+
+_WORKER_SCRAPER: Any = None
+
+
+def _init_worker(rep_strict_sources: bool) -> None:
+    global _WORKER_SCRAPER
+    from .company_scraper import CompanyScraper
+
+    _WORKER_SCRAPER = CompanyScraper.for_analysis(rep_strict_sources=rep_strict_sources)
+
+
+def _run_task(name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    return getattr(_WORKER_SCRAPER, name)(*args, **kwargs)
+
+
+class CpuStage:
+    TASKS = ("_clean_text_from_html", "extract_candidates", "classify_page_type")
+
+    def __init__(self, *, workers: int = 2, min_chars: int = 20000, rep_strict_sources: bool = True) -> None:
+        self.workers = max(1, int(workers))
+        self.min_chars = max(0, int(min_chars))
+        self.rep_strict_sources = bool(rep_strict_sources)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.offloaded = 0
+        self.inline = 0
+        self.failures = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = new_spawn_pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.rep_strict_sources,),
+            )
+        return self._executor
+
+    def _drop_executor(self, executor: ProcessPoolExecutor) -> None:
+        # 既に作り直された後なら何もしない（新しいプールを巻き添えにしない）
+        if self._executor is not executor:
+            return
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def warm(self) -> None:
+        executor = self._get_executor()
+        try:
+            await warm_pool(executor, self.workers)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.debug("cpu stage warm-up failed", exc_info=True)
+            self._drop_executor(executor)
+
+    def should_offload(self, *texts: Optional[str]) -> bool:
+        size = sum(len(t) for t in texts if t)
+        if size >= self.min_chars:
+            return True
+        self.inline += 1
+        return False
+
+    async def run(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        if name not in self.TASKS:
+            raise ValueError(f"unsupported cpu stage task: {name}")
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            result = await loop.run_in_executor(executor, _run_task, name, args, kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failures += 1
+            log.debug("cpu stage task failed: %s", name, exc_info=True)
+            self._drop_executor(executor)
+            raise
+        self.offloaded += 1
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {"offloaded": self.offloaded, "inline": self.inline, "failures": self.failures}
+
+    def close(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
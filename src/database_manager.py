@@ -233,6 +233,9 @@ class DatabaseManager:
                     homepage_check_url TEXT,
                     homepage_check_source TEXT,
                     homepage_check_logic_hash TEXT,
+                    homepage_etag TEXT,
+                    homepage_last_modified TEXT,
+                    homepage_http_content_length INTEGER,
                     error_code     TEXT
                 )
                 """
@@ -350,6 +353,15 @@ class DatabaseManager:
         if "homepage_check_logic_hash" not in cols:
             self.conn.execute("ALTER TABLE companies ADD COLUMN homepage_check_logic_hash TEXT;")
             cols.add("homepage_check_logic_hash")
+        if "homepage_etag" not in cols:
+            self.conn.execute("ALTER TABLE companies ADD COLUMN homepage_etag TEXT;")
+            cols.add("homepage_etag")
+        if "homepage_last_modified" not in cols:
+            self.conn.execute("ALTER TABLE companies ADD COLUMN homepage_last_modified TEXT;")
+            cols.add("homepage_last_modified")
+        if "homepage_http_content_length" not in cols:
+            self.conn.execute("ALTER TABLE companies ADD COLUMN homepage_http_content_length INTEGER;")
+            cols.add("homepage_http_content_length")
         if "reference_homepage" not in cols:
             self.conn.execute("ALTER TABLE companies ADD COLUMN reference_homepage TEXT;")
             cols.add("reference_homepage")
@@ -828,6 +840,43 @@ class DatabaseManager:
             self.conn.rollback()
             raise
 
+    def refresh_claims(self, company_ids: Iterable[int], worker_id: str) -> set[int]:
+        """
+        先行確保（lookahead）した running 行の locked_at を1回の UPDATE でまとめて今に更新し、まだ自分が持っている id を返す。
+        TTL 回収などで他 worker に渡った行は含まれない（その会社は処理しない）。
+        """
+        ids = [int(cid) for cid in company_ids]
+        if not ids:
+            return set()
+        placeholders = ",".join("?" * len(ids))
+        self.cur.execute(
+            f"UPDATE companies SET locked_at=datetime('now') "
+            f"WHERE id IN ({placeholders}) AND status='running' AND locked_by=?",
+            (*ids, worker_id),
+        )
+        held = {
+            int(row[0])
+            for row in self.cur.execute(
+                f"SELECT id FROM companies WHERE id IN ({placeholders}) AND status='running' AND locked_by=?",
+                (*ids, worker_id),
+            ).fetchall()
+        }
+        self._commit_with_checkpoint()
+        return held
+
+    def release_claim(self, company_id: int, worker_id: str) -> bool:
+        """
+        処理せずに手放す running 行を pending に戻す（TTL 回収と同じ戻し先）。自分のロックでなければ何もしない。
+        """
+        self.cur.execute(
+            "UPDATE companies SET status='pending', locked_by=NULL, locked_at=NULL "
+            "WHERE id=? AND status='running' AND locked_by=?",
+            (company_id, worker_id),
+        )
+        ok = self.cur.rowcount > 0
+        self._commit_with_checkpoint()
+        return ok
+
     # ---------- 単発互換 ----------
     def get_next_company(self) -> Optional[Dict[str, Any]]:
         self.cur.execute(
@@ -1380,6 +1429,9 @@ class DatabaseManager:
         set_value("homepage_check_url", company.get("homepage_check_url", "") or "")
         set_value("homepage_check_source", company.get("homepage_check_source", "") or "")
         set_value("homepage_check_logic_hash", company.get("homepage_check_logic_hash", "") or "")
+        set_value("homepage_etag", company.get("homepage_etag", "") or "")
+        set_value("homepage_last_modified", company.get("homepage_last_modified", "") or "")
+        set_value("homepage_http_content_length", company.get("homepage_http_content_length"))
         set_value("reference_phone", company.get("reference_phone", "") or "")
         set_value("reference_address", company.get("reference_address", "") or "")
         set_value("accuracy_homepage", company.get("accuracy_homepage", "") or "")
@@ -1503,6 +1555,9 @@ class DatabaseManager:
         homepage_check_source: str,
         homepage_check_logic_hash: str,
         skip_reason: str,
+        homepage_etag: str = "",
+        homepage_last_modified: str = "",
+        homepage_http_content_length: Optional[int] = None,
     ) -> None:
         cols = self._schema_columns
         updates: list[str] = []
@@ -1520,6 +1575,9 @@ class DatabaseManager:
         add_value("homepage_check_url", homepage_check_url)
         add_value("homepage_check_source", homepage_check_source)
         add_value("homepage_check_logic_hash", homepage_check_logic_hash)
+        add_value("homepage_etag", homepage_etag or "")
+        add_value("homepage_last_modified", homepage_last_modified or "")
+        add_value("homepage_http_content_length", homepage_http_content_length)
         add_value("skip_reason", skip_reason)
         if "last_checked_at" in cols:
             updates.append("last_checked_at = datetime('now')")
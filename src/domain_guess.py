@@ -0,0 +1,83 @@
+# src/domain_guess.py
+"""
+社名トークン（_company_tokens のローマ字/英字）から公式サイトのオリジン候補を作る（検索前のドメイン推測）。
+
+「社名ローマ字 + .co.jp/.jp/.com」をそのまま持っている会社は多いのに、毎回検索エンジンを1周してから候補を見ていたため、
+- トークンはドメインラベルとして妥当なもの（英数字/ハイフン, min_len 以上）だけを _company_tokens の順に max_tokens 個
+- TLD は設定順。候補は「トークン順→TLD 順」に並べ、max_probes 件で打ち切る
+- 法人格/汎用語（corp, holdings 等）だけのトークンは使わない
+実際の到達確認（DNS→GET→社名一致）は CompanyScraper.guess_official_urls が行う。
+"""
+from __future__ import annotations
+
+import re
+from typing import Iterable, List, Sequence
+
+DEFAULT_TLDS = (".co.jp", ".jp", ".com")
+
+# ドメインラベルとして使えないもの/汎用すぎて他社に当たりやすいもの
+STOP_TOKENS = frozenset(
+    {
+        "kabushikigaisha",
+        "kabushikikaisha",
+        "yuugengaisha",
+        "yugengaisha",
+        "goudougaisha",
+        "godogaisha",
+        "corp",
+        "corporation",
+        "company",
+        "holdings",
+        "group",
+        "japan",
+        "nihon",
+        "nippon",
+        "inc",
+        "ltd",
+        "the",
+    }
+)
+
+_LABEL_RE = re.compile(r"^[a-z0-9](?:[a-z0-9-]*[a-z0-9])?$")
+
+
+def parse_tlds(raw: str) -> List[str]:
+    tlds: List[str] = []
+    for part in (raw or "").split(","):
+        tld = part.strip().lower().strip(".")
+        if tld and f".{tld}" not in tlds:
+            tlds.append(f".{tld}")
+    return tlds or list(DEFAULT_TLDS)
+
+
+def domain_labels(tokens: Iterable[str], *, min_len: int = 3, max_tokens: int = 3) -> List[str]:
+    labels: List[str] = []
+    for token in tokens:
+        label = (token or "").strip().lower()
+        if len(label) < min_len or len(label) > 63 or label in STOP_TOKENS:
+            continue
+        if not _LABEL_RE.match(label) or label.isdigit():
+            continue
+        if label not in labels:
+            labels.append(label)
+        if len(labels) >= max_tokens:
+            break
+    return labels
+
+
+def guess_domain_origins(
+    tokens: Iterable[str],
+    tlds: Sequence[str] = DEFAULT_TLDS,
+    *,
+    min_len: int = 3,
+    max_tokens: int = 3,
+    max_probes: int = 6,
+) -> List[str]:
+    """候補オリジン（https://<label><tld>/）をトークン順→TLD 順で最大 max_probes 件返す。"""
+    origins: List[str] = []
+    for label in domain_labels(tokens, min_len=min_len, max_tokens=max_tokens):
+        for tld in tlds:
+            if len(origins) >= max_probes:
+                return origins
+            origins.append(f"https://{label}{tld}/")
+    return origins
@@ -0,0 +1,225 @@
+# src/fetch_archive.py
+"""
+検索エンジン応答とページ取得結果の記録/再生（オフラインでの end-to-end ベンチマーク/プロファイル用）。
+
+FETCH_ARCHIVE_MODE=record で実行すると、CompanyScraper の
+- 検索エンジン取得（_fetch_startpage / _fetch_duckduckgo / _fetch_bing）の生 HTML
+- get_page_info / _fetch_http_info の結果（text/html/検証子、スクショは別列）
+を SQLite に書き出す。FETCH_ARCHIVE_MODE=replay では同じインターフェースからそれを返し、ネットワークに出ない。
+
+- キーは (種別, クエリ or 呼び出し時の URL)。同じキーは後勝ち（ただし空のスクショで既存のスクショは消さない）
+- 記録時に例外だった呼び出しは例外として記録し、再生時も RuntimeError を送出する
+- 再生時に無いキーは「取得失敗」と同じ空の結果を返し、misses に数える（コーパス外へのアクセスを可視化）
+- latency_scale > 0 なら記録時の所要時間×倍率だけ待つ（0 なら待たずに CPU 側のスループットを測る）
+- WAL + busy_timeout、1操作ごとに接続を開閉する（PageDiskCache と同じ方針）
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+KIND_PAGE = "page"
+KIND_HTTP = "http"
+
+_ERROR_KEY = "__error__"
+
+# (記録種別, CompanyScraper のメソッド名)
+SEARCH_FETCHERS = (
+    ("search:startpage", "_fetch_startpage"),
+    ("search:duckduckgo", "_fetch_duckduckgo"),
+    ("search:bing", "_fetch_bing"),
+)
+
+
+class FetchArchive:
+    def __init__(self, path: str, mode: str, *, latency_scale: float = 0.0) -> None:
+        mode = (mode or "").strip().lower()
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"unknown fetch archive mode: {mode!r}")
+        self.path = (path or "").strip()
+        self.mode = mode
+        self.latency_scale = max(0.0, float(latency_scale))
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._ensure_tables()
+
+    @classmethod
+    def from_env(cls) -> Optional["FetchArchive"]:
+        mode = os.getenv("FETCH_ARCHIVE_MODE", "").strip().lower()
+        if not mode or mode == "off":
+            return None
+        return cls(
+            os.getenv("FETCH_ARCHIVE_PATH", "data/fetch_archive.sqlite3"),
+            mode,
+            latency_scale=float(os.getenv("FETCH_ARCHIVE_REPLAY_LATENCY_SCALE", "0")),
+        )
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA busy_timeout=10000")
+        return conn
+
+    def _ensure_tables(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS fetch_archive (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    screenshot BLOB NOT NULL DEFAULT x'',
+                    elapsed_ms REAL NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY(kind, key)
+                )
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ---- 読み書き ----
+    def put(self, kind: str, key: str, value: Any, *, screenshot: bytes = b"", elapsed_ms: float = 0.0) -> None:
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO fetch_archive(kind, key, payload, screenshot, elapsed_ms, created_at)
+                VALUES(?, ?, ?, ?, ?, ?)
+                ON CONFLICT(kind, key) DO UPDATE SET
+                    payload=excluded.payload,
+                    screenshot=CASE WHEN length(excluded.screenshot) > 0
+                                    THEN excluded.screenshot ELSE fetch_archive.screenshot END,
+                    elapsed_ms=excluded.elapsed_ms,
+                    created_at=excluded.created_at
+                """,
+                (kind, key, payload, sqlite3.Binary(screenshot or b""), float(elapsed_ms), time.time()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self.recorded += 1
+
+    def get(self, kind: str, key: str) -> Optional[Tuple[Any, bytes, float]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT payload, screenshot, elapsed_ms FROM fetch_archive WHERE kind=? AND key=?",
+                (kind, key),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(zlib.decompress(row[0]).decode("utf-8")), bytes(row[1] or b""), float(row[2] or 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+    # ---- CompanyScraper への差し込み ----
+    async def _replay_delay(self, elapsed_ms: float) -> None:
+        if self.latency_scale > 0 and elapsed_ms > 0:
+            await asyncio.sleep(elapsed_ms * self.latency_scale / 1000.0)
+
+    @staticmethod
+    def _raise_if_error(value: Any) -> Any:
+        if isinstance(value, dict) and _ERROR_KEY in value:
+            raise RuntimeError(f"archived error: {value[_ERROR_KEY]}")
+        return value
+
+    async def _record_error(self, kind: str, key: str, exc: Exception, started: float) -> None:
+        elapsed_ms = (time.monotonic() - started) * 1000
+        await asyncio.to_thread(self.put, kind, key, {_ERROR_KEY: repr(exc)}, elapsed_ms=elapsed_ms)
+
+    def _wrap_search(self, kind: str, original: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        @functools.wraps(original)
+        async def wrapper(query: str, *args: Any, **kwargs: Any) -> str:
+            if self.replaying:
+                entry = await asyncio.to_thread(self.get, kind, query)
+                if entry is None:
+                    log.info("[archive] miss %s query=%s", kind, query)
+                    return ""
+                await self._replay_delay(entry[2])
+                return str(self._raise_if_error(entry[0]) or "")
+            started = time.monotonic()
+            try:
+                html = await original(query, *args, **kwargs)
+            except Exception as exc:
+                await self._record_error(kind, query, exc, started)
+                raise
+            await asyncio.to_thread(self.put, kind, query, html or "", elapsed_ms=(time.monotonic() - started) * 1000)
+            return html
+
+        return wrapper
+
+    def _wrap_page(
+        self, kind: str, original: Callable[..., Awaitable[Dict[str, Any]]]
+    ) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        @functools.wraps(original)
+        async def wrapper(url: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            if self.replaying:
+                entry = await asyncio.to_thread(self.get, kind, url)
+                if entry is None:
+                    log.info("[archive] miss %s url=%s", kind, url)
+                    empty: Dict[str, Any] = {"url": url, "text": "", "html": ""}
+                    if kind == KIND_PAGE:
+                        empty["screenshot"] = b""
+                    return empty
+                value, screenshot, elapsed_ms = entry
+                await self._replay_delay(elapsed_ms)
+                info = dict(self._raise_if_error(value) or {})
+                if kind == KIND_PAGE:
+                    info["screenshot"] = screenshot
+                return info
+            started = time.monotonic()
+            try:
+                info = await original(url, *args, **kwargs)
+            except Exception as exc:
+                await self._record_error(kind, url, exc, started)
+                raise
+            value = {k: v for k, v in (info or {}).items() if k != "screenshot"}
+            shot = (info or {}).get("screenshot") or b""
+            await asyncio.to_thread(
+                self.put,
+                kind,
+                url,
+                value,
+                screenshot=shot if isinstance(shot, (bytes, bytearray)) else b"",
+                elapsed_ms=(time.monotonic() - started) * 1000,
+            )
+            return info
+
+        return wrapper
+
+    def install(self, scraper: Any) -> None:
+        """scraper の取得メソッドをインスタンス属性で差し替える（クラスは変更しない）。"""
+        for kind, attr in SEARCH_FETCHERS:
+            setattr(scraper, attr, self._wrap_search(kind, getattr(scraper, attr)))
+        scraper.get_page_info = self._wrap_page(KIND_PAGE, scraper.get_page_info)
+        scraper._fetch_http_info = self._wrap_page(KIND_HTTP, scraper._fetch_http_info)
+        log.info("[archive] %s mode path=%s", self.mode, self.path)
@@ -0,0 +1,199 @@
+# src/host_health_store.py
+"""
+shard 間で共有するホスト健全性ストア（SQLite）。slow_hosts.txt の全件書き直しを置き換える。
+
+- 1ホスト1行を UPSERT で増分更新する（他 shard の行を消さない）
+- 遅延判定（slow_count）/ タイムアウト回数 / 取得回数 / 平均・最大レイテンシ / 最終観測時刻を持つ
+- 遅延観測/レイテンシは呼び出し側でまとめて record_slow_many() / add_latencies() し、1トランザクションで書く（1取得ごとに commit しない）
+- WAL + busy_timeout。接続は1操作ごとに開閉する（PageDiskCache と同じ方針）
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+
+class HostHealthStore:
+    def __init__(self, path: str, *, ttl_sec: int = 7 * 24 * 3600) -> None:
+        self.path = (path or "").strip()
+        self.ttl_sec = max(0, int(ttl_sec))
+        self._ensure_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA busy_timeout=10000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _ensure_tables(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS host_health (
+                    host TEXT PRIMARY KEY,
+                    slow_count INTEGER NOT NULL DEFAULT 0,
+                    timeout_count INTEGER NOT NULL DEFAULT 0,
+                    fetch_count INTEGER NOT NULL DEFAULT 0,
+                    latency_sum_ms REAL NOT NULL DEFAULT 0,
+                    latency_max_ms REAL NOT NULL DEFAULT 0,
+                    last_slow_ts INTEGER NOT NULL DEFAULT 0,
+                    last_seen_ts INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_host_health_last_slow ON host_health(last_slow_ts)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def record_slow(self, host: str, *, elapsed_ms: float = 0.0, timeout: bool = False, ts: Optional[int] = None) -> None:
+        """遅い/タイムアウトした観測を1件加える。"""
+        self.record_slow_many([(host, float(elapsed_ms or 0.0), bool(timeout), int(ts if ts is not None else time.time()))])
+
+    def record_slow_many(self, events: Iterable[Tuple[str, float, bool, int]]) -> None:
+        """
+        (host, 経過ms, タイムアウトか, 観測時刻) をまとめて加える（1トランザクション）。
+        """
+        rows = [
+            (host, 1 if timeout else 0, float(elapsed_ms or 0.0), int(ts), int(ts), self.ttl_sec, int(ts), self.ttl_sec)
+            for host, elapsed_ms, timeout, ts in events
+            if host
+        ]
+        if not rows:
+            return
+        conn = self._connect()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO host_health(host, slow_count, timeout_count, latency_max_ms, last_slow_ts, last_seen_ts)
+                VALUES(?, 1, ?, ?, ?, ?)
+                ON CONFLICT(host) DO UPDATE SET
+                    slow_count = CASE
+                        WHEN ? > 0 AND host_health.last_slow_ts < ? - ? THEN 1
+                        ELSE host_health.slow_count + 1
+                    END,
+                    timeout_count = host_health.timeout_count + excluded.timeout_count,
+                    latency_max_ms = MAX(host_health.latency_max_ms, excluded.latency_max_ms),
+                    last_slow_ts = excluded.last_slow_ts,
+                    last_seen_ts = MAX(host_health.last_seen_ts, excluded.last_seen_ts)
+                """,
+                rows,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def merge_slow_counts(self, hosts: Dict[str, Dict[str, int]]) -> None:
+        """旧形式（slow_hosts.txt）の {"count","last_ts"} を取り込む（既存行より大きい値だけ反映）。"""
+        if not hosts:
+            return
+        conn = self._connect()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO host_health(host, slow_count, last_slow_ts, last_seen_ts)
+                VALUES(?, ?, ?, ?)
+                ON CONFLICT(host) DO UPDATE SET
+                    slow_count = MAX(host_health.slow_count, excluded.slow_count),
+                    last_slow_ts = MAX(host_health.last_slow_ts, excluded.last_slow_ts),
+                    last_seen_ts = MAX(host_health.last_seen_ts, excluded.last_seen_ts)
+                """,
+                [
+                    (host, int(meta.get("count", 1)), int(meta.get("last_ts", 0)), int(meta.get("last_ts", 0)))
+                    for host, meta in hosts.items()
+                    if host
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def add_latencies(self, samples: Iterable[Tuple[str, int, float, float]]) -> None:
+        """
+        (host, 件数, 合計ms, 最大ms) をまとめて加算する。
+        """
+        rows = [(h, int(n), float(total), float(mx)) for h, n, total, mx in samples if h and n > 0]
+        if not rows:
+            return
+        now_ts = int(time.time())
+        conn = self._connect()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO host_health(host, fetch_count, latency_sum_ms, latency_max_ms, last_seen_ts)
+                VALUES(?, ?, ?, ?, ?)
+                ON CONFLICT(host) DO UPDATE SET
+                    fetch_count = host_health.fetch_count + excluded.fetch_count,
+                    latency_sum_ms = host_health.latency_sum_ms + excluded.latency_sum_ms,
+                    latency_max_ms = MAX(host_health.latency_max_ms, excluded.latency_max_ms),
+                    last_seen_ts = excluded.last_seen_ts
+                """,
+                [(h, n, total, mx, now_ts) for h, n, total, mx in rows],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def slow_hosts_since(self, since_ts: int = 0) -> Dict[str, Dict[str, int]]:
+        """
+        last_slow_ts が since_ts 以降（かつ TTL 内）のホストを {"count","last_ts"} 形式で返す。
+        """
+        floor = int(since_ts)
+        if self.ttl_sec > 0:
+            floor = max(floor, int(time.time()) - self.ttl_sec)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT host, slow_count, last_slow_ts FROM host_health WHERE slow_count > 0 AND last_slow_ts >= ?",
+                (floor,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {host: {"count": int(count), "last_ts": int(ts)} for host, count, ts in rows}
+
+    def stats(self, host: str) -> Optional[Dict[str, float]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT slow_count, timeout_count, fetch_count, latency_sum_ms, latency_max_ms, last_slow_ts, last_seen_ts
+                  FROM host_health WHERE host=? LIMIT 1
+                """,
+                (host,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        slow, timeouts, fetches, total, mx, last_slow, last_seen = row
+        return {
+            "slow_count": int(slow),
+            "timeout_count": int(timeouts),
+            "fetch_count": int(fetches),
+            "latency_avg_ms": round(float(total) / fetches, 1) if fetches else 0.0,
+            "latency_max_ms": float(mx),
+            "last_slow_ts": int(last_slow),
+            "last_seen_ts": int(last_seen),
+        }
+
+    def prune(self) -> int:
+        """TTL を過ぎて観測の無いホストを消す。"""
+        if self.ttl_sec <= 0:
+            return 0
+        conn = self._connect()
+        try:
+            cur = conn.execute("DELETE FROM host_health WHERE last_seen_ts < ?", (int(time.time()) - self.ttl_sec,))
+            conn.commit()
+            return max(0, cur.rowcount or 0)
+        finally:
+            conn.close()
@@ -0,0 +1,120 @@
+# src/host_limiter.py
+"""
+プロセス内のホスト単位の同時実行数制限＋トークンバケット（取得間隔の平準化）。
+
+FETCH_CONCURRENCY / PROFILE_FETCH_CONCURRENCY / 優先ドキュメント取得 / 関連ページ先読みが
+同じ会社サーバへ同時に集中すると、小規模サーバ側で絞られてタイムアウト→slow_hosts 入りになるため、
+全取得経路をここで1ホストあたり max_in_flight 本・rate_per_sec 件/秒（burst まで即時）に抑える。
+
+- 待機は asyncio.Semaphore と asyncio.sleep のみ（ポーリングしない）
+- レート制御は GCRA（予約時刻を進めるだけ）なのでロック不要
+- stats() で待ち回数/待ち時間/最大同時数を取り出せる
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+class _HostState:
+    __slots__ = ("sem", "tat", "in_flight", "waiters")
+
+    def __init__(self, max_in_flight: int) -> None:
+        self.sem = asyncio.Semaphore(max_in_flight)
+        self.tat = 0.0  # 次の取得が「予定どおり」なら許される時刻（GCRA の theoretical arrival time）
+        self.in_flight = 0
+        self.waiters = 0
+
+
+class HostLimiter:
+    def __init__(self, max_in_flight: int = 2, rate_per_sec: float = 4.0, burst: int = 4, max_hosts: int = 4096) -> None:
+        # max_in_flight / rate_per_sec は 0 以下で無制限
+        self.max_in_flight = int(max_in_flight)
+        self.rate_per_sec = float(rate_per_sec)
+        self.burst = max(1, int(burst))
+        self.max_hosts = max(16, int(max_hosts))
+        self._hosts: Dict[str, _HostState] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.acquires = 0
+        self.waited = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.in_flight_max = 0
+
+    def _state(self, host: str) -> _HostState:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphore はイベントループに紐づくため、ループが変わったら作り直す
+            self._hosts = {}
+            self._loop = loop
+        state = self._hosts.get(host)
+        if state is None:
+            if len(self._hosts) >= self.max_hosts:
+                self._prune()
+            state = _HostState(self.max_in_flight if self.max_in_flight > 0 else 1 << 30)
+            self._hosts[host] = state
+        return state
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        idle = [h for h, st in self._hosts.items() if st.in_flight == 0 and st.waiters == 0 and st.tat <= now]
+        for host in idle:
+            self._hosts.pop(host, None)
+
+    def _reserve_delay(self, state: _HostState) -> float:
+        """トークンを1つ予約し、取得開始まで待つべき秒数を返す。"""
+        if self.rate_per_sec <= 0:
+            return 0.0
+        interval = 1.0 / self.rate_per_sec
+        now = time.monotonic()
+        tat = max(state.tat, now)
+        delay = tat - (self.burst - 1) * interval - now
+        state.tat = tat + interval
+        return max(0.0, delay)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[float]:
+        """
+        host への取得1回分の枠を確保する。ブロック内に入るまでに待ったミリ秒を返す。
+        """
+        if not host:
+            yield 0.0
+            return
+        state = self._state(host)
+        started = time.monotonic()
+        state.waiters += 1
+        try:
+            await state.sem.acquire()
+        finally:
+            state.waiters -= 1
+        try:
+            delay = self._reserve_delay(state)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            state.in_flight += 1
+            wait_ms = (time.monotonic() - started) * 1000
+            self.acquires += 1
+            if wait_ms >= 1.0:
+                self.waited += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            self.in_flight_max = max(self.in_flight_max, state.in_flight)
+            try:
+                yield wait_ms
+            finally:
+                state.in_flight -= 1
+        finally:
+            state.sem.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hosts": len(self._hosts),
+            "in_flight": sum(st.in_flight for st in self._hosts.values()),
+            "acquires": self.acquires,
+            "waited": self.waited,
+            "wait_ms_avg": round(self.wait_ms_total / self.acquires, 1) if self.acquires else 0.0,
+            "wait_ms_max": round(self.wait_ms_max, 1),
+            "in_flight_max": self.in_flight_max,
+        }
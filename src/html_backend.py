@@ -0,0 +1,55 @@
+# src/html_backend.py
+"""
+BeautifulSoup のパーサー（tree builder）選択。
+
+HTML_PARSER=html.parser（既定・純Python）/ lxml（C実装。未導入なら html.parser）/ auto（lxml があれば lxml）。
+- 全解析処理（company_scraper / site_validator / ParsedPage / scripts）は make_soup() 経由でパースする
+- lxml が例外を出す入力（壊れた文字/制御文字など）は html.parser でパースし直す
+- CpuStage のワーカーも同じ環境変数を見るので、プロセス間で結果はそろう
+"""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+log = logging.getLogger(__name__)
+
+PARSER_HTML = "html.parser"
+PARSER_LXML = "lxml"
+
+try:
+    import lxml.etree  # noqa: F401
+
+    LXML_AVAILABLE = True
+except Exception:
+    LXML_AVAILABLE = False
+
+
+def resolve_parser(name: Optional[str]) -> str:
+    name = (name or PARSER_HTML).strip().lower()
+    if name == "auto":
+        return PARSER_LXML if LXML_AVAILABLE else PARSER_HTML
+    if name == PARSER_LXML:
+        if LXML_AVAILABLE:
+            return PARSER_LXML
+        log.warning("HTML_PARSER=lxml but lxml is not installed -> html.parser")
+        return PARSER_HTML
+    if name != PARSER_HTML:
+        log.warning("unknown HTML_PARSER=%s -> html.parser", name)
+    return PARSER_HTML
+
+
+HTML_PARSER = resolve_parser(os.getenv("HTML_PARSER", PARSER_HTML))
+
+
+def make_soup(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    backend = parser or HTML_PARSER
+    if backend == PARSER_HTML:
+        return BeautifulSoup(html, PARSER_HTML)
+    try:
+        return BeautifulSoup(html, backend)
+    except Exception:
+        return BeautifulSoup(html, PARSER_HTML)
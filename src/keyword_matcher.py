@@ -0,0 +1,119 @@
+# src/keyword_matcher.py
+"""
+キーワード表（除外ドメイン/非公式キーワード/ディレクトリ文言/役職名/電話タグ等）の部分一致を1本の正規表現でまとめて引く。
+
+`any(k in s for k in KEYWORDS)` を候補ごと・リンクごと・行ごとに回していたため、
+- キーワード表ごとに接頭辞木の形の選択（alternation）を1回だけコンパイルしておく（CompanyScraper のクラス定義時）
+- search() は「どれか1つでも含むか」（従来の any(...) と同じ結果）
+- hits() は1パスで含まれるキーワードを全部返す。各位置で最長一致を拾い、それに含まれる短いキーワードは
+  コンパイル時に求めた包含関係で補うので、重なり合うキーワード（"本社" と "本社所在地" 等）も取りこぼさない
+- ordered_hits() は元の表の順（理由文字列や加点の順序を従来どおりにしたい箇所向け）
+- ignore_case=True は従来の `kw.lower() in text.lower()` と同じ（キーワード/本文とも str.lower() してから照合）
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+
+def _trie_pattern(words: Sequence[str]) -> str:
+    """
+    キーワード群を接頭辞木の形の正規表現にする（"本社|本社所在地|本店" → "本(?:社(?:所在地)?|店)"）。
+    単純な "a|b|c" は各位置で全候補を順に試すが、木の形なら先頭文字で1本に絞れる。量指定子は貪欲なので各位置で最長一致になる。
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: Dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        grouped = "(?:" + "|".join(branches) + ")"
+        return grouped + "?" if terminal else grouped
+
+    return _build(trie)
+
+
+class KeywordMatcher:
+    __slots__ = ("keywords", "ignore_case", "_pattern", "_scan", "_contained")
+
+    def __init__(self, keywords: Iterable[str], *, ignore_case: bool = False) -> None:
+        self.ignore_case = ignore_case
+        ordered: List[str] = []
+        seen: set[str] = set()
+        for kw in keywords:
+            if not kw:
+                continue
+            if kw not in seen:
+                seen.add(kw)
+                ordered.append(kw)
+        self.keywords: Tuple[str, ...] = tuple(ordered)
+
+        # 照合用の形（ignore_case なら小文字）→ 元のキーワード（表記ゆれ "CEO"/"ceo" は両方返す）
+        forms: Dict[str, List[str]] = {}
+        for kw in ordered:
+            forms.setdefault(self._fold(kw), []).append(kw)
+        self._pattern: Optional[re.Pattern[str]] = None
+        self._scan: Optional[re.Pattern[str]] = None
+        self._contained: Dict[str, FrozenSet[str]] = {}
+        if not forms:
+            return
+        by_length = sorted(forms, key=lambda s: (-len(s), s))
+        alternation = _trie_pattern(by_length)
+        self._pattern = re.compile(alternation)
+        self._scan = re.compile(f"(?=({alternation}))")
+        for form in by_length:
+            self._contained[form] = frozenset(
+                kw for other in by_length if other in form for kw in forms[other]
+            )
+
+    def _fold(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def search(self, text: Optional[str]) -> bool:
+        if not text or self._pattern is None:
+            return False
+        return self._pattern.search(self._fold(text)) is not None
+
+    def hits(self, text: Optional[str]) -> FrozenSet[str]:
+        if not text or self._scan is None:
+            return frozenset()
+        found: set[str] = set()
+        contained = self._contained
+        for longest in set(self._scan.findall(self._fold(text))):
+            found |= contained[longest]
+        return frozenset(found)
+
+    def ordered_hits(self, text: Optional[str]) -> List[str]:
+        found = self.hits(text)
+        if not found:
+            return []
+        return [kw for kw in self.keywords if kw in found]
+
+
+class KeywordTagger:
+    """
+    (tag, keywords) の規則表を1つの KeywordMatcher にまとめ、1パスで該当タグを規則の順に返す。
+    """
+
+    __slots__ = ("rules", "matcher")
+
+    def __init__(self, rules: Sequence[Tuple[str, Sequence[str]]], *, ignore_case: bool = False) -> None:
+        self.rules: Tuple[Tuple[str, FrozenSet[str]], ...] = tuple((tag, frozenset(kws)) for tag, kws in rules)
+        self.matcher = KeywordMatcher((kw for _, kws in rules for kw in kws), ignore_case=ignore_case)
+
+    def tags(self, text: Optional[str]) -> List[str]:
+        found = self.matcher.hits(text)
+        if not found:
+            return []
+        return [tag for tag, kws in self.rules if not kws.isdisjoint(found)]
@@ -0,0 +1,228 @@
+# src/page_disk_cache.py
+"""
+get_page_info / _fetch_http_info 用の永続ページキャッシュ（SQLite, 複数プロセス共有可）。
+
+- キーは CompanyScraper._cache_key_url で正規化したURL
+- 本文（html/text）は zlib 圧縮して内容ハッシュ（sha256）で保存し、同一内容は1つにまとめる
+- TTL 超過のエントリは読まない/掃除する。合計サイズが上限を超えたら古いアクセス順に捨てる
+- WAL + busy_timeout で shard 間の同時読み書きに耐える（1操作ごとに接続を開閉する）
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+# get_page_info が最終結果として返したもの（ブラウザ取得を含む）。http 由来より優先する。
+SOURCE_PAGE = "page"
+SOURCE_HTTP = "http"
+
+
+class PageDiskCache:
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttl_sec: int = 3 * 24 * 3600,
+        max_bytes: int = 1024 * 1024 * 1024,
+        evict_every: int = 200,
+        compress_level: int = 6,
+    ) -> None:
+        self.path = (path or "").strip()
+        self.ttl_sec = max(0, int(ttl_sec))
+        self.max_bytes = max(0, int(max_bytes))
+        self.evict_every = max(1, int(evict_every))
+        self.compress_level = min(9, max(1, int(compress_level)))
+        self._puts_since_evict = 0
+        self._ensure_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA busy_timeout=10000")
+        return conn
+
+    def _ensure_tables(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS page_blobs (
+                    digest TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS page_entries (
+                    url_key TEXT PRIMARY KEY,
+                    html_digest TEXT NOT NULL,
+                    text_digest TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_page_entries_last_access ON page_entries(last_access)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _store_blob(self, conn: sqlite3.Connection, value: str) -> str:
+        raw = (value or "").encode("utf-8", errors="ignore")
+        digest = self._digest(raw)
+        exists = conn.execute("SELECT 1 FROM page_blobs WHERE digest=? LIMIT 1", (digest,)).fetchone()
+        if not exists:
+            packed = zlib.compress(raw, self.compress_level)
+            conn.execute(
+                "INSERT OR IGNORE INTO page_blobs(digest, data, size) VALUES(?, ?, ?)",
+                (digest, sqlite3.Binary(packed), len(packed)),
+            )
+        return digest
+
+    @staticmethod
+    def _load_blob(conn: sqlite3.Connection, digest: str) -> Optional[str]:
+        row = conn.execute("SELECT data FROM page_blobs WHERE digest=? LIMIT 1", (digest,)).fetchone()
+        if not row:
+            return None
+        try:
+            return zlib.decompress(bytes(row[0])).decode("utf-8", errors="replace")
+        except Exception:
+            return None
+
+    def get(self, url_key: str, *, sources: tuple[str, ...] = (SOURCE_PAGE, SOURCE_HTTP)) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュ済みの {"text","html","source"} を返す。無い/期限切れ/破損時は None。
+        """
+        if not url_key:
+            return None
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT html_digest, text_digest, source, created_at FROM page_entries WHERE url_key=? LIMIT 1",
+                (url_key,),
+            ).fetchone()
+            if not row:
+                return None
+            html_digest, text_digest, source, created_at = row
+            if source not in sources:
+                return None
+            if self.ttl_sec > 0 and now - float(created_at or 0) > self.ttl_sec:
+                return None
+            html = self._load_blob(conn, html_digest)
+            text = self._load_blob(conn, text_digest)
+            if html is None or text is None:
+                return None
+            conn.execute("UPDATE page_entries SET last_access=? WHERE url_key=?", (now, url_key))
+            conn.commit()
+            return {"text": text, "html": html, "source": source}
+        finally:
+            conn.close()
+
+    def put(self, url_key: str, *, html: str, text: str, source: str = SOURCE_PAGE) -> None:
+        """
+        保存。http 由来の結果で page 由来の結果を上書きしない。
+        """
+        if not url_key or not ((html or "").strip() or (text or "").strip()):
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            html_digest = self._store_blob(conn, html or "")
+            text_digest = self._store_blob(conn, text or "")
+            conn.execute(
+                """
+                INSERT INTO page_entries(url_key, html_digest, text_digest, source, created_at, last_access)
+                VALUES(?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    html_digest=excluded.html_digest,
+                    text_digest=excluded.text_digest,
+                    source=excluded.source,
+                    created_at=excluded.created_at,
+                    last_access=excluded.last_access
+                WHERE page_entries.source != 'page' OR excluded.source = 'page'
+                    OR page_entries.created_at < ?
+                """,
+                (url_key, html_digest, text_digest, source, now, now, now - self.ttl_sec if self.ttl_sec > 0 else 0),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        self._puts_since_evict += 1
+        if self._puts_since_evict >= self.evict_every:
+            self._puts_since_evict = 0
+            try:
+                self.evict()
+            except Exception:
+                log.debug("page disk cache eviction failed", exc_info=True)
+
+    def evict(self) -> int:
+        """
+        期限切れエントリを消し、合計サイズが上限を超えていれば last_access の古い順に消す。
+        消したエントリ数を返す。
+        """
+        removed = 0
+        conn = self._connect()
+        try:
+            if self.ttl_sec > 0:
+                cur = conn.execute("DELETE FROM page_entries WHERE created_at < ?", (time.time() - self.ttl_sec,))
+                removed += max(0, cur.rowcount or 0)
+            self._delete_orphan_blobs(conn)
+            if self.max_bytes > 0:
+                total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM page_blobs").fetchone()[0] or 0)
+                while total > self.max_bytes:
+                    # 古い順に、解放見込みサイズが超過分に達するまでまとめて消す
+                    excess = total - self.max_bytes
+                    keys: list[str] = []
+                    freed = 0
+                    for url_key, size in conn.execute(
+                        """
+                        SELECT e.url_key, COALESCE(h.size, 0) + COALESCE(t.size, 0)
+                          FROM page_entries e
+                          LEFT JOIN page_blobs h ON h.digest = e.html_digest
+                          LEFT JOIN page_blobs t ON t.digest = e.text_digest
+                         ORDER BY e.last_access ASC
+                         LIMIT 500
+                        """
+                    ):
+                        keys.append(url_key)
+                        freed += int(size or 0)
+                        if freed >= excess:
+                            break
+                    if not keys:
+                        break
+                    conn.executemany("DELETE FROM page_entries WHERE url_key=?", [(k,) for k in keys])
+                    removed += len(keys)
+                    self._delete_orphan_blobs(conn)
+                    total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM page_blobs").fetchone()[0] or 0)
+            conn.commit()
+        finally:
+            conn.close()
+        return removed
+
+    @staticmethod
+    def _delete_orphan_blobs(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            DELETE FROM page_blobs
+             WHERE digest NOT IN (SELECT html_digest FROM page_entries)
+               AND digest NOT IN (SELECT text_digest FROM page_entries)
+            """
+        )
@@ -0,0 +1,182 @@
+# src/page_memory_cache.py
+"""
+CompanyScraper.page_cache 用のバイト上限付き LRU。
+
+- html/text 本体とスクショ(PNG等)は別々の予算で管理する（スクショは大きく、必要な場面が限られるため）
+- dict と同じ使い方（get / [] / in / pop / len / clear）ができるようにし、呼び出し側は従来どおり
+  {"url","text","html","screenshot"} を出し入れする
+- hit/miss/eviction を数え、stats() で取り出せる
+- parsed(html) は同じ HTML の ParsedPage（1回だけパースした soup 等）を少数だけ LRU で持ち、解析処理間で共有する。
+  エントリが捨てられたらその HTML の ParsedPage も捨てる（soup は HTML の数倍のメモリを使うため件数で別に絞る）
+"""
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Iterator
+
+from .parsed_page import ParsedPage
+
+
+def _value_size(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes, bytearray)):
+        return sys.getsizeof(value)
+    return 64
+
+
+class PageMemoryCache:
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_screenshot_bytes: int = 64 * 1024 * 1024,
+        max_parsed: int = 8,
+    ) -> None:
+        # 0以下は無制限（max_parsed は 0 で共有しない）
+        self.max_bytes = int(max_bytes)
+        self.max_screenshot_bytes = int(max_screenshot_bytes)
+        self.max_parsed = max(0, int(max_parsed))
+        self._parsed: "OrderedDict[str, ParsedPage]" = OrderedDict()
+        self.parsed_hits = 0
+        self.parsed_misses = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._entry_sizes: Dict[str, int] = {}
+        self._shots: "OrderedDict[str, bytes]" = OrderedDict()
+        self.bytes_used = 0
+        self.screenshot_bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.screenshot_evictions = 0
+
+    # ---- dict 互換 ----
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        shot = self._shots.get(key, b"")
+        if shot:
+            self._shots.move_to_end(key)
+        return {**entry, "screenshot": shot}
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        return {**entry, "screenshot": self._shots.get(key, b"")}
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        value = dict(value or {})
+        shot = value.pop("screenshot", b"") or b""
+        self._drop_entry(key)
+        size = sum(_value_size(v) for v in value.values()) + sys.getsizeof(key)
+        self._entries[key] = value
+        self._entry_sizes[key] = size
+        self.bytes_used += size
+        if shot:
+            self._drop_shot(key)
+            self._shots[key] = shot
+            self.screenshot_bytes_used += len(shot)
+        elif key in self._shots:
+            # スクショなしで上書きされた場合も、同一URLの既存スクショは残す
+            self._shots.move_to_end(key)
+        self._evict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries.keys()))
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        if key not in self._entries:
+            return default
+        value = {**self._entries[key], "screenshot": self._shots.get(key, b"")}
+        self._drop_entry(key)
+        self._drop_shot(key)
+        return value
+
+    def parsed(self, html: str) -> ParsedPage:
+        """html の ParsedPage を返す（同じ HTML なら同じインスタンス）。キーは HTML 文字列そのもの（ハッシュは str 側で保持される）。"""
+        html = html or ""
+        if not html or self.max_parsed <= 0:
+            return ParsedPage(html)
+        page = self._parsed.get(html)
+        if page is not None:
+            self.parsed_hits += 1
+            self._parsed.move_to_end(html)
+            return page
+        self.parsed_misses += 1
+        page = ParsedPage(html)
+        self._parsed[html] = page
+        while len(self._parsed) > self.max_parsed:
+            self._parsed.popitem(last=False)
+        return page
+
+    def clear(self) -> None:
+        self._parsed.clear()
+        self._entries.clear()
+        self._entry_sizes.clear()
+        self._shots.clear()
+        self.bytes_used = 0
+        self.screenshot_bytes_used = 0
+
+    # ---- 内部 ----
+    def _drop_entry(self, key: str) -> None:
+        if key in self._entries:
+            entry = self._entries.pop(key, None) or {}
+            self.bytes_used -= self._entry_sizes.pop(key, 0)
+            html = entry.get("html")
+            if html and isinstance(html, str):
+                self._parsed.pop(html, None)
+
+    def _drop_shot(self, key: str) -> None:
+        shot = self._shots.pop(key, None)
+        if shot:
+            self.screenshot_bytes_used -= len(shot)
+
+    def _evict(self) -> None:
+        if self.max_screenshot_bytes > 0:
+            while self._shots and self.screenshot_bytes_used > self.max_screenshot_bytes:
+                old_key = next(iter(self._shots))
+                self._drop_shot(old_key)
+                self.screenshot_evictions += 1
+        if self.max_bytes > 0:
+            # 直近に入れた1件は上限を超えていても残す（巨大ページで即消えるのを避ける）
+            while len(self._entries) > 1 and self.bytes_used > self.max_bytes:
+                old_key = next(iter(self._entries))
+                self._drop_entry(old_key)
+                self._drop_shot(old_key)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "mb": round(self.bytes_used / (1024 * 1024), 1),
+            "screenshots": len(self._shots),
+            "screenshot_mb": round(self.screenshot_bytes_used / (1024 * 1024), 1),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "screenshot_evictions": self.screenshot_evictions,
+            "parsed_pages": len(self._parsed),
+            "parsed_hits": self.parsed_hits,
+            "parsed_misses": self.parsed_misses,
+        }
+
+    @classmethod
+    def from_mb(cls, max_mb: float, max_screenshot_mb: float, max_parsed: int = 8) -> "PageMemoryCache":
+        return cls(
+            max_bytes=int(float(max_mb) * 1024 * 1024),
+            max_screenshot_bytes=int(float(max_screenshot_mb) * 1024 * 1024),
+            max_parsed=max_parsed,
+        )
+
@@ -0,0 +1,118 @@
+# src/parsed_page.py
+"""
+1ページ分の HTML を1回だけパースして、各解析処理（公式判定/ページ分類/候補抽出/リンク選別/社名シグナル）で共有する。
+
+同じ HTML を _meta_strings / _extract_jsonld_objects / _detect_directory_like / _compute_official_evidence /
+_rank_links / _find_priority_links / classify_page_type / extract_candidates / extract_name_signals が
+それぞれ BeautifulSoup で作り直していたため、
+- soup は初回アクセス時にだけ作る（パース失敗/空 HTML は None）。共有するので呼び出し側で変更しないこと
+- title / 全文テキスト / アンカー一覧は soup から一度だけ取り出して覚える
+- 解析処理ごとの派生値（メタ文字列, JSON-LD, 本文クリーニング結果など）は memo(key, factory) で覚える
+- 解析メソッドは従来どおり str も受け付ける（as_parsed_page で都度 ParsedPage にする＝従来と同じ1回パース）
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+from .html_backend import make_soup
+
+
+class Anchor(NamedTuple):
+    href: str
+    text: str  # get_text(separator=" ", strip=True)
+    title: str
+    node: Tag
+
+
+class ParsedPage:
+    __slots__ = ("html", "_soup", "_parsed", "_title", "_text", "_anchors", "_memo")
+
+    def __init__(self, html: str) -> None:
+        self.html = html or ""
+        self._soup: Optional[BeautifulSoup] = None
+        self._parsed = False
+        self._title: Optional[str] = None
+        self._text: Optional[str] = None
+        self._anchors: Optional[List[Anchor]] = None
+        self._memo: Dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.html)
+
+    def __len__(self) -> int:
+        return len(self.html)
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        if not self._parsed:
+            self._parsed = True
+            if self.html:
+                try:
+                    self._soup = make_soup(self.html)
+                except Exception:
+                    self._soup = None
+        return self._soup
+
+    @property
+    def title(self) -> str:
+        """<title> の文字列（無ければ空）。前後の空白はそのまま。"""
+        if self._title is None:
+            soup = self.soup
+            self._title = str(soup.title.string) if soup is not None and soup.title and soup.title.string else ""
+        return self._title
+
+    @property
+    def text(self) -> str:
+        """soup.get_text(" ", strip=True)（ノイズ除去なしの全文）。"""
+        if self._text is None:
+            soup = self.soup
+            try:
+                self._text = soup.get_text(" ", strip=True) if soup is not None else ""
+            except Exception:
+                self._text = ""
+        return self._text
+
+    @property
+    def anchors(self) -> List[Anchor]:
+        """href を持つ <a> の一覧（文書順）。"""
+        if self._anchors is None:
+            anchors: List[Anchor] = []
+            soup = self.soup
+            if soup is not None:
+                try:
+                    for node in soup.find_all("a", href=True):
+                        anchors.append(
+                            Anchor(
+                                node.get("href") or "",
+                                node.get_text(separator=" ", strip=True) or "",
+                                node.get("title") or "",
+                                node,
+                            )
+                        )
+                except Exception:
+                    anchors = []
+            self._anchors = anchors
+        return self._anchors
+
+    def memo(self, key: str, factory: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
+
+
+HtmlLike = Union[str, ParsedPage, None]
+
+
+def as_parsed_page(html: HtmlLike) -> ParsedPage:
+    if isinstance(html, ParsedPage):
+        return html
+    return ParsedPage(html or "")
+
+
+def html_of(html: HtmlLike) -> str:
+    if isinstance(html, ParsedPage):
+        return html.html
+    return html or ""
@@ -0,0 +1,256 @@
+# src/pdf_extractor.py
+"""
+PDF テキスト抽出をプロセスプールへ逃がす。
+
+pypdf の抽出は純 Python で重く、大きな会社案内 PDF だとイベントループを数秒止めて他の取得が全部待たされるため、
+- 抽出は別プロセス（spawn, max_workers 本）で行い、ループは await するだけにする
+- バイト数上限を超える PDF は開かない / 先頭 max_pages ページだけ読む
+- 1文書あたり timeout_sec を超えたらワーカーを止めてプールを作り直す（pypdf の無限ループ対策）。
+  止めるのはその文書を投げたプールがまだ現役のときだけ。巻き添えで BrokenProcessPool になった他の抽出は新しいプールで1回だけやり直す
+- ワーカーの起動（spawn で数秒）は warm() / 初回呼び出しで先に済ませ、timeout_sec には数えない
+- 同じ内容（sha256）の PDF は LRU キャッシュから返す（同じ PDF が複数 URL から張られていることが多い）
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import re
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from .spawn_pool import new_spawn_pool, warm_pool
+
+log = logging.getLogger(__name__)
+
+
+def extract_pdf_text(raw: bytes, max_pages: int = 0) -> str:
+    """
+    PDF(bytes)からテキスト抽出（pypdf が利用可能な場合のみ）。ワーカープロセスからも呼ばれる。
+    - max_pages > 0 なら先頭 max_pages ページだけ読む
+    - 失敗時は空文字（システム全体を落とさない）
+    """
+    if not raw:
+        return ""
+    try:
+        from pypdf import PdfReader  # type: ignore
+    except Exception:
+        return ""
+    try:
+        reader = PdfReader(io.BytesIO(raw))
+    except Exception:
+        return ""
+    texts: list[str] = []
+    try:
+        for idx, page in enumerate(getattr(reader, "pages", []) or []):
+            if max_pages > 0 and idx >= max_pages:
+                break
+            try:
+                t = page.extract_text() or ""
+            except Exception:
+                t = ""
+            if t:
+                texts.append(t)
+    except Exception:
+        return ""
+    joined = "\n".join(texts)
+    joined = unicodedata.normalize("NFKC", joined)
+    joined = re.sub(r"\s+", " ", joined).strip()
+    return joined
+
+
+class PdfTextExtractor:
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        max_pages: int = 30,
+        max_bytes: int = 8_000_000,
+        timeout_sec: float = 20.0,
+        cache_size: int = 256,
+    ) -> None:
+        # max_workers=0 はプロセスを使わずスレッドで抽出する（タイムアウト時に止められない点に注意）
+        self.max_workers = max(0, int(max_workers))
+        self.max_pages = max(0, int(max_pages))
+        self.max_bytes = max(0, int(max_bytes))
+        self.timeout_sec = max(0.0, float(timeout_sec))
+        self.cache_size = max(0, int(cache_size))
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._ready: Optional["asyncio.Future[int]"] = None
+        self._ready_for: Optional[ProcessPoolExecutor] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.extracted = 0
+        self.cache_hits = 0
+        self.skipped_large = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.retries = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = new_spawn_pool(self.max_workers)
+        return self._executor
+
+    async def _wait_ready(self, executor: ProcessPoolExecutor) -> None:
+        """ワーカーの起動を待つ。同じプールにつき1回だけ（複数の呼び出しで共有する）。"""
+        if self._ready_for is not executor or self._ready is None:
+            self._ready_for = executor
+            self._ready = asyncio.ensure_future(warm_pool(executor, self.max_workers))
+        await asyncio.shield(self._ready)
+
+    async def warm(self) -> None:
+        """ワーカーを先に起動しておく（起動時間を1件目の抽出のタイムアウトに含めない）。"""
+        if self.max_workers <= 0:
+            return
+        self._get_semaphore()
+        try:
+            await self._wait_ready(self._get_executor())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.debug("pdf worker warm-up failed", exc_info=True)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            self._sem = asyncio.Semaphore(max(1, self.max_workers))
+            self._loop = loop
+            self._inflight = {}
+            self._ready = None
+            self._ready_for = None
+        return self._sem
+
+    def _kill_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        タイムアウトしたワーカーは止められないので、プールごと捨てる（次回呼び出しで作り直す）。
+        既に作り直された後なら何もしない（新しいプールを巻き添えにしない）。
+        """
+        if executor is None or self._executor is not executor:
+            return
+        self._executor = None
+        for proc in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+        try:
+            executor.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+
+    def _drop_broken_executor(self, executor: ProcessPoolExecutor) -> None:
+        """ワーカーが落ちて壊れたプールを捨てる（現役のときだけ。ワーカーは既にいないので terminate はしない）。"""
+        if executor is None or self._executor is not executor:
+            return
+        self._executor = None
+        try:
+            executor.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        text = self._cache.get(key)
+        if text is not None:
+            self._cache.move_to_end(key)
+        return text
+
+    def _cache_put(self, key: str, text: str) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _run(self, raw: bytes, executor: Optional[ProcessPoolExecutor]) -> str:
+        if executor is None:
+            return await asyncio.to_thread(extract_pdf_text, raw, self.max_pages)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, extract_pdf_text, raw, self.max_pages)
+
+    async def extract(self, raw: bytes) -> str:
+        if not raw:
+            return ""
+        if self.max_bytes > 0 and len(raw) > self.max_bytes:
+            self.skipped_large += 1
+            log.info("[pdf] skip extraction (%d bytes > %d)", len(raw), self.max_bytes)
+            return ""
+        key = hashlib.sha256(raw).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        sem = self._get_semaphore()
+        pending = self._inflight.get(key)
+        if pending is not None:
+            # 同じ PDF の抽出が進行中なら結果を待つだけにする
+            self.cache_hits += 1
+            return await asyncio.shield(pending)
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        text = ""
+        try:
+            async with sem:
+                for attempt in range(2):
+                    executor: Optional[ProcessPoolExecutor] = None
+                    try:
+                        if self.max_workers > 0:
+                            executor = self._get_executor()
+                            # 起動待ちは timeout_sec の外で行う
+                            await self._wait_ready(executor)
+                        if self.timeout_sec > 0:
+                            text = await asyncio.wait_for(self._run(raw, executor), timeout=self.timeout_sec)
+                        else:
+                            text = await self._run(raw, executor)
+                        self.extracted += 1
+                        self._cache_put(key, text)
+                    except asyncio.TimeoutError:
+                        self.timeouts += 1
+                        log.warning("[pdf] extraction timed out after %.1fs (%d bytes)", self.timeout_sec, len(raw))
+                        if executor is not None:
+                            self._kill_executor(executor)
+                        # 壊れた/重すぎる PDF を何度も開かないよう空文字で覚える
+                        self._cache_put(key, "")
+                    except asyncio.CancelledError:
+                        raise
+                    except BrokenProcessPool:
+                        if attempt == 0 and executor is not None and executor is not self._executor:
+                            # 他の文書のタイムアウトでプールが作り直された巻き添え。新しいプールで1回だけやり直す
+                            self.retries += 1
+                            continue
+                        self.failures += 1
+                        log.debug("pdf extraction failed (broken pool)", exc_info=True)
+                        if executor is not None:
+                            self._drop_broken_executor(executor)
+                    except Exception:
+                        self.failures += 1
+                        log.debug("pdf extraction failed", exc_info=True)
+                    break
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(text)
+        return text
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "extracted": self.extracted,
+            "cache_hits": self.cache_hits,
+            "cache_entries": len(self._cache),
+            "skipped_large": self.skipped_large,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "retries": self.retries,
+        }
+
+    def close(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+# src/process_rss.py
+"""
+プロセス（とその子孫）の合計 RSS を測る。
+
+- process_tree_rss_bytes(): 自プロセスと子孫プロセス（Playwright ドライバ / Chromium）の合計
+- chromium_root_pids() / pids_tree_rss_bytes(): 自分の子孫のうち Chromium の親プロセスを特定し、その配下だけを測る
+  （ブラウザ作り直しの判定用。同じツリーにいる Python 本体や PDF/CPU ワーカーの RSS を数えない）
+- psutil が入っていればそれを使い、無ければ Linux の /proc を直接読む
+- どちらも使えない環境（macOS で psutil 無し等）では 0 / 空集合を返す（＝RSS 条件は発火しない）
+"""
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import psutil as _psutil  # type: ignore
+except Exception:
+    _psutil = None
+
+# Chromium 系のプロセス名（chrome / chromium / headless_shell。/proc の comm は15文字で切れる）
+_CHROMIUM_NAME_MARKERS = ("chrom", "headless_shell")
+
+# pid -> (ppid, name, rss_bytes)
+_ProcTable = Dict[int, Tuple[int, str, int]]
+
+
+def _table_psutil() -> _ProcTable:
+    table: _ProcTable = {}
+    for p in _psutil.process_iter(["pid", "ppid", "name", "memory_info"]):
+        try:
+            info = p.info
+            mem = info.get("memory_info")
+            table[int(info["pid"])] = (int(info.get("ppid") or 0), str(info.get("name") or ""), int(mem.rss) if mem else 0)
+        except Exception:
+            continue
+    return table
+
+
+def _table_proc() -> _ProcTable:
+    if not os.path.isdir("/proc"):
+        return {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    table: _ProcTable = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r", encoding="utf-8", errors="replace") as f:
+                stat = f.read()
+            # comm に空白や括弧が入ることがあるため、最後の ")" 以降を分割する（state, ppid, ... rss は24番目）
+            name = stat[stat.find("(") + 1 : stat.rfind(")")]
+            fields = stat[stat.rfind(")") + 2 :].split()
+            table[int(entry)] = (int(fields[1]), name, int(fields[21]) * page_size)
+        except Exception:
+            continue
+    return table
+
+
+def _process_table() -> _ProcTable:
+    try:
+        if _psutil is not None:
+            return _table_psutil()
+        return _table_proc()
+    except Exception:
+        return {}
+
+
+def _descendants(table: _ProcTable, roots: Iterable[int]) -> Set[int]:
+    children: Dict[int, List[int]] = defaultdict(list)
+    for pid, (ppid, _, _) in table.items():
+        children[ppid].append(pid)
+    seen: Set[int] = set()
+    stack = list(roots)
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, ()))
+    return seen
+
+
+def _is_chromium(name: str) -> bool:
+    lowered = name.lower()
+    return any(marker in lowered for marker in _CHROMIUM_NAME_MARKERS)
+
+
+def pids_tree_rss_bytes(root_pids: Iterable[int]) -> int:
+    """root_pids とその子孫の合計 RSS（終了済みの pid は数えない）。"""
+    roots = [int(pid) for pid in root_pids]
+    if not roots:
+        return 0
+    table = _process_table()
+    return sum(table[pid][2] for pid in _descendants(table, roots) if pid in table)
+
+
+def chromium_root_pids(root_pid: Optional[int] = None) -> Set[int]:
+    """
+    root_pid（既定は自プロセス）の子孫のうち、親が Chromium でない Chromium プロセス（＝ブラウザ本体）の pid。
+    起動前後の差を取れば、そのとき起動したブラウザだけを特定できる。
+    """
+    root = int(root_pid or os.getpid())
+    table = _process_table()
+    roots: Set[int] = set()
+    for pid in _descendants(table, [root]):
+        entry = table.get(pid)
+        if entry is None or not _is_chromium(entry[1]):
+            continue
+        parent = table.get(entry[0])
+        if parent is None or not _is_chromium(parent[1]):
+            roots.add(pid)
+    return roots
+
+
+def process_tree_rss_bytes(root_pid: Optional[int] = None) -> int:
+    return pids_tree_rss_bytes([int(root_pid or os.getpid())])
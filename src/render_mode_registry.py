@@ -0,0 +1,124 @@
+# src/render_mode_registry.py
+"""
+ホストごとの「HTTP取得で足りるか / ブラウザ描画が必要か」の記憶（slow_hosts と同様のテキストファイル永続化）。
+
+- get_page_info が HTTP 取得で十分だった → http、HTTP が薄くブラウザで本文が大きく増えた → browser として数える
+- 同じ判定が min_hits 回以上たまり、反対の判定より多いホストだけ mode を確定する（1回の偶然で決めない）
+- ファイルは1行1ホスト: host,last_ts,http_count,browser_count
+- 書き出しは mode が変わったときと flush() 時のみ。書き出し前に他 shard が書いた行を読み直してマージする
+"""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+log = logging.getLogger(__name__)
+
+MODE_HTTP = "http"
+MODE_BROWSER = "browser"
+
+
+class RenderModeRegistry:
+    def __init__(self, path: str = "", *, min_hits: int = 2, ttl_sec: int = 14 * 24 * 3600) -> None:
+        self.path = (path or "").strip()
+        self.min_hits = max(1, int(min_hits))
+        self.ttl_sec = max(0, int(ttl_sec))
+        self.hosts: Dict[str, Dict[str, int]] = {}
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[tuple[str, Dict[str, int]]]:
+        parts = [p.strip() for p in line.strip().split(",")]
+        if len(parts) < 4 or not parts[0]:
+            return None
+        try:
+            return parts[0], {
+                "last_ts": int(float(parts[1])),
+                "http": max(0, int(float(parts[2]))),
+                "browser": max(0, int(float(parts[3]))),
+            }
+        except Exception:
+            return None
+
+    def _read_file(self) -> Dict[str, Dict[str, int]]:
+        out: Dict[str, Dict[str, int]] = {}
+        if not self.path or not os.path.exists(self.path):
+            return out
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                parsed = self._parse_line(line)
+                if parsed:
+                    out[parsed[0]] = parsed[1]
+        return out
+
+    def _merge(self, other: Dict[str, Dict[str, int]]) -> None:
+        for host, meta in other.items():
+            cur = self.hosts.get(host)
+            if cur is None:
+                self.hosts[host] = dict(meta)
+                continue
+            cur["http"] = max(cur["http"], meta["http"])
+            cur["browser"] = max(cur["browser"], meta["browser"])
+            cur["last_ts"] = max(cur["last_ts"], meta["last_ts"])
+
+    def _prune(self) -> None:
+        if self.ttl_sec <= 0:
+            return
+        now_ts = int(time.time())
+        for host in [h for h, m in self.hosts.items() if now_ts - int(m.get("last_ts", 0)) > self.ttl_sec]:
+            self.hosts.pop(host, None)
+
+    def load(self) -> None:
+        try:
+            self._merge(self._read_file())
+            self._prune()
+        except Exception:
+            log.warning("failed to load render modes", exc_info=True)
+
+    def mode(self, host: str) -> str:
+        """確定した mode（"http" / "browser"）。未確定なら ""。"""
+        meta = self.hosts.get(host or "")
+        if not meta:
+            return ""
+        if self.ttl_sec > 0 and int(time.time()) - int(meta.get("last_ts", 0)) > self.ttl_sec:
+            self.hosts.pop(host, None)
+            return ""
+        http_count = int(meta.get("http", 0))
+        browser_count = int(meta.get("browser", 0))
+        if browser_count >= self.min_hits and browser_count > http_count:
+            return MODE_BROWSER
+        if http_count >= self.min_hits and browser_count == 0:
+            return MODE_HTTP
+        return ""
+
+    def record(self, host: str, mode: str) -> None:
+        if not host or mode not in (MODE_HTTP, MODE_BROWSER):
+            return
+        before = self.mode(host)
+        meta = self.hosts.setdefault(host, {"last_ts": 0, "http": 0, "browser": 0})
+        meta[mode] = int(meta.get(mode, 0)) + 1
+        meta["last_ts"] = int(time.time())
+        self._dirty = True
+        after = self.mode(host)
+        if after != before:
+            log.info("[render_mode] %s -> %s (http=%d browser=%d)", host, after or "-", meta["http"], meta["browser"])
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        try:
+            self._merge(self._read_file())
+            self._prune()
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for host, meta in sorted(self.hosts.items()):
+                    f.write(f"{host},{int(meta['last_ts'])},{int(meta['http'])},{int(meta['browser'])}\n")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception:
+            log.debug("failed to persist render modes", exc_info=True)
@@ -0,0 +1,123 @@
+# src/screenshot_profile.py
+"""
+AI 判定用スクリーンショットの撮り方（高さ上限・縮小・JPEG/WebP・要素切り出し）。
+
+full_page の PNG は縦長ページで数MBになり、撮影時間・page_cache のメモリ・Gemini への送信時間を圧迫するため、
+- 高さは max_height で打ち切る（上から。会社概要/フッター以外の長い本文は判定にほぼ不要）
+- crop_selectors のいずれかが見つかれば、その要素だけを撮る（会社概要テーブルやフッター）
+- 形式は jpeg/webp/png。webp と scale<1 の縮小は Pillow があるときだけ（無ければ jpeg・等倍で撮る）
+"""
+from __future__ import annotations
+
+import io
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+try:
+    from PIL import Image as _PILImage  # type: ignore
+except Exception:
+    _PILImage = None
+
+log = logging.getLogger(__name__)
+
+_FORMATS = ("png", "jpeg", "webp")
+
+
+def pillow_available() -> bool:
+    return _PILImage is not None
+
+
+def image_mime_type(data: bytes) -> str:
+    """先頭バイトから画像の MIME type を返す（不明なら image/png）。"""
+    head = bytes(data[:12]) if data else b""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+@dataclass(frozen=True)
+class ScreenshotProfile:
+    """
+    - image_format: png / jpeg / webp
+    - quality: jpeg/webp の品質（1-100）
+    - max_height: 撮影する高さの上限（px, 0以下で全体）
+    - scale: 縮小率（0<scale<=1。1未満は Pillow がある場合のみ有効）
+    - crop_selectors: 見つかった最初の要素だけを撮る CSS セレクタ（カンマ区切りではなく優先順のタプル）
+    """
+
+    image_format: str = "jpeg"
+    quality: int = 60
+    max_height: int = 4000
+    scale: float = 1.0
+    crop_selectors: Tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        image_format: str = "jpeg",
+        quality: int = 60,
+        max_height: int = 4000,
+        scale: float = 1.0,
+        crop_selectors: str = "",
+    ) -> "ScreenshotProfile":
+        fmt = (image_format or "jpeg").strip().lower()
+        if fmt == "jpg":
+            fmt = "jpeg"
+        if fmt not in _FORMATS:
+            fmt = "jpeg"
+        if fmt == "webp" and _PILImage is None:
+            log.info("[screenshot] Pillow が無いため webp ではなく jpeg で撮影します")
+            fmt = "jpeg"
+        try:
+            scale_val = float(scale)
+        except Exception:
+            scale_val = 1.0
+        scale_val = min(1.0, max(0.1, scale_val))
+        if scale_val < 1.0 and _PILImage is None:
+            log.info("[screenshot] Pillow が無いため縮小（scale=%.2f）は行いません", scale_val)
+            scale_val = 1.0
+        selectors = tuple(s.strip() for s in (crop_selectors or "").split("|") if s.strip())
+        return cls(
+            image_format=fmt,
+            quality=min(100, max(1, int(quality))),
+            max_height=max(0, int(max_height)),
+            scale=scale_val,
+            crop_selectors=selectors,
+        )
+
+    @property
+    def needs_postprocess(self) -> bool:
+        return self.image_format == "webp" or self.scale < 1.0
+
+    def capture_options(self) -> Dict[str, Any]:
+        """Playwright の screenshot() に渡す type/quality。後処理する場合は劣化を避けて png で撮る。"""
+        if self.needs_postprocess or self.image_format == "png":
+            return {"type": "png"}
+        return {"type": "jpeg", "quality": self.quality}
+
+    def postprocess(self, data: bytes) -> bytes:
+        """縮小/webp 変換（Pillow 必須）。失敗時は元の画像を返す。"""
+        if not data or not self.needs_postprocess or _PILImage is None:
+            return data
+        try:
+            with _PILImage.open(io.BytesIO(data)) as img:
+                if self.scale < 1.0:
+                    width = max(1, int(img.width * self.scale))
+                    height = max(1, int(img.height * self.scale))
+                    img = img.resize((width, height))
+                if img.mode not in ("RGB", "L"):
+                    img = img.convert("RGB")
+                out = io.BytesIO()
+                if self.image_format == "webp":
+                    img.save(out, format="WEBP", quality=self.quality)
+                elif self.image_format == "jpeg":
+                    img.save(out, format="JPEG", quality=self.quality)
+                else:
+                    img.save(out, format="PNG", optimize=True)
+                return out.getvalue()
+        except Exception:
+            log.debug("screenshot postprocess failed", exc_info=True)
+            return data
@@ -0,0 +1,379 @@
+# src/search_engine_health.py
+"""
+検索エンジンごとの健全性（レイテンシ/チャレンジ率/429率）とサーキットブレーカー。
+
+Startpage がチャレンジを返している間も、毎社 3エンドポイント×3回＋バックオフの再試行を払ってからプロキシへ落ちていたため、
+- リクエスト1回ごとの結果（ok/challenge/rate_limited/error）とレイテンシを EWMA で持つ
+- 連続失敗 failure_threshold 回、または失敗率 EWMA が failure_rate_open 以上（min_samples 件以上）でサーキットを開く
+- 開いている間（open_sec, 再度開くたびに倍・max_open_sec まで）はそのエンジンの直接取得を飛ばす
+- 期限後の最初の1回が成功すれば閉じ、失敗すれば開き直す（half-open）
+- order() は「開いていない→速くて失敗の少ない順」に並べ替える（差が bucket_ms 未満なら設定順のまま）
+- path を指定すると SQLite で他 worker と共有する（worker ごとに1行）
+  - 判定（is_open/open_until/order）はメモリ上の状態だけを見る（イベントループ上で SQLite を触らない）
+  - 書き込み/他 worker 分の読み込みは flush_async()/refresh_async() で to_thread に逃がす。
+    開閉は record() がその場で非同期 flush を予約し、統計は refresh_sec ごとのバックグラウンドタスク（ensure_refresher）で書く/読む
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+log = logging.getLogger(__name__)
+
+OUTCOME_OK = "ok"
+OUTCOME_CHALLENGE = "challenge"
+OUTCOME_RATE_LIMITED = "rate_limited"
+OUTCOME_ERROR = "error"
+
+
+class _EngineState:
+    __slots__ = (
+        "samples",
+        "latency_ewma_ms",
+        "failure_ewma",
+        "challenge_ewma",
+        "rate_limit_ewma",
+        "consecutive_failures",
+        "open_until",
+        "open_count",
+    )
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.latency_ewma_ms = 0.0
+        self.failure_ewma = 0.0
+        self.challenge_ewma = 0.0
+        self.rate_limit_ewma = 0.0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.open_count = 0
+
+
+class SearchEngineHealth:
+    def __init__(
+        self,
+        path: str = "",
+        *,
+        worker_id: str = "",
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        failure_rate_open: float = 0.6,
+        min_samples: int = 5,
+        open_sec: float = 120.0,
+        max_open_sec: float = 1800.0,
+        default_latency_ms: float = 3000.0,
+        bucket_ms: float = 1000.0,
+        refresh_sec: float = 5.0,
+        stale_sec: float = 900.0,
+    ) -> None:
+        self.path = (path or "").strip()
+        self.worker_id = worker_id or f"pid{os.getpid()}"
+        self.alpha = min(1.0, max(0.01, float(alpha)))
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.failure_rate_open = float(failure_rate_open)
+        self.min_samples = max(1, int(min_samples))
+        self.open_sec = max(1.0, float(open_sec))
+        self.max_open_sec = max(self.open_sec, float(max_open_sec))
+        self.default_latency_ms = max(1.0, float(default_latency_ms))
+        self.bucket_ms = max(1.0, float(bucket_ms))
+        self.refresh_sec = max(0.0, float(refresh_sec))
+        self.stale_sec = max(1.0, float(stale_sec))
+        self._engines: Dict[str, _EngineState] = {}
+        self._remote: Dict[str, List[Dict[str, float]]] = {}
+        self._dirty = False
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.circuit_opens = 0
+        if self.path:
+            self._ensure_tables()
+
+    # ---- 永続化（任意） ----
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA busy_timeout=10000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _ensure_tables(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS engine_health (
+                    engine TEXT NOT NULL,
+                    worker TEXT NOT NULL,
+                    samples INTEGER NOT NULL DEFAULT 0,
+                    latency_ewma_ms REAL NOT NULL DEFAULT 0,
+                    failure_ewma REAL NOT NULL DEFAULT 0,
+                    challenge_ewma REAL NOT NULL DEFAULT 0,
+                    rate_limit_ewma REAL NOT NULL DEFAULT 0,
+                    open_until REAL NOT NULL DEFAULT 0,
+                    updated_ts REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY(engine, worker)
+                )
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _snapshot(self) -> List[tuple]:
+        now = time.time()
+        return [
+            (
+                engine,
+                self.worker_id,
+                st.samples,
+                st.latency_ewma_ms,
+                st.failure_ewma,
+                st.challenge_ewma,
+                st.rate_limit_ewma,
+                st.open_until,
+                now,
+            )
+            for engine, st in self._engines.items()
+        ]
+
+    def _write(self, rows: List[tuple]) -> bool:
+        try:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO engine_health(engine, worker, samples, latency_ewma_ms, failure_ewma,
+                                              challenge_ewma, rate_limit_ewma, open_until, updated_ts)
+                    VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(engine, worker) DO UPDATE SET
+                        samples=excluded.samples,
+                        latency_ewma_ms=excluded.latency_ewma_ms,
+                        failure_ewma=excluded.failure_ewma,
+                        challenge_ewma=excluded.challenge_ewma,
+                        rate_limit_ewma=excluded.rate_limit_ewma,
+                        open_until=excluded.open_until,
+                        updated_ts=excluded.updated_ts
+                    """,
+                    rows,
+                )
+                conn.commit()
+            finally:
+                conn.close()
+            return True
+        except Exception:
+            log.debug("failed to persist search engine health", exc_info=True)
+            return False
+
+    def flush(self) -> None:
+        """同期版（イベントループ外から使う）。ループ上では flush_async() を使う。"""
+        if not self.path or not self._dirty:
+            return
+        self._dirty = False
+        if not self._write(self._snapshot()):
+            self._dirty = True
+
+    async def flush_async(self) -> None:
+        if not self.path:
+            return
+        async with self._flush_lock:
+            # 書いている間に record() で変わった分も続けて書く（スナップショットはループ上で取る）
+            while self._dirty:
+                self._dirty = False
+                if not await asyncio.to_thread(self._write, self._snapshot()):
+                    self._dirty = True
+                    return
+
+    def _schedule_flush(self) -> None:
+        # サーキットの開閉は他 worker へすぐ伝えたいので、その場で非同期 flush を予約する（ループ外なら次の flush で書く）
+        if not self.path:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = self._flush_task
+        if task is None or task.done():
+            self._flush_task = loop.create_task(self.flush_async())
+
+    def _read_remote(self) -> Optional[Dict[str, List[Dict[str, float]]]]:
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT engine, samples, latency_ewma_ms, failure_ewma, open_until
+                      FROM engine_health WHERE worker != ? AND updated_ts >= ?
+                    """,
+                    (self.worker_id, now - self.stale_sec),
+                ).fetchall()
+            finally:
+                conn.close()
+        except Exception:
+            log.debug("failed to load search engine health", exc_info=True)
+            return None
+        remote: Dict[str, List[Dict[str, float]]] = {}
+        for engine, samples, latency, failure, open_until in rows:
+            remote.setdefault(engine, []).append(
+                {
+                    "samples": float(samples),
+                    "latency_ewma_ms": float(latency),
+                    "failure_ewma": float(failure),
+                    "open_until": float(open_until),
+                }
+            )
+        return remote
+
+    async def refresh_async(self) -> None:
+        """自分の分を書いてから、他 worker の行を読み直す（どちらもスレッドで行う）。"""
+        if not self.path:
+            return
+        await self.flush_async()
+        remote = await asyncio.to_thread(self._read_remote)
+        if remote is not None:
+            self._remote = remote
+
+    def ensure_refresher(self) -> None:
+        """refresh_sec ごとに refresh_async() を回すバックグラウンドタスクを起動する（共有しない/0 なら何もしない）。"""
+        if not self.path or self.refresh_sec <= 0:
+            return
+        task = self._refresh_task
+        if task is not None and not task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_sec)
+            await self.refresh_async()
+
+    async def aclose(self) -> None:
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None:
+            task.cancel()
+        await self.flush_async()
+
+    # ---- 記録 ----
+    def _state(self, engine: str) -> _EngineState:
+        st = self._engines.get(engine)
+        if st is None:
+            st = _EngineState()
+            self._engines[engine] = st
+        return st
+
+    def _ewma(self, prev: float, value: float, first: bool) -> float:
+        return value if first else prev + self.alpha * (value - prev)
+
+    def record(self, engine: str, outcome: str, latency_ms: float = 0.0) -> None:
+        if not engine:
+            return
+        st = self._state(engine)
+        first = st.samples == 0
+        st.samples += 1
+        failed = outcome != OUTCOME_OK
+        st.failure_ewma = self._ewma(st.failure_ewma, 1.0 if failed else 0.0, first)
+        st.challenge_ewma = self._ewma(st.challenge_ewma, 1.0 if outcome == OUTCOME_CHALLENGE else 0.0, first)
+        st.rate_limit_ewma = self._ewma(st.rate_limit_ewma, 1.0 if outcome == OUTCOME_RATE_LIMITED else 0.0, first)
+        if outcome == OUTCOME_OK and latency_ms > 0:
+            st.latency_ewma_ms = self._ewma(st.latency_ewma_ms, float(latency_ms), st.latency_ewma_ms <= 0)
+        self._dirty = True
+        now = time.time()
+        if failed:
+            st.consecutive_failures += 1
+            if now < st.open_until:
+                return
+            half_open = st.open_until > 0
+            if (
+                half_open
+                or st.consecutive_failures >= self.failure_threshold
+                or (st.samples >= self.min_samples and st.failure_ewma >= self.failure_rate_open)
+            ):
+                duration = min(self.max_open_sec, self.open_sec * (2 ** st.open_count))
+                st.open_until = now + duration
+                st.open_count += 1
+                self.circuit_opens += 1
+                log.info(
+                    "[search_health] open circuit engine=%s for %.0fs (last=%s consecutive=%d failure=%.2f challenge=%.2f 429=%.2f)",
+                    engine,
+                    duration,
+                    outcome,
+                    st.consecutive_failures,
+                    st.failure_ewma,
+                    st.challenge_ewma,
+                    st.rate_limit_ewma,
+                )
+                self._schedule_flush()
+            return
+        st.consecutive_failures = 0
+        if st.open_until > 0 and now >= st.open_until:
+            st.open_until = 0.0
+            st.open_count = 0
+            log.info("[search_health] close circuit engine=%s", engine)
+            self._schedule_flush()
+
+    # ---- 参照 ----
+    def open_until(self, engine: str) -> float:
+        local = self._engines.get(engine)
+        until = local.open_until if local else 0.0
+        for row in self._remote.get(engine, []):
+            until = max(until, row["open_until"])
+        return until
+
+    def is_open(self, engine: str) -> bool:
+        return self.open_until(engine) > time.time()
+
+    def _score(self, engine: str) -> Optional[float]:
+        """期待コスト（ms）。標本が min_samples 未満なら None。"""
+        total = 0.0
+        latency = 0.0
+        failure = 0.0
+        local = self._engines.get(engine)
+        parts = [
+            {"samples": float(local.samples), "latency_ewma_ms": local.latency_ewma_ms, "failure_ewma": local.failure_ewma}
+        ] if local else []
+        parts.extend(self._remote.get(engine, []))
+        for part in parts:
+            weight = part["samples"]
+            if weight <= 0:
+                continue
+            total += weight
+            latency += weight * (part["latency_ewma_ms"] or self.default_latency_ms)
+            failure += weight * part["failure_ewma"]
+        if total < self.min_samples:
+            return None
+        return (latency / total) * (1.0 + 4.0 * (failure / total))
+
+    def order(self, engines: Iterable[str]) -> List[str]:
+        """開いていないエンジンを期待コスト順に、開いているエンジンは末尾へ（同程度なら設定順）。"""
+        engines = list(engines)
+        now = time.time()
+
+        def _key(item: tuple[int, str]) -> tuple[int, int, int]:
+            idx, engine = item
+            score = self._score(engine)
+            if score is None:
+                score = self.default_latency_ms
+            return (1 if self.open_until(engine) > now else 0, int(score // self.bucket_ms), idx)
+
+        return [engine for _, engine in sorted(enumerate(engines), key=_key)]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        now = time.time()
+        return {
+            engine: {
+                "samples": st.samples,
+                "latency_ewma_ms": round(st.latency_ewma_ms, 1),
+                "failure_ewma": round(st.failure_ewma, 3),
+                "challenge_ewma": round(st.challenge_ewma, 3),
+                "rate_limit_ewma": round(st.rate_limit_ewma, 3),
+                "open_sec_left": round(max(0.0, self.open_until(engine) - now), 1),
+            }
+            for engine, st in sorted(self._engines.items())
+        }
@@ -0,0 +1,106 @@
+# src/search_lookahead.py
+"""
+次の K 社を先に確保して search_company をバックグラウンドで走らせる（検索待ちを現在の会社の deep 取得の裏に隠す）。
+
+process() は「確保→検索→公式判定→deep→AI」を1社ずつ直列に行うため、deep 取得中は検索エンジンが遊んでいる。
+- next_company() は先頭の会社を返し、空いた分だけ新たに確保して検索タスクを起動する
+- next_company() のたびに先行確保中の全件のリース（locked_at）を1回の更新でまとめて延ばす。
+  TTL 回収で他 worker に渡っていたものは検索を取り消して捨てる
+- 終了時（close）は未処理の確保を pending に戻し、検索タスクを取り消す
+- 検索結果は search_company 側のキャッシュ/進行中タスクの共有で受け渡す（ここでは保持しない）
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+
+class SearchLookahead:
+    def __init__(
+        self,
+        *,
+        depth: int,
+        claim: Callable[[], Optional[Dict[str, Any]]],
+        search: Callable[[Dict[str, Any]], Awaitable[Any]],
+        refresh: Callable[[List[Dict[str, Any]]], Set[Any]],
+        release: Callable[[Dict[str, Any]], None],
+        should_prefetch: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> None:
+        self.depth = max(0, int(depth))
+        self._claim = claim
+        self._search = search
+        self._refresh = refresh
+        self._release = release
+        self._should_prefetch = should_prefetch
+        self._queue: Deque[Tuple[Dict[str, Any], Optional["asyncio.Task[Any]"]]] = deque()
+        self.prefetched = 0
+        self.lost_leases = 0
+
+    def _start_search(self, company: Dict[str, Any]) -> Optional["asyncio.Task[Any]"]:
+        if self._should_prefetch is not None and not self._should_prefetch(company):
+            return None
+        task = asyncio.create_task(self._search(company))
+        task.add_done_callback(self._consume_result)
+        self.prefetched += 1
+        return task
+
+    @staticmethod
+    def _consume_result(task: "asyncio.Task[Any]") -> None:
+        # 結果は search_company のキャッシュ経由で使う。ここでは例外の未回収警告だけ防ぐ
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.debug("lookahead search failed: %r", exc)
+
+    def _fill(self, target: int) -> None:
+        while len(self._queue) < target:
+            company = self._claim()
+            if not company:
+                return
+            self._queue.append((company, self._start_search(company)))
+
+    def _refresh_queue(self) -> None:
+        # 先行確保中の全件のリースをまとめて延ばし、他 worker に渡っていたものは捨てる
+        if not self._queue:
+            return
+        held = self._refresh([company for company, _ in self._queue])
+        kept: Deque[Tuple[Dict[str, Any], Optional["asyncio.Task[Any]"]]] = deque()
+        for company, task in self._queue:
+            if company.get("id") in held:
+                kept.append((company, task))
+                continue
+            self.lost_leases += 1
+            log.info("[lookahead] lease lost id=%s -> skip", company.get("id"))
+            if task is not None and not task.done():
+                task.cancel()
+        self._queue = kept
+
+    async def next_company(self) -> Optional[Dict[str, Any]]:
+        """次に処理する会社を返す（無ければ None）。返す前に先行確保分を depth 件まで補充する。"""
+        self._refresh_queue()
+        self._fill(1)
+        if not self._queue:
+            return None
+        # 取り出した会社の検索タスクはそのまま走らせる（process 側の search_company が合流する）
+        company, _ = self._queue.popleft()
+        self._fill(self.depth)
+        return company
+
+    async def close(self) -> None:
+        pending = list(self._queue)
+        self._queue.clear()
+        tasks = [task for _, task in pending if task is not None and not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for company, _ in pending:
+            try:
+                self._release(company)
+            except Exception:
+                log.warning("[lookahead] release failed id=%s", company.get("id"), exc_info=True)
@@ -0,0 +1,119 @@
+# src/search_result_cache.py
+"""
+検索結果（エンジンごとの抽出済みURLリスト）の永続キャッシュ（SQLite, 複数プロセス共有可）。
+
+search_company のプロセス内キャッシュ（search_cache）は終了時に消え、shard/セカンドパス/再投入（review/no_homepage）で
+同じ会社を何度も検索エンジンへ問い合わせることになるため、(エンジン, 正規化クエリ) 単位で抽出結果を残す。
+
+- 値は抽出済みURLの JSON 配列（順位順）。HTML そのものは保存しない
+- 空の結果（チャレンジ/タイムアウト/0件）は保存しない（次回は取り直す）
+- TTL 超過は読まない/evict() で掃除する
+- WAL + busy_timeout、1操作ごとに接続を開閉する（PageDiskCache と同じ方針）
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from typing import List, Optional
+
+log = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    q = unicodedata.normalize("NFKC", query or "").strip().lower()
+    return re.sub(r"\s+", " ", q)
+
+
+class SearchResultCache:
+    def __init__(self, path: str, *, ttl_sec: int = 14 * 24 * 3600) -> None:
+        self.path = (path or "").strip()
+        self.ttl_sec = max(0, int(ttl_sec))
+        self.hits = 0
+        self.misses = 0
+        self._ensure_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA busy_timeout=10000")
+        return conn
+
+    def _ensure_tables(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_results (
+                    engine TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    urls TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY(engine, query)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_results_created ON search_results(created_at)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, engine: str, query: str) -> Optional[List[str]]:
+        """キャッシュ済みの URL リストを返す。無い/期限切れ/破損時は None。"""
+        key = normalize_query(query)
+        if not engine or not key:
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT urls, created_at FROM search_results WHERE engine=? AND query=? LIMIT 1",
+                (engine, key),
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row or (self.ttl_sec > 0 and time.time() - float(row[1] or 0) > self.ttl_sec):
+            self.misses += 1
+            return None
+        try:
+            urls = [str(u) for u in json.loads(row[0]) if u]
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return urls
+
+    def put(self, engine: str, query: str, urls: List[str]) -> None:
+        key = normalize_query(query)
+        if not engine or not key or not urls:
+            return
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT INTO search_results(engine, query, urls, created_at) VALUES(?, ?, ?, ?)
+                ON CONFLICT(engine, query) DO UPDATE SET urls=excluded.urls, created_at=excluded.created_at
+                """,
+                (engine, key, json.dumps(list(urls), ensure_ascii=False), time.time()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def evict(self) -> int:
+        """期限切れエントリを消し、消した件数を返す。"""
+        if self.ttl_sec <= 0:
+            return 0
+        conn = self._connect()
+        try:
+            cur = conn.execute("DELETE FROM search_results WHERE created_at < ?", (time.time() - self.ttl_sec,))
+            conn.commit()
+            return max(0, cur.rowcount or 0)
+        finally:
+            conn.close()
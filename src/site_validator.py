@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Iterable, Optional
 
-from bs4 import BeautifulSoup
+from .parsed_page import HtmlLike, as_parsed_page
 
 
 _CORP_SUFFIXES = (
@@ -75,15 +75,13 @@ def _split_title_like(text: str) -> list[str]:
     return parts or [t]
 
 
-def extract_name_signals(html: str, text: str) -> dict[str, str]:
+def extract_name_signals(html: HtmlLike, text: str) -> dict[str, str]:
     signals: dict[str, str] = {}
     if html:
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-        except Exception:
-            soup = None
+        page = as_parsed_page(html)
+        soup = page.soup
         if soup:
-            title = soup.title.string if soup.title and soup.title.string else ""
+            title = page.title
             if title:
                 signals["title"] = title.strip()
             h1 = soup.find("h1")
@@ -0,0 +1,54 @@
+# src/spawn_pool.py
+"""
+spawn 方式のプロセスプール（PDF 抽出 / CpuStage 共通）の作成と起動待ち。
+
+spawn のワーカーは起動時にモジュール（main.py を含む）を読み直すため1本あたり数秒かかる。
+その起動時間が1件目の処理のタイムアウトに数えられないよう、
+- warm_pool() で max_workers 本すべてが起動して応答するまで待つ（no-op を投げて応答した pid を数える）
+- 呼び出し側は warm_pool() を済ませてから、処理本体だけにタイムアウトをかける
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+
+def new_spawn_pool(
+    max_workers: int,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: tuple = (),
+) -> ProcessPoolExecutor:
+    # fork はスレッド/イベントループを持つ親を複製するため避け、spawn で起動する
+    return ProcessPoolExecutor(
+        max_workers=max(1, int(max_workers)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def _worker_pid(delay_sec: float) -> int:
+    # 少し待たせて、起動済みの1本が全部の no-op を拾ってしまわないようにする
+    time.sleep(delay_sec)
+    return os.getpid()
+
+
+async def warm_pool(executor: ProcessPoolExecutor, workers: int, *, timeout_sec: float = 120.0) -> int:
+    """
+    ワーカー workers 本が応答するまで待ち、応答したワーカー数を返す（timeout_sec で打ち切り）。
+    プールが壊れていれば BrokenProcessPool をそのまま投げる。
+    """
+    loop = asyncio.get_running_loop()
+    workers = max(1, int(workers))
+    deadline = time.monotonic() + max(0.0, timeout_sec)
+    seen: set[int] = set()
+    while len(seen) < workers:
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, _worker_pid, 0.05) for _ in range(workers)))
+        seen.update(pids)
+        if time.monotonic() >= deadline:
+            break
+    return len(seen)
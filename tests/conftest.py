@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_scraper_state(monkeypatch, tmp_path):
+    # 既定の HTTP_ENGINE=auto は aiohttp があれば aiohttp を使うため、_session_get を差し替えるテストに合わせて requests に固定する
+    # （aiohttp 経路は test_async_http_engine.py で明示的に切り替えて確認する）
+    monkeypatch.setenv("HTTP_ENGINE", "requests")
+    # CompanyScraper() の共有ストア/学習ファイルがリポジトリの logs/ に書かれないようにする
+    monkeypatch.setenv("HOST_HEALTH_DB_PATH", str(tmp_path / "host_health.sqlite3"))
+    monkeypatch.setenv("SLOW_HOSTS_PATH", str(tmp_path / "slow_hosts.txt"))
+    monkeypatch.setenv("CANONICAL_ORIGINS_PATH", str(tmp_path / "canonical_origins.txt"))
@@ -0,0 +1,81 @@
+"""
+複数のテストで共有するサンプル文書（HTML / PDF）と、その解析結果をまとめて取るヘルパー。
+"""
+
+HTML = """
+<html><head><title>株式会社サンプル | 会社概要</title>
+<meta name="description" content="サンプルの会社概要です">
+<meta property="og:site_name" content="株式会社サンプル">
+<script type="application/ld+json">{"@type": "Organization", "name": "株式会社サンプル", "telephone": "03-1234-5678"}</script>
+</head><body>
+<header><a href="/company/">会社概要</a><a href="/contact/" title="問い合わせ">お問い合わせ</a></header>
+<h1>株式会社サンプル</h1>
+<table><tr><th>所在地</th><td>〒100-0001 東京都千代田区千代田1-1</td></tr>
+<tr><th>代表者</th><td>代表取締役 山田 太郎</td></tr><tr><th>電話番号</th><td>03-1234-5678</td></tr></table>
+<footer>© 株式会社サンプル</footer>
+</body></html>
+"""
+TEXT = "株式会社サンプル 会社概要 所在地 〒100-0001 東京都千代田区千代田1-1 代表者 代表取締役 山田 太郎 電話番号 03-1234-5678"
+URL = "https://www.sample.co.jp/company/"
+
+
+def analyze(scraper, html):
+    return (
+        scraper.classify_page_type(URL, TEXT, html),
+        scraper.extract_candidates(TEXT, html),
+        scraper._find_priority_links(URL, html),
+        scraper._rank_links(URL, html),
+        scraper.is_likely_official_site("株式会社サンプル", URL, {"url": URL, "text": TEXT, "html": html}, return_details=True),
+    )
+
+
+# 閉じタグ省略（<dd>/<td> の暗黙終了）は html.parser が入れ子にしてしまうため木が変わる。比較対象は閉じた HTML に限る
+PROFILE = """
+<html><body><div class="profile"><p>会社概要</p><p>所在地：〒530-0001 大阪府大阪市北区梅田1-1-1</p>
+<dl><dt>代表者</dt><dd>代表取締役社長 佐藤 花子</dd><dt>TEL</dt><dd>06-1111-2222</dd></dl>
+<table><tr><td>設立</td><td>1980年4月</td></tr><tr><td>資本金</td><td>1,000万円</td></tr></table>
+<a href="/company/outline.html">会社案内</a><a href=/access>アクセス</a><br>
+</div></body>
+"""
+
+
+def build_minimal_pdf(text: str) -> bytes:
+    # Minimal one-page PDF with Helvetica text (ASCII only).
+    # Build objects and xref offsets programmatically.
+    def obj(n: int, body: bytes) -> bytes:
+        return f"{n} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    safe = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    content = f"BT /F1 12 Tf 10 100 Td ({safe}) Tj ET".encode()
+
+    parts: list[bytes] = []
+    parts.append(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = [0]
+
+    def add(b: bytes) -> None:
+        offsets.append(sum(len(x) for x in parts))
+        parts.append(b)
+
+    add(obj(1, b"<< /Type /Catalog /Pages 2 0 R >>"))
+    add(obj(2, b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>"))
+    add(
+        obj(
+            3,
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 144] "
+            b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        )
+    )
+    add(obj(4, b"<< /Length " + str(len(content)).encode() + b" >>\nstream\n" + content + b"\nendstream"))
+    add(obj(5, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"))
+
+    xref_start = sum(len(x) for x in parts)
+    count = 6  # obj 0..5
+    xref = [b"xref\n0 %d\n" % count]
+    xref.append(b"0000000000 65535 f \n")
+    for i in range(1, count):
+        off = offsets[i]
+        xref.append(f"{off:010d} 00000 n \n".encode())
+    trailer = (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (count, xref_start)
+    )
+    return b"".join(parts) + b"".join(xref) + trailer
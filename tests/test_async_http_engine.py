@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from src.async_http import AsyncHttpClient
+from src.company_scraper import CompanyScraper
+
+
+BODY = "<html><head><meta charset='utf-8'><title>会社概要</title></head><body>" + ("株式会社テスト 会社概要 " * 30) + "</body></html>"
+
+
+async def _start_server():
+    async def company(_request):
+        return web.Response(body=BODY.encode("utf-8"), content_type="text/html", charset="utf-8")
+
+    async def missing(_request):
+        return web.Response(status=404, text="not found")
+
+    async def big(_request):
+        return web.Response(body=BODY.encode("utf-8") * 200, content_type="text/html", charset="utf-8")
+
+    async def moved(_request):
+        raise web.HTTPFound("/company")
+
+    async def archive(_request):
+        return web.Response(body=b"PK\x03\x04" + b"\x00" * 200_000, content_type="application/zip")
+
+    app = web.Application()
+    app.router.add_get("/company", company)
+    app.router.add_get("/missing", missing)
+    app.router.add_get("/big", big)
+    app.router.add_get("/archive.zip", archive)
+    app.router.add_get("/moved", moved)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_http_engine_env_selects_requests(monkeypatch):
+    monkeypatch.setenv("HTTP_ENGINE", "requests")
+    assert CompanyScraper(headless=True).http_engine == "requests"
+    monkeypatch.setenv("HTTP_ENGINE", "aiohttp")
+    assert CompanyScraper(headless=True).http_engine == "aiohttp"
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_with_aiohttp_engine(monkeypatch):
+    monkeypatch.setenv("HTTP_ENGINE", "aiohttp")
+    runner, base = await _start_server()
+    scraper = CompanyScraper(headless=True)
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("requests path should not be used")
+
+    monkeypatch.setattr(scraper, "_session_get", _unexpected)
+    try:
+        info = await scraper._fetch_http_info(f"{base}/company", timeout_ms=4000)
+        assert "株式会社テスト" in (info.get("text") or "")
+        assert "<title>会社概要</title>" in (info.get("html") or "")
+
+        missing = await scraper._fetch_http_info(f"{base}/missing", timeout_ms=4000)
+        assert missing.get("text") == ""
+        assert missing.get("html") == ""
+    finally:
+        await scraper.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_engine_streams_with_body_limit(monkeypatch):
+    monkeypatch.setenv("HTTP_ENGINE", "aiohttp")
+    monkeypatch.setenv("HTTP_MAX_BODY_BYTES", "20000")
+    runner, base = await _start_server()
+    scraper = CompanyScraper(headless=True)
+    try:
+        info = await scraper._fetch_http_info(f"{base}/big", timeout_ms=4000)
+        assert "株式会社テスト" in (info.get("text") or "")
+        assert len((info.get("html") or "").encode("utf-8")) <= 20000
+
+        skipped = await scraper._fetch_http_info(f"{base}/archive.zip", timeout_ms=4000)
+        assert skipped.get("html") == ""
+    finally:
+        await scraper.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_client_maps_requests_kwargs_and_rejects_unknown():
+    runner, base = await _start_server()
+    client = AsyncHttpClient()
+    try:
+        resp = await client.get(f"{base}/moved", allow_redirects=False, verify=False, stream=True, timeout=(3, 3))
+        assert resp.status_code == 302
+        followed = await client.get(f"{base}/moved", cookies={"k": "v"}, proxies={}, timeout=(3, 3))
+        assert followed.status_code == 200
+        assert followed.url.endswith("/company")
+        with pytest.raises(TypeError):
+            await client.get(f"{base}/company", auth=("user", "pass"))
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+def test_aiohttp_client_closes_session_of_previous_loop():
+    client = AsyncHttpClient()
+
+    async def _fetch(base):
+        resp = await client.get(f"{base}/company", timeout=(3, 3))
+        assert resp.status_code == 200
+        return client._session
+
+    async def _run_once():
+        runner, base = await _start_server()
+        try:
+            return await _fetch(base)
+        finally:
+            await runner.cleanup()
+
+    first = asyncio.run(_run_once())
+    assert not first.closed
+    second = asyncio.run(_run_once())
+    # ループが変わったら前のセッションは閉じてから作り直す
+    assert first.closed
+    assert second is not first
+
+    async def _close():
+        await client.close()
+
+    asyncio.run(_close())
+    assert second.closed
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from src.browser_page_pool import BrowserPagePool
+from src.company_scraper import CompanyScraper
+
+
+class _FakePage:
+    def __init__(self, context, fail_reset: bool = False):
+        self.context = context
+        self.fail_reset = fail_reset
+        self.visited = []
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url, timeout=None, **kwargs):
+        if self.fail_reset and url == "about:blank":
+            raise RuntimeError("reset failed")
+        self.visited.append(url)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, name: str):
+        self.name = name
+        self.pages = []
+
+    async def new_page(self):
+        page = _FakePage(self)
+        self.pages.append(page)
+        return page
+
+
+@pytest.mark.asyncio
+async def test_page_pool_reuses_pages_after_blank_reset():
+    ctx = _FakeContext("a")
+    pool = BrowserPagePool([ctx], size=2)
+
+    page = await pool.acquire()
+    await pool.release(page)
+    again = await pool.acquire()
+
+    assert again is page
+    assert page.visited == ["about:blank"]
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["reused"] == 1
+    await pool.release(again)
+    await pool.close()
+    assert page.closed
+
+
+@pytest.mark.asyncio
+async def test_page_pool_start_precreates_pages_across_contexts():
+    contexts = [_FakeContext("a"), _FakeContext("b")]
+    pool = BrowserPagePool(contexts, size=3)
+
+    await pool.start()
+    assert [len(ctx.pages) for ctx in contexts] == [2, 1]
+    assert pool.stats()["idle"] == 3
+
+    pages = [await pool.acquire() for _ in range(3)]
+    assert pool.stats()["created"] == 3
+    assert {id(p) for p in pages} == {id(p) for ctx in contexts for p in ctx.pages}
+    for page in pages:
+        await pool.release(page)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_page_pool_discards_failed_pages_and_spreads_contexts():
+    contexts = [_FakeContext("a"), _FakeContext("b")]
+    pool = BrowserPagePool(contexts, size=2)
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    assert {first.context.name, second.context.name} == {"a", "b"}
+
+    await pool.release(first, reusable=False)
+    second.fail_reset = True
+    await pool.release(second)
+
+    assert first.closed and second.closed
+    assert pool.stats()["discarded"] == 2
+    assert pool.stats()["pages"] == 0
+
+
+@pytest.mark.asyncio
+async def test_page_pool_bounds_concurrency_and_records_wait():
+    pool = BrowserPagePool([_FakeContext("a")], size=1)
+    page = await pool.acquire()
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await pool.release(page)
+    reused = await asyncio.wait_for(waiter, timeout=1)
+    assert reused is page
+    assert pool.stats()["wait_ms_max"] >= 40
+
+
+@pytest.mark.asyncio
+async def test_browser_page_context_manager_returns_page_to_pool():
+    scraper = CompanyScraper(headless=True)
+    scraper._page_pool = BrowserPagePool([_FakeContext("a")], size=1)
+
+    async with scraper._browser_page() as page:
+        pass
+    with pytest.raises(ValueError):
+        async with scraper._browser_page() as again:
+            assert again is page
+            raise ValueError("boom")
+
+    assert page.closed
+    assert scraper._page_pool.stats()["discarded"] == 1
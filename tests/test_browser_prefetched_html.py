@@ -0,0 +1,146 @@
+import contextlib
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+
+
+class _Frame:
+    def __init__(self, parent=None):
+        self.parent_frame = parent
+
+
+class _Request:
+    def __init__(self, url, resource_type="document", frame=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.frame = frame or _Frame()
+
+
+class _Route:
+    def __init__(self, request):
+        self.request = request
+        self.fulfilled = None
+        self.fell_back = False
+
+    async def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+    async def fallback(self):
+        self.fell_back = True
+
+
+class _Page:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, matcher, handler):
+        self.routes.append((matcher, handler))
+
+    async def unroute(self, matcher, handler):
+        self.routes.remove((matcher, handler))
+
+    async def dispatch(self, request):
+        route = _Route(request)
+        for matcher, handler in list(self.routes):
+            if matcher(request.url):
+                await handler(route)
+                return route
+        route.fell_back = True
+        return route
+
+
+@pytest.mark.asyncio
+async def test_serve_prefetched_html_fulfills_only_first_main_document():
+    scraper = CompanyScraper(headless=True)
+    page = _Page()
+    html = "<html><head><meta charset='shift_jis'></head><body>会社概要</body></html>"
+
+    async with scraper._serve_prefetched_html(page, "https://example.co.jp/company/", html):
+        script = await page.dispatch(_Request("https://example.co.jp/app.js", resource_type="script"))
+        iframe = await page.dispatch(_Request("https://example.co.jp/company/", frame=_Frame(parent=_Frame())))
+        main_doc = await page.dispatch(_Request("https://example.co.jp/company"))
+        again = await page.dispatch(_Request("https://example.co.jp/company"))
+
+    assert script.fell_back and script.fulfilled is None
+    assert iframe.fell_back and iframe.fulfilled is None
+    assert main_doc.fulfilled["body"] == html
+    assert main_doc.fulfilled["content_type"] == "text/html; charset=utf-8"
+    assert again.fulfilled is None
+    assert page.routes == []
+
+
+class _RenderPage:
+    def __init__(self):
+        self.url = ""
+        self.gotos = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.gotos.append(url)
+        self.url = url
+
+    async def wait_for_load_state(self, state, **kwargs):
+        pass
+
+    async def inner_text(self, selector, **kwargs):
+        return "会社概要 " * 30
+
+    async def content(self):
+        return "<html><body>" + "会社概要 " * 30 + "</body></html>"
+
+
+async def _render_with_final_url(monkeypatch, tmp_path, final_url, nav_url=None):
+    monkeypatch.setenv("RENDER_MODES_PATH", str(tmp_path / "render_modes.txt"))
+    scraper = CompanyScraper(headless=True)
+    scraper.context = object()
+    page = _RenderPage()
+    served = []
+    slots = []
+
+    async def fake_fetch(url, **kwargs):
+        return {"url": url, "text": "薄い", "html": "<html><body>薄い</body></html>", "final_url": final_url}
+
+    @contextlib.asynccontextmanager
+    async def fake_page():
+        yield page
+
+    @contextlib.asynccontextmanager
+    async def fake_slot(url):
+        slots.append(url)
+        yield 0.0
+
+    @contextlib.asynccontextmanager
+    async def fake_serve(_page, url, html):
+        served.append(url)
+        yield
+
+    monkeypatch.setattr(scraper, "_fetch_http_info", fake_fetch)
+    monkeypatch.setattr(scraper, "_browser_page", fake_page)
+    monkeypatch.setattr(scraper, "_host_slot", fake_slot)
+    monkeypatch.setattr(scraper, "_serve_prefetched_html", fake_serve)
+    if nav_url is not None:
+        monkeypatch.setattr(scraper.canonical_origins, "rewrite", lambda url: nav_url)
+    await scraper.get_page_info("https://example.co.jp/company")
+    return served, slots, page.gotos
+
+
+@pytest.mark.asyncio
+async def test_prefetched_html_is_reused_only_at_its_final_url(monkeypatch, tmp_path):
+    served, _, _ = await _render_with_final_url(monkeypatch, tmp_path, "https://example.co.jp/company")
+    assert served == ["https://example.co.jp/company"]
+
+    # 同一ホストでパスが変わるリダイレクト（/company → /ja/company）の HTML は流用せず通常遷移
+    served, _, gotos = await _render_with_final_url(monkeypatch, tmp_path, "https://example.co.jp/ja/company")
+    assert served == []
+    assert gotos == ["https://example.co.jp/company"]
+
+
+@pytest.mark.asyncio
+async def test_browser_host_slot_is_keyed_on_navigation_url(monkeypatch, tmp_path):
+    nav = "https://www.example.co.jp/company"
+    _, slots, gotos = await _render_with_final_url(monkeypatch, tmp_path, "", nav_url=nav)
+    assert slots == [nav]
+    assert gotos == [nav]
@@ -0,0 +1,94 @@
+import pytest
+
+import src.company_scraper as company_scraper_module
+from src.company_scraper import CompanyScraper
+import src.process_rss as process_rss
+from src.process_rss import chromium_root_pids, pids_tree_rss_bytes, process_tree_rss_bytes
+
+
+def _scraper(monkeypatch, **env) -> CompanyScraper:
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    scraper = CompanyScraper(headless=True)
+    scraper.browser = object()
+    closed = []
+
+    async def fake_close_browser():
+        closed.append(True)
+        scraper.browser = None
+        scraper.context = None
+
+    scraper._close_browser = fake_close_browser
+    scraper._closed_calls = closed
+    return scraper
+
+
+def test_process_tree_rss_bytes_reports_current_process():
+    assert process_tree_rss_bytes() > 0
+
+
+def test_chromium_roots_exclude_python_tree_and_renderers(monkeypatch):
+    table = {
+        10: (1, "python", 500),
+        11: (10, "node", 40),
+        12: (11, "chrome", 100),
+        13: (12, "chrome", 30),
+        14: (10, "python", 700),  # PDF/CPU ワーカー
+        20: (1, "chrome", 999),  # 他人のブラウザ
+    }
+    monkeypatch.setattr(process_rss, "_process_table", lambda: table)
+    roots = chromium_root_pids(10)
+    assert roots == {12}
+    assert pids_tree_rss_bytes(roots) == 130
+    assert pids_tree_rss_bytes([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_recycle_after_page_budget_only_on_company_boundary(monkeypatch):
+    scraper = _scraper(monkeypatch, BROWSER_RECYCLE_PAGES="3", BROWSER_RECYCLE_RSS_MB="0")
+    scraper.browser_pages_since_recycle = 2
+    await scraper.on_company_boundary()
+    assert scraper._closed_calls == []
+
+    scraper.browser_pages_since_recycle = 3
+    await scraper.on_company_boundary()
+    assert scraper._closed_calls == [True]
+    assert scraper.browser_recycles == 1
+    assert scraper.browser_recycle_reasons == {"pages": 1}
+    assert scraper.browser_pages_since_recycle == 0
+
+
+@pytest.mark.asyncio
+async def test_recycle_when_rss_crosses_threshold(monkeypatch):
+    scraper = _scraper(monkeypatch, BROWSER_RECYCLE_PAGES="0", BROWSER_RECYCLE_RSS_MB="100")
+    scraper._browser_pids = {12}
+    measured = []
+
+    def fake_rss(pids):
+        measured.append(set(pids))
+        return rss_mb * 1024 * 1024
+
+    monkeypatch.setattr(company_scraper_module, "pids_tree_rss_bytes", fake_rss)
+    rss_mb = 50
+    assert await scraper.maybe_recycle_browser() is False
+    assert measured == [{12}]
+
+    rss_mb = 150
+    assert await scraper.maybe_recycle_browser() is True
+    assert scraper.browser_recycle_reasons == {"rss": 1}
+    # 起動していないブラウザは作り直さない
+    assert await scraper.maybe_recycle_browser() is False
+
+
+@pytest.mark.asyncio
+async def test_rss_check_skipped_for_shared_browser(monkeypatch):
+    scraper = _scraper(monkeypatch, BROWSER_RECYCLE_PAGES="0", BROWSER_RECYCLE_RSS_MB="100")
+    scraper._browser_shared = True
+    scraper._browser_pids = {12}
+
+    def fail_rss(pids):
+        raise AssertionError("shared browser RSS must not be measured")
+
+    monkeypatch.setattr(company_scraper_module, "pids_tree_rss_bytes", fail_rss)
+    assert await scraper.maybe_recycle_browser() is False
+    assert scraper._closed_calls == []
@@ -0,0 +1,111 @@
+import pytest
+
+from src.canonical_origin_map import CanonicalOriginMap
+from src.company_scraper import CompanyScraper
+
+
+def test_canonical_origin_learns_same_site_redirects_only(tmp_path):
+    cmap = CanonicalOriginMap(str(tmp_path / "canonical.txt"))
+    assert cmap.learn("http://example.co.jp/company/", "https://www.example.co.jp/company/") is True
+    assert cmap.rewrite("http://example.co.jp/access?x=1") == "https://www.example.co.jp/access?x=1"
+
+    # 別ドメイン / パスが落ちたリダイレクトは学習しない
+    assert cmap.learn("https://old.example.jp/about", "https://new-brand.jp/about") is False
+    assert cmap.learn("https://foo.example.jp/about", "https://www.foo.example.jp/") is False
+    assert cmap.learn("https://foo.example.jp/about", "https://www.foo.example.jp/about", path_checked=True) is True
+
+    # 学習しただけではファイルに書かない（会社の区切りで flush する）
+    assert not (tmp_path / "canonical.txt").exists()
+    cmap.flush()
+    reloaded = CanonicalOriginMap(str(tmp_path / "canonical.txt"))
+    assert reloaded.rewrite("http://example.co.jp/") == "https://www.example.co.jp/"
+    reloaded.forget("http://example.co.jp/")
+    assert reloaded.rewrite("http://example.co.jp/") == "http://example.co.jp/"
+    reloaded.flush()
+    assert CanonicalOriginMap(str(tmp_path / "canonical.txt")).rewrite("http://example.co.jp/") == "http://example.co.jp/"
+
+
+def test_canonical_origin_flush_keeps_other_writers(tmp_path):
+    path = str(tmp_path / "canonical.txt")
+    a = CanonicalOriginMap(path)
+    b = CanonicalOriginMap(path)
+    a.learn("http://a.example.jp/", "https://a.example.jp/")
+    b.learn("http://b.example.jp/", "https://b.example.jp/")
+    a.flush()
+    b.flush()
+    assert a.rewrite("http://b.example.jp/") == "http://b.example.jp/"
+    merged = CanonicalOriginMap(path)
+    assert merged.rewrite("http://a.example.jp/x") == "https://a.example.jp/x"
+    assert merged.rewrite("http://b.example.jp/x") == "https://b.example.jp/x"
+
+
+class _Resp:
+    def __init__(self, url, body=b"<html><body><p>\xe4\xbc\x9a\xe7\xa4\xbe\xe6\xa6\x82\xe8\xa6\x81</p></body></html>"):
+        self.url = url
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.apparent_encoding = "utf-8"
+        self.content = body
+        self.text = body.decode("utf-8")
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_skips_repeated_redirect_after_learning(monkeypatch, tmp_path):
+    monkeypatch.setenv("HTTP_STREAM_ENABLED", "false")
+    monkeypatch.setenv("CANONICAL_ORIGINS_PATH", str(tmp_path / "canonical.txt"))
+    scraper = CompanyScraper(headless=True)
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        if url.startswith("https://sme.example.jp/"):
+            return _Resp("https://www.sme.example.jp/")  # パスを落として www のトップへ飛ばすサイト
+        return _Resp(url)
+
+    monkeypatch.setattr(scraper, "_session_get", fake_get)
+    await scraper._fetch_http_info("https://sme.example.jp/company/", timeout_ms=4000, use_disk_cache=False)
+    assert requested == ["https://sme.example.jp/company/", "https://www.sme.example.jp/company/"]
+
+    requested.clear()
+    info = await scraper._fetch_http_info("https://sme.example.jp/access/", timeout_ms=4000, use_disk_cache=False)
+    assert requested == ["https://www.sme.example.jp/access/"]
+    assert info["url"] == "https://sme.example.jp/access/"
+
+
+@pytest.mark.asyncio
+async def test_flush_async_writes_snapshot_and_merges_other_writers(tmp_path):
+    path = str(tmp_path / "canonical.txt")
+    other = CanonicalOriginMap(path)
+    other.learn("http://b.example.jp/", "https://b.example.jp/")
+    other.flush()
+
+    cmap = CanonicalOriginMap(str(tmp_path / "missing.txt"))
+    cmap.path = path
+    cmap.learn("http://a.example.jp/", "https://a.example.jp/")
+    await cmap.flush_async()
+    assert cmap.rewrite("http://b.example.jp/x") == "https://b.example.jp/x"
+    assert CanonicalOriginMap(path).rewrite("http://a.example.jp/x") == "https://a.example.jp/x"
+
+
+@pytest.mark.asyncio
+async def test_ssl_fallback_to_http_is_not_learned(monkeypatch, tmp_path):
+    import requests
+
+    monkeypatch.setenv("HTTP_STREAM_ENABLED", "false")
+    scraper = CompanyScraper(headless=True)
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        if url.startswith("https://"):
+            raise requests.exceptions.SSLError("certificate verify failed")
+        return _Resp(url)
+
+    monkeypatch.setattr(scraper, "_session_get", fake_get)
+    info = await scraper._fetch_http_info("https://legacy.example.jp/company/", timeout_ms=4000, use_disk_cache=False)
+    assert requested == ["https://legacy.example.jp/company/", "http://legacy.example.jp/company/"]
+    assert info["html"]
+    assert scraper.canonical_origins.rewrite("https://legacy.example.jp/access/") == "https://legacy.example.jp/access/"
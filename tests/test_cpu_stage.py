@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+
+import src.cpu_stage as cpu_stage
+from src.company_scraper import CompanyScraper
+from src.cpu_stage import CpuStage
+from tests.sample_docs import HTML as PAGE_HTML, PROFILE, TEXT as PAGE_TEXT, URL as PAGE_URL
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HTML = (
+    "<html><body><table>"
+    "<tr><th>会社名</th><td>株式会社テスト</td></tr>"
+    "<tr><th>代表者</th><td>代表取締役 山田 太郎</td></tr>"
+    "<tr><th>所在地</th><td>〒100-0001 東京都千代田区千代田1-1</td></tr>"
+    "<tr><th>電話番号</th><td>03-1234-5678</td></tr>"
+    "</table></body></html>"
+)
+
+
+@pytest.mark.asyncio
+async def test_cpu_stage_matches_inline_results(monkeypatch):
+    monkeypatch.setenv("CPU_STAGE_WORKERS", "1")
+    monkeypatch.setenv("CPU_STAGE_MIN_CHARS", "0")
+    scraper = CompanyScraper(headless=True)
+    try:
+        await scraper.warm_worker_pools()
+        text = await scraper.clean_text_from_html_async(HTML)
+        cands = await scraper.extract_candidates_async(text, HTML)
+        page_type = await scraper.classify_page_type_async("https://example.co.jp/company/", text=text, html=HTML)
+    finally:
+        scraper.cpu_stage.close()
+        scraper.pdf_extractor.close()
+
+    assert text == CompanyScraper._clean_text_from_html(HTML)
+    assert cands == scraper.extract_candidates(text, HTML)
+    assert page_type == scraper.classify_page_type("https://example.co.jp/company/", text=text, html=HTML)
+    assert scraper.cpu_stage.stats()["offloaded"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cpu_stage_runs_small_pages_inline(monkeypatch):
+    monkeypatch.setenv("CPU_STAGE_WORKERS", "1")
+    monkeypatch.setenv("CPU_STAGE_MIN_CHARS", "100000")
+    scraper = CompanyScraper(headless=True)
+
+    cands = await scraper.extract_candidates_async("TEL 03-1234-5678", HTML)
+
+    assert cands == scraper.extract_candidates("TEL 03-1234-5678", HTML)
+    assert scraper.cpu_stage.stats() == {"offloaded": 0, "inline": 1, "failures": 0}
+    assert scraper.cpu_stage._executor is None
+
+
+@pytest.mark.asyncio
+async def test_cpu_stage_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("CPU_STAGE_WORKERS", raising=False)
+    scraper = CompanyScraper(headless=True)
+
+    assert scraper.cpu_stage is None
+    page_type = await scraper.classify_page_type_async("https://example.co.jp/", text="", html=HTML)
+    assert page_type == scraper.classify_page_type("https://example.co.jp/", text="", html=HTML)
+
+
+def _task_args(name, url, text, html):
+    if name == "_clean_text_from_html":
+        return (html,), {"fallback_text": text}
+    if name == "extract_candidates":
+        return (text, html), {"page_type_hint": "COMPANY_PROFILE"}
+    return (url,), {"text": text, "html": html}
+
+
+@pytest.mark.parametrize("rep_strict_sources", [True, False])
+def test_worker_instance_runs_every_task_like_full_scraper(monkeypatch, rep_strict_sources):
+    monkeypatch.setenv("REP_STRICT_SOURCES", "true" if rep_strict_sources else "false")
+    full = CompanyScraper(headless=True)
+    cpu_stage._init_worker(rep_strict_sources)
+    pages = [(PAGE_URL, PAGE_TEXT, PAGE_HTML), ("https://example.co.jp/company/", "", HTML), (PAGE_URL, "", PROFILE)]
+    pages += [("https://example.com/", "", (ROOT / name).read_text(encoding="utf-8")) for name in ("bing_sample.html", "ddg_sample.html")]
+    for name in CpuStage.TASKS:
+        for url, text, html in pages:
+            args, kwargs = _task_args(name, url, text, html)
+            assert cpu_stage._run_task(name, args, kwargs) == getattr(full, name)(*args, **kwargs), (name, url)
+
+
+@pytest.mark.asyncio
+async def test_cpu_stage_rejects_tasks_that_share_the_parent_parse():
+    stage = CpuStage(workers=1)
+    with pytest.raises(ValueError):
+        await stage.run("_detect_directory_like", "https://example.co.jp/")
+    assert stage._executor is None
@@ -0,0 +1,83 @@
+import socket
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.domain_guess import guess_domain_origins, parse_tlds
+
+
+def test_guess_domain_origins_orders_by_token_then_tld_and_caps():
+    tokens = ["abc", "holdings", "ab", "abc", "a_b", "abcshouji", "extra"]
+    origins = guess_domain_origins(tokens, parse_tlds(".co.jp, com"), max_tokens=2, max_probes=3)
+    assert origins == ["https://abc.co.jp/", "https://abc.com/", "https://abcshouji.co.jp/"]
+    assert parse_tlds("") == [".co.jp", ".jp", ".com"]
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setenv("DOMAIN_GUESS_ENABLED", "true")
+    monkeypatch.setenv("DOMAIN_GUESS_TLDS", ".co.jp,.com")
+    monkeypatch.setenv("DOMAIN_GUESS_MAX_TOKENS", "1")
+    s = CompanyScraper(headless=True)
+    s._company_tokens = lambda name: ["sample"]  # type: ignore[method-assign]
+    return s
+
+
+@pytest.mark.asyncio
+async def test_guess_official_urls_returns_name_matched_hits_only(scraper, monkeypatch):
+    resolvable = {"sample.co.jp", "www.sample.com"}
+
+    def _getaddrinfo(host, port, *args, **kwargs):
+        if host not in resolvable:
+            raise socket.gaierror("no such host")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+    fetched = []
+
+    async def _fetch(url, **kwargs):
+        fetched.append(url)
+        if url == "https://sample.co.jp/":
+            html = "<html><head><title>株式会社サンプル | 会社概要</title></head><body>ようこそ</body></html>"
+            return {"url": url, "text": "株式会社サンプル 会社概要 〒100-0001 東京都千代田区千代田1-1", "html": html}
+        return {"url": url, "text": "このドメインは販売中です", "html": "<title>sample.com</title>"}
+
+    monkeypatch.setattr(socket, "getaddrinfo", _getaddrinfo)
+    monkeypatch.setattr(scraper, "_fetch_http_info", _fetch)
+
+    hits = await scraper.guess_official_urls("株式会社サンプル", "東京都千代田区千代田1-1")
+    assert hits == ["https://sample.co.jp/"]
+    # .com は裸ドメインが引けず www. で取得、社名不一致で外れ
+    assert sorted(fetched) == ["https://sample.co.jp/", "https://www.sample.com/"]
+    assert scraper.page_cache.get(scraper._cache_key_url("https://sample.co.jp/"))["html"].startswith("<html>")
+
+    # 同じ社名+住所は再確認しない
+    fetched.clear()
+    assert await scraper.guess_official_urls("株式会社サンプル", "東京都千代田区千代田1-1") == hits
+    assert fetched == []
+
+    # 同名でも住所が違う会社には前の当たりを使い回さず、住所の裏付けが無ければ外れ
+    assert await scraper.guess_official_urls("株式会社サンプル", "大阪府大阪市北区梅田1-1") == []
+    assert "https://sample.co.jp/" in fetched
+    # 住所が無ければ推測しない
+    fetched.clear()
+    assert await scraper.guess_official_urls("株式会社サンプル", "") == []
+    assert fetched == []
+
+
+def test_domain_guess_address_hit_accepts_prefecture_or_postal_code(scraper):
+    assert scraper._domain_guess_address_hit("東京都港区芝1-1", "本社: 東京都港区")
+    assert scraper._domain_guess_address_hit("〒530-0001 北区梅田1-1", "〒530‐0001 梅田")
+    assert not scraper._domain_guess_address_hit("〒530-0001 北区梅田1-1", "TEL 0530-0001-23")
+    assert not scraper._domain_guess_address_hit("大阪府大阪市", "東京都千代田区")
+
+
+@pytest.mark.asyncio
+async def test_guess_official_urls_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("DOMAIN_GUESS_ENABLED", raising=False)
+    s = CompanyScraper(headless=True)
+
+    async def _fetch(url, **kwargs):
+        raise AssertionError("should not probe")
+
+    monkeypatch.setattr(s, "_fetch_http_info", _fetch)
+    assert await s.guess_official_urls("株式会社サンプル", "東京都") == []
@@ -0,0 +1,56 @@
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.fetch_archive import FetchArchive
+
+
+def _scraper(monkeypatch):
+    monkeypatch.delenv("FETCH_ARCHIVE_MODE", raising=False)
+    return CompanyScraper(headless=True)
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_serves_same_results_without_network(monkeypatch, tmp_path):
+    path = str(tmp_path / "archive.sqlite3")
+    recorder = _scraper(monkeypatch)
+
+    async def _startpage(query):
+        return f"<html>{query}</html>"
+
+    async def _page(url, timeout=None, need_screenshot=False, allow_slow=False):
+        return {"url": url, "text": "会社概要", "html": "<p>会社概要</p>", "screenshot": b"\xff\xd8shot" if need_screenshot else b""}
+
+    async def _broken(url, **kwargs):
+        raise ValueError("boom")
+
+    recorder._fetch_startpage = _startpage
+    recorder.get_page_info = _page
+    recorder._fetch_http_info = _broken
+    FetchArchive(path, "record").install(recorder)
+
+    assert await recorder._fetch_startpage("株式会社サンプル") == "<html>株式会社サンプル</html>"
+    await recorder.get_page_info("https://example.co.jp/", need_screenshot=True)
+    # スクショ無しの再取得で既存のスクショは消えない
+    await recorder.get_page_info("https://example.co.jp/")
+    with pytest.raises(ValueError):
+        await recorder._fetch_http_info("https://example.co.jp/company/")
+
+    monkeypatch.setenv("FETCH_ARCHIVE_MODE", "replay")
+    monkeypatch.setenv("FETCH_ARCHIVE_PATH", path)
+    player = CompanyScraper(headless=True)
+
+    async def _network(*args, **kwargs):
+        raise AssertionError("replay must not hit the network")
+
+    monkeypatch.setattr(player, "_session_get_async", _network)
+
+    assert await player._fetch_startpage("株式会社サンプル") == "<html>株式会社サンプル</html>"
+    info = await player.get_page_info("https://example.co.jp/", need_screenshot=True)
+    assert info["text"] == "会社概要" and info["screenshot"] == b"\xff\xd8shot"
+    with pytest.raises(RuntimeError):
+        await player._fetch_http_info("https://example.co.jp/company/")
+
+    missing = await player.get_page_info("https://unknown.example/")
+    assert missing == {"url": "https://unknown.example/", "text": "", "html": "", "screenshot": b""}
+    assert await player._fetch_bing("未記録") == ""
+    assert player.fetch_archive.stats()["misses"] == 2
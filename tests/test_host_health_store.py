@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.host_health_store import HostHealthStore
+
+
+def test_host_health_store_upserts_and_tracks_latency(tmp_path):
+    store = HostHealthStore(str(tmp_path / "hh.sqlite3"), ttl_sec=3600)
+    store.record_slow("slow.example.jp", elapsed_ms=8000, timeout=True)
+    store.record_slow("slow.example.jp", elapsed_ms=9000)
+    store.add_latencies([("slow.example.jp", 2, 3000.0, 2000.0), ("fast.example.jp", 3, 300.0, 150.0)])
+
+    slow = store.stats("slow.example.jp")
+    assert slow["slow_count"] == 2
+    assert slow["timeout_count"] == 1
+    assert slow["latency_max_ms"] == 9000
+    assert slow["fetch_count"] == 2
+    fast = store.stats("fast.example.jp")
+    assert fast["latency_avg_ms"] == 100.0
+    assert set(store.slow_hosts_since(0)) == {"slow.example.jp"}
+
+
+def test_host_health_store_resets_slow_count_after_ttl(tmp_path):
+    store = HostHealthStore(str(tmp_path / "hh.sqlite3"), ttl_sec=100)
+    old = int(time.time()) - 1000
+    store.record_slow("a.example.jp", ts=old)
+    store.record_slow("a.example.jp", ts=old + 1)
+    assert store.slow_hosts_since(0) == {}
+    store.record_slow("a.example.jp")
+    assert store.stats("a.example.jp")["slow_count"] == 1
+
+
+def _scraper(monkeypatch, tmp_path) -> CompanyScraper:
+    monkeypatch.setenv("SLOW_HOSTS_PATH", str(tmp_path / "slow_hosts.txt"))
+    monkeypatch.setenv("HOST_HEALTH_DB_PATH", str(tmp_path / "hh.sqlite3"))
+    monkeypatch.setenv("SLOW_HOST_HITS", "2")
+    monkeypatch.setenv("SLOW_HOSTS_REFRESH_SEC", "0")
+    return CompanyScraper(headless=True)
+
+
+@pytest.mark.asyncio
+async def test_slow_host_is_shared_between_scrapers_after_flush(monkeypatch, tmp_path):
+    shard_a = _scraper(monkeypatch, tmp_path)
+    shard_b = _scraper(monkeypatch, tmp_path)
+
+    shard_a._add_slow_host("slow.example.jp", elapsed_ms=9000)
+    shard_a._add_slow_host("slow.example.jp", elapsed_ms=9500, timeout=True)
+    assert shard_a._is_slow_host("slow.example.jp") is True
+    # 会社の区切りで flush されるまでストアには書かない
+    assert HostHealthStore(str(tmp_path / "hh.sqlite3")).stats("slow.example.jp") is None
+
+    await shard_a.flush_host_health()
+    assert shard_b._is_slow_host("slow.example.jp") is False
+    await shard_b.refresh_slow_hosts(force=True)
+    assert shard_b._is_slow_host("slow.example.jp") is True
+    assert HostHealthStore(str(tmp_path / "hh.sqlite3")).stats("slow.example.jp")["timeout_count"] == 1
+    assert not (tmp_path / "slow_hosts.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_company_boundary_flushes_and_starts_refresher(monkeypatch, tmp_path):
+    shard_a = _scraper(monkeypatch, tmp_path)
+    monkeypatch.setenv("SLOW_HOSTS_REFRESH_SEC", "0.01")
+    shard_b = _scraper(monkeypatch, tmp_path)
+    shard_a._add_slow_host("slow.example.jp")
+    shard_a._add_slow_host("slow.example.jp")
+    await shard_a.on_company_boundary()
+    await shard_b.on_company_boundary()
+    try:
+        for _ in range(100):
+            if shard_b._is_slow_host("slow.example.jp"):
+                break
+            await asyncio.sleep(0.01)
+        assert shard_b._is_slow_host("slow.example.jp") is True
+    finally:
+        await shard_a.close()
+        await shard_b.close()
+
+
+@pytest.mark.asyncio
+async def test_refresher_tick_shares_slow_host_without_company_boundary(monkeypatch, tmp_path):
+    shard_a = _scraper(monkeypatch, tmp_path)
+    shard_b = _scraper(monkeypatch, tmp_path)
+    shard_a.slow_hosts_refresh_sec = shard_b.slow_hosts_refresh_sec = 0.01
+    await shard_a.on_company_boundary()
+    await shard_b.on_company_boundary()
+    # 会社の処理中（区切り前）に観測した slow host も、次の tick で他 shard へ届く
+    shard_a._add_slow_host("slow.example.jp")
+    shard_a._add_slow_host("slow.example.jp")
+    try:
+        for _ in range(100):
+            if shard_b._is_slow_host("slow.example.jp"):
+                break
+            await asyncio.sleep(0.01)
+        assert shard_b._is_slow_host("slow.example.jp") is True
+    finally:
+        await shard_a.close()
+        await shard_b.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_reads_only_rows_since_last_refresh(monkeypatch, tmp_path):
+    scraper = _scraper(monkeypatch, tmp_path)
+    calls = []
+    original = scraper.host_health.slow_hosts_since
+
+    def _since(since_ts=0):
+        calls.append(since_ts)
+        return original(since_ts)
+
+    monkeypatch.setattr(scraper.host_health, "slow_hosts_since", _since)
+    started = int(time.time())
+    await scraper.refresh_slow_hosts(force=True)
+    await scraper.refresh_slow_hosts(force=True)
+    assert calls[0] == 0
+    assert calls[1] >= started - CompanyScraper.SLOW_HOSTS_REFRESH_OVERLAP_SEC
+
+
+def test_legacy_slow_hosts_file_is_imported(monkeypatch, tmp_path):
+    (tmp_path / "slow_hosts.txt").write_text(f"legacy.example.jp,{int(time.time())},3\n", encoding="utf-8")
+    scraper = _scraper(monkeypatch, tmp_path)
+    assert scraper._is_slow_host("legacy.example.jp") is True
+    assert HostHealthStore(str(tmp_path / "hh.sqlite3")).stats("legacy.example.jp")["slow_count"] == 3
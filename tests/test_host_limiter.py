@@ -0,0 +1,118 @@
+import asyncio
+import contextlib
+import time
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.host_limiter import HostLimiter
+from src.render_mode_registry import MODE_BROWSER
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_caps_in_flight_per_host():
+    limiter = HostLimiter(max_in_flight=2, rate_per_sec=0)
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    async def fetch(host):
+        async with limiter.slot(host):
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.02)
+            active[host] -= 1
+
+    await asyncio.gather(*(fetch("a") for _ in range(6)), *(fetch("b") for _ in range(3)))
+    assert peak == {"a": 2, "b": 2}
+    stats = limiter.stats()
+    assert stats["acquires"] == 9
+    assert stats["waited"] > 0
+    assert stats["in_flight_max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_token_bucket_allows_burst_then_paces():
+    limiter = HostLimiter(max_in_flight=0, rate_per_sec=20, burst=2)
+    started = time.monotonic()
+    waits = []
+    for _ in range(4):
+        async with limiter.slot("a") as wait_ms:
+            waits.append(wait_ms)
+    elapsed = time.monotonic() - started
+    assert waits[0] < 5 and waits[1] < 5
+    assert elapsed >= 0.09  # 3,4件目は 50ms 間隔
+    async with limiter.slot("other") as wait_ms:
+        assert wait_ms < 5
+
+
+@pytest.mark.asyncio
+async def test_session_get_async_goes_through_host_slot(monkeypatch):
+    monkeypatch.setenv("HOST_MAX_IN_FLIGHT", "1")
+    monkeypatch.setenv("HOST_RATE_PER_SEC", "0")
+    scraper = CompanyScraper(headless=True)
+    active = 0
+    peak = 0
+
+    def fake_get(url, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        time.sleep(0.02)
+        active -= 1
+        return object()
+
+    monkeypatch.setattr(scraper, "_session_get", fake_get)
+    await asyncio.gather(*(scraper._session_get_async("https://sme.example.jp/p%d" % i) for i in range(4)))
+    assert peak == 1
+    assert scraper.host_limiter.stats()["acquires"] == 4
+
+
+class _OrderPage:
+    def __init__(self, events):
+        self.events = events
+        self.url = ""
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.events.append("goto")
+        self.url = url
+
+    async def wait_for_load_state(self, state, **kwargs):
+        self.events.append(f"wait:{state}")
+
+    async def inner_text(self, selector, **kwargs):
+        self.events.append("inner_text")
+        return "会社概要 " * 20
+
+    async def content(self):
+        return "<html><body>" + "会社概要 " * 20 + "</body></html>"
+
+
+@pytest.mark.asyncio
+async def test_browser_fetch_holds_host_slot_only_around_goto(monkeypatch, tmp_path):
+    monkeypatch.setenv("RENDER_MODES_PATH", str(tmp_path / "render_modes.txt"))
+    scraper = CompanyScraper(headless=True)
+    scraper.render_modes.record("spa.example.jp", MODE_BROWSER)
+    scraper.render_modes.record("spa.example.jp", MODE_BROWSER)
+    scraper.context = object()
+    events = []
+
+    @contextlib.asynccontextmanager
+    async def fake_page():
+        events.append("page")
+        yield _OrderPage(events)
+
+    @contextlib.asynccontextmanager
+    async def fake_slot(url):
+        events.append("slot")
+        yield 0.0
+        events.append("release")
+
+    monkeypatch.setattr(scraper, "_browser_page", fake_page)
+    monkeypatch.setattr(scraper, "_host_slot", fake_slot)
+    info = await scraper.get_page_info("https://spa.example.jp/company")
+    assert "会社概要" in info["text"]
+    assert events[:4] == ["page", "slot", "goto", "release"]
+    assert events.count("slot") == 1
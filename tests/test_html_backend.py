@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+import src.html_backend as html_backend
+from src.company_scraper import CompanyScraper
+from src.parsed_page import ParsedPage
+from tests.sample_docs import HTML, PROFILE, analyze
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_resolve_parser_falls_back_to_html_parser(monkeypatch):
+    monkeypatch.setattr(html_backend, "LXML_AVAILABLE", False)
+    assert html_backend.resolve_parser("lxml") == "html.parser"
+    assert html_backend.resolve_parser("auto") == "html.parser"
+    assert html_backend.resolve_parser("unknown") == "html.parser"
+    monkeypatch.setattr(html_backend, "LXML_AVAILABLE", True)
+    assert html_backend.resolve_parser("auto") == "lxml"
+
+
+def _run_all(monkeypatch, parser):
+    monkeypatch.setattr(html_backend, "HTML_PARSER", parser)
+    monkeypatch.setenv("PAGE_PARSED_CACHE_SIZE", "0")
+    scraper = CompanyScraper(headless=True)
+    out = [analyze(scraper, HTML), analyze(scraper, PROFILE), scraper._clean_text_from_html(PROFILE)]
+    for name in ("bing_sample.html", "ddg_sample.html", "duck_fail.html"):
+        html = (ROOT / name).read_text(encoding="utf-8")
+        page = ParsedPage(html)
+        out.append((page.title, [a[:3] for a in page.anchors], page.text, scraper._meta_strings(html)))
+        out.append((scraper._clean_text_from_html(html), analyze(scraper, html)))
+    return out
+
+
+def test_lxml_backend_matches_html_parser(monkeypatch):
+    if not html_backend.LXML_AVAILABLE:
+        pytest.skip("lxml is not installed")
+    assert _run_all(monkeypatch, "lxml") == _run_all(monkeypatch, "html.parser")
@@ -0,0 +1,94 @@
+import pytest
+
+from src.async_http import BodyLimit, read_limited_sync, sniff_body_kind
+from src.company_scraper import CompanyScraper
+
+
+def test_sniff_body_kind_uses_content_type_and_magic():
+    assert sniff_body_kind("text/html; charset=utf-8", b"") == "html"
+    assert sniff_body_kind("application/pdf", b"") == "pdf"
+    assert sniff_body_kind("application/octet-stream", b"%PDF-1.4\n") == "pdf"
+    assert sniff_body_kind("video/mp4", b"\x00\x00\x00\x18ftypmp42") == "other"
+    assert sniff_body_kind("", b"PK\x03\x04rest") == "other"
+    assert sniff_body_kind("", b"\xef\xbb\xbf<!DOCTYPE html>") == "html"
+
+
+class _StreamResp:
+    def __init__(self, body: bytes, content_type: str):
+        self.url = "https://example.co.jp/company"
+        self.status_code = 200
+        self.headers = {"Content-Type": content_type}
+        self.apparent_encoding = "utf-8"
+        self._body = body
+        self.read_bytes = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._body), chunk_size):
+            chunk = self._body[i : i + chunk_size]
+            self.read_bytes += len(chunk)
+            yield chunk
+
+    @property
+    def content(self):
+        return getattr(self, "_content", b"")
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        return None
+
+
+def test_read_limited_sync_truncates_html_prefix():
+    body = b"<html><body>" + b"<p>\xe4\xbc\x9a\xe7\xa4\xbe\xe6\xa6\x82\xe8\xa6\x81</p>" * 50000 + b"</body></html>"
+    resp = read_limited_sync(_StreamResp(body, "text/html"), BodyLimit(max_bytes=100_000))
+    assert resp.body_truncated is True
+    assert len(resp._content) <= 100_000
+    assert resp._content.endswith(b">")
+    assert resp.read_bytes < len(body)
+    assert resp.closed
+
+
+def test_read_limited_sync_aborts_binary_after_sniff():
+    resp = read_limited_sync(_StreamResp(b"PK\x03\x04" + b"\x00" * 500_000, "application/zip"), BodyLimit())
+    assert resp.body_aborted == "content_type"
+    assert resp._content == b""
+    assert resp.read_bytes < 500_000
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_skips_non_html_body(monkeypatch):
+    scraper = CompanyScraper(headless=True)
+
+    def fake_get(url, *args, **kwargs):
+        assert kwargs.get("stream") is True
+        return _StreamResp(b"\x00\x00\x00\x18ftypmp42" + b"\x00" * 200_000, "video/mp4")
+
+    monkeypatch.setattr(scraper, "_session_get", fake_get)
+    info = await scraper._fetch_http_info("https://example.co.jp/movie", timeout_ms=4000)
+    assert info == {"url": "https://example.co.jp/movie", "text": "", "html": ""}
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_does_not_disk_cache_truncated_body(monkeypatch, tmp_path):
+    monkeypatch.setenv("PAGE_DISK_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PAGE_DISK_CACHE_PATH", str(tmp_path / "pages.sqlite3"))
+    monkeypatch.setenv("HTTP_MAX_BODY_BYTES", "100000")
+    scraper = CompanyScraper(headless=True)
+    body = b"<html><body>" + b"<p>\xe4\xbc\x9a\xe7\xa4\xbe\xe6\xa6\x82\xe8\xa6\x81</p>" * 50000 + b"</body></html>"
+    calls = []
+
+    def fake_get(url, *args, **kwargs):
+        calls.append(url)
+        return _StreamResp(body, "text/html")
+
+    monkeypatch.setattr(scraper, "_session_get", fake_get)
+    url = "https://example.co.jp/company"
+    info = await scraper._fetch_http_info(url, timeout_ms=4000)
+    assert info["body_truncated"] is True
+    assert "会社概要" in info["text"]
+    assert scraper.page_disk_cache.get(scraper._cache_key_url(url)) is None
+    # 切れた本文はキャッシュに無いので、次の取得も通信する
+    await scraper._fetch_http_info(url, timeout_ms=4000)
+    assert len(calls) == 2
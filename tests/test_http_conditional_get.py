@@ -0,0 +1,97 @@
+import pytest
+
+from src.company_scraper import CompanyScraper
+
+
+class _Resp:
+    def __init__(self, status_code: int, headers: dict, body: bytes = b""):
+        self.url = "https://example.co.jp/"
+        self.status_code = status_code
+        self.headers = headers
+        self.apparent_encoding = "utf-8"
+        self._body = body
+        self.read_bytes = 0
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._body), chunk_size):
+            chunk = self._body[i : i + chunk_size]
+            self.read_bytes += len(chunk)
+            yield chunk
+
+    @property
+    def content(self):
+        return getattr(self, "_content", self._body)
+
+    def close(self):
+        return None
+
+    def raise_for_status(self):
+        return None
+
+
+def _scraper() -> CompanyScraper:
+    return CompanyScraper(headless=True)
+
+
+def test_validators_match_rules():
+    match = CompanyScraper._validators_match
+    assert match({"etag": '"a"'}, 304, {}) is True
+    assert match({"etag": 'W/"a"'}, 200, {"ETag": '"a"'}) is True
+    assert match({"etag": '"a"'}, 200, {"ETag": '"b"'}) is False
+    lm = "Wed, 01 Oct 2025 00:00:00 GMT"
+    assert match({"last_modified": lm, "content_length": 10}, 200, {"Last-Modified": lm, "Content-Length": "10"}) is True
+    assert match({"last_modified": lm, "content_length": 10}, 200, {"Last-Modified": lm, "Content-Length": "11"}) is False
+    assert match({}, 200, {"ETag": '"a"'}) is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_sends_conditional_headers_and_returns_not_modified(monkeypatch):
+    scraper = _scraper()
+    seen = {}
+
+    def fake_get(url, *args, **kwargs):
+        seen.update(kwargs.get("headers") or {})
+        return _Resp(304, {})
+
+    monkeypatch.setattr(scraper, "_session_get", fake_get)
+    info = await scraper._fetch_http_info(
+        "https://example.co.jp/",
+        timeout_ms=4000,
+        use_disk_cache=False,
+        validators={"etag": '"v1"', "last_modified": "Wed, 01 Oct 2025 00:00:00 GMT"},
+    )
+    assert seen["If-None-Match"] == '"v1"'
+    assert seen["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+    assert info["not_modified"] is True
+    assert info["etag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_skips_body_when_etag_matches_on_200(monkeypatch):
+    scraper = _scraper()
+    resp = _Resp(200, {"Content-Type": "text/html", "ETag": '"v1"'}, b"<html>" + b"x" * 100_000 + b"</html>")
+    monkeypatch.setattr(scraper, "_session_get", lambda url, *a, **kw: resp)
+    info = await scraper._fetch_http_info(
+        "https://example.co.jp/", timeout_ms=4000, use_disk_cache=False, validators={"etag": '"v1"'}
+    )
+    assert info["not_modified"] is True
+    assert resp.read_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_returns_validators_on_full_fetch(monkeypatch):
+    scraper = _scraper()
+    resp = _Resp(
+        200,
+        {"Content-Type": "text/html", "ETag": '"v2"', "Last-Modified": "Thu, 02 Oct 2025 00:00:00 GMT", "Content-Length": "40"},
+        "<html><body><p>会社概要 本社所在地 東京都千代田区</p></body></html>".encode("utf-8"),
+    )
+    monkeypatch.setattr(scraper, "_session_get", lambda url, *a, **kw: resp)
+    info = await scraper._fetch_http_info(
+        "https://example.co.jp/", timeout_ms=4000, use_disk_cache=False, validators={"etag": '"v1"'}
+    )
+    assert "not_modified" not in info
+    assert "会社概要" in info["html"]
+    assert info["etag"] == '"v2"'
+    assert info["last_modified"] == "Thu, 02 Oct 2025 00:00:00 GMT"
+    assert info["content_length"] == 40
@@ -0,0 +1,48 @@
+import random
+
+from src.company_scraper import CompanyScraper
+from src.keyword_matcher import KeywordMatcher, KeywordTagger
+
+
+def test_hits_include_overlapping_and_contained_keywords():
+    matcher = KeywordMatcher(("本社", "本社所在地", "所在地", "社", "job", "jobs"))
+    assert matcher.hits("本社所在地: 東京 / jobs") == {"本社", "本社所在地", "所在地", "社", "job", "jobs"}
+    assert matcher.ordered_hits("所在地と jobs") == ["所在地", "job", "jobs"]
+    assert matcher.search("会社") and not matcher.search("東京都")
+    assert not KeywordMatcher(("", None or "")).search("abc")
+
+
+def test_ignore_case_matches_lowered_substring_check():
+    matcher = KeywordMatcher(("CEO", "ceo", "Contact Us", "企業DB"), ignore_case=True)
+    assert matcher.ordered_hits("Our ceo / CONTACT us / 企業db") == ["CEO", "ceo", "Contact Us", "企業DB"]
+    assert KeywordMatcher(("CEO",)).hits("ceo") == frozenset()
+
+
+def test_matchers_agree_with_any_loops_on_keyword_tables():
+    rng = random.Random(7)
+    tables = [
+        (CompanyScraper.EXCLUDE_DOMAINS, CompanyScraper.EXCLUDE_DOMAINS_MATCHER),
+        (sorted(CompanyScraper.NON_OFFICIAL_KEYWORDS), CompanyScraper.NON_OFFICIAL_MATCHER),
+        (CompanyScraper.NON_OFFICIAL_SNIPPET_KEYWORDS, CompanyScraper.NON_OFFICIAL_SNIPPET_MATCHER),
+        (CompanyScraper.EXEC_TITLE_KEYWORDS, CompanyScraper.EXEC_TITLE_MATCHER),
+    ]
+    for keywords, matcher in tables:
+        pieces = list(keywords) + ["株式会社", "example", ".co.jp", "/", " ", "長", "代", "re", "job"]
+        for _ in range(300):
+            text = "".join(rng.choice(pieces)[: rng.randint(1, 12)] for _ in range(rng.randint(0, 6)))
+            assert matcher.search(text) == any(kw in text for kw in keywords), text
+            assert set(matcher.hits(text)) == {kw for kw in keywords if kw in text}, text
+
+
+def test_directory_reasons_keep_table_order():
+    text = "法人番号から企業検索。掲載企業数 1200 社、絞り込み可能"
+    expected = [f"text:{kw}" for kw in CompanyScraper.DIRECTORY_TEXT_KEYWORDS_STRONG if kw.lower() in text.lower()]
+    result = CompanyScraper._detect_directory_like("https://example.com/", text=text, html="")
+    assert [r for r in result["directory_reasons"] if r.startswith("text:")] == expected
+
+
+def test_phone_context_tags_follow_rule_order():
+    tagger = CompanyScraper.PHONE_CONTEXT_TAGGER
+    assert tagger.tags("採用窓口 本社所在地 代表TEL 管理本部") == ["HQ", "REP", "ADMIN", "RECRUIT"]
+    assert tagger.tags("物流センター") == ["BRANCH"]
+    assert KeywordTagger((("A", ("x",)),)).tags("") == []
@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.page_disk_cache import PageDiskCache, SOURCE_HTTP, SOURCE_PAGE
+
+
+def test_page_disk_cache_roundtrip_and_source_priority(tmp_path):
+    cache = PageDiskCache(str(tmp_path / "pages.sqlite3"))
+    cache.put("https://example.co.jp/company", html="<p>browser</p>", text="browser", source=SOURCE_PAGE)
+    cache.put("https://example.co.jp/company", html="<p>http</p>", text="http", source=SOURCE_HTTP)
+
+    hit = cache.get("https://example.co.jp/company")
+    assert hit == {"text": "browser", "html": "<p>browser</p>", "source": SOURCE_PAGE}
+    assert cache.get("https://example.co.jp/other") is None
+
+
+def test_page_disk_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "pages.sqlite3")
+    PageDiskCache(path).put("k", html="<p>a</p>", text="a", source=SOURCE_HTTP)
+    assert PageDiskCache(path).get("k", sources=(SOURCE_PAGE,)) is None
+    assert (PageDiskCache(path).get("k") or {}).get("text") == "a"
+
+
+def test_page_disk_cache_ttl_and_size_eviction(tmp_path):
+    cache = PageDiskCache(str(tmp_path / "pages.sqlite3"), ttl_sec=1, max_bytes=0)
+    cache.put("old", html="<p>old</p>", text="old")
+    time.sleep(1.1)
+    assert cache.get("old") is None
+    assert cache.evict() == 1
+
+    cache = PageDiskCache(str(tmp_path / "sized.sqlite3"), ttl_sec=0, max_bytes=3000)
+    for i in range(20):
+        body = "".join(chr(0x4E00 + ((i * 131 + j) % 2000)) for j in range(400))
+        cache.put(f"k{i}", html=f"<p>{body}</p>", text=body)
+    cache.evict()
+    assert cache.get("k19") is not None
+    assert cache.get("k0") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_reads_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("PAGE_DISK_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PAGE_DISK_CACHE_PATH", str(tmp_path / "pages.sqlite3"))
+    url = "https://example.co.jp/company/?utm_source=x"
+    PageDiskCache(str(tmp_path / "pages.sqlite3")).put(
+        CompanyScraper._cache_key_url(url), html="<p>cached</p>", text="cached", source=SOURCE_HTTP
+    )
+    scraper = CompanyScraper(headless=True)
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("network should not be used on disk cache hit")
+
+    monkeypatch.setattr(scraper, "_session_get", _unexpected)
+    info = await scraper._fetch_http_info(url, timeout_ms=4000)
+    assert info == {"url": url, "text": "cached", "html": "<p>cached</p>"}
+    # 更新チェックなどではキャッシュを読まない
+    refreshed = await scraper._fetch_http_info(url, timeout_ms=4000, use_disk_cache=False)
+    assert refreshed["html"] == ""
+
+
+@pytest.mark.asyncio
+async def test_fetch_http_info_skips_slow_host_before_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("PAGE_DISK_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PAGE_DISK_CACHE_PATH", str(tmp_path / "pages.sqlite3"))
+    url = "https://slow.example.co.jp/company/"
+    PageDiskCache(str(tmp_path / "pages.sqlite3")).put(
+        CompanyScraper._cache_key_url(url), html="<p>cached</p>", text="cached", source=SOURCE_HTTP
+    )
+    scraper = CompanyScraper(headless=True)
+    scraper.skip_slow_hosts = True
+    monkeypatch.setattr(scraper, "_is_slow_host", lambda host: host == "slow.example.co.jp")
+
+    async def _unexpected(*_args, **_kwargs):
+        raise AssertionError("disk cache should not be read for a skipped slow host")
+
+    monkeypatch.setattr(scraper, "_disk_cache_get", _unexpected)
+    info = await scraper._fetch_http_info(url, timeout_ms=4000)
+    assert info == {"url": url, "text": "", "html": ""}
+
+
+@pytest.mark.asyncio
+async def test_get_page_info_does_not_disk_cache_truncated_http_body(monkeypatch, tmp_path):
+    monkeypatch.setenv("PAGE_DISK_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PAGE_DISK_CACHE_PATH", str(tmp_path / "pages.sqlite3"))
+    scraper = CompanyScraper(headless=True)
+    url = "https://example.co.jp/company/"
+    text = "会社概要 所在地 東京都千代田区 " * 30
+
+    async def _fake_http(target, **_kwargs):
+        return {"url": target, "text": text, "html": f"<p>{text}</p>", "body_truncated": True}
+
+    monkeypatch.setattr(scraper, "_fetch_http_info", _fake_http)
+    info = await scraper.get_page_info(url)
+    assert info["text"] == text
+    assert scraper.page_disk_cache.get(scraper._cache_key_url(url)) is None
@@ -0,0 +1,48 @@
+from src.company_scraper import CompanyScraper
+from src.page_memory_cache import PageMemoryCache
+
+
+def _page(url: str, size: int) -> dict:
+    return {"url": url, "text": "t" * size, "html": "h" * size, "screenshot": b""}
+
+
+def test_page_memory_cache_evicts_least_recently_used():
+    cache = PageMemoryCache(max_bytes=10_000, max_screenshot_bytes=0)
+    cache["a"] = _page("a", 2000)
+    cache["b"] = _page("b", 2000)
+    assert cache.get("a")["url"] == "a"  # a を最近使用にする
+    cache["c"] = _page("c", 2000)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 1
+    assert cache.get("missing") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_page_memory_cache_keeps_screenshots_under_separate_budget():
+    cache = PageMemoryCache(max_bytes=0, max_screenshot_bytes=1500)
+    cache["a"] = {**_page("a", 10), "screenshot": b"x" * 1000}
+    cache["b"] = {**_page("b", 10), "screenshot": b"y" * 1000}
+
+    # 本文は残り、古いスクショだけが落ちる
+    assert cache["a"]["text"] == "t" * 10
+    assert cache["a"]["screenshot"] == b""
+    assert cache["b"]["screenshot"] == b"y" * 1000
+    assert cache.stats()["screenshot_evictions"] == 1
+
+    # スクショなしで上書きしても既存スクショは残す
+    cache["b"] = _page("b", 20)
+    assert cache["b"]["screenshot"] == b"y" * 1000
+    assert cache["b"]["text"] == "t" * 20
+
+
+def test_scraper_page_cache_budget_from_env(monkeypatch):
+    monkeypatch.setenv("PAGE_CACHE_MAX_MB", "1")
+    monkeypatch.setenv("PAGE_CACHE_SCREENSHOT_MAX_MB", "2")
+    scraper = CompanyScraper(headless=True)
+    assert scraper.page_cache.max_bytes == 1024 * 1024
+    assert scraper.page_cache.max_screenshot_bytes == 2 * 1024 * 1024
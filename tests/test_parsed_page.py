@@ -0,0 +1,44 @@
+import pytest
+
+import src.html_backend as html_backend
+from src.company_scraper import CompanyScraper
+from src.page_memory_cache import PageMemoryCache
+from tests.sample_docs import HTML, analyze
+
+
+@pytest.fixture
+def scrapers(monkeypatch):
+    shared = CompanyScraper(headless=True)
+    monkeypatch.setenv("PAGE_PARSED_CACHE_SIZE", "0")
+    unshared = CompanyScraper(headless=True)
+    return shared, unshared
+
+
+def test_analyzers_share_one_parse_and_match_unshared_results(scrapers, monkeypatch):
+    shared, unshared = scrapers
+    expected = analyze(unshared, HTML)
+
+    parses = []
+    original = html_backend.BeautifulSoup
+
+    def _counting(*args, **kwargs):
+        parses.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(html_backend, "BeautifulSoup", _counting)
+    assert analyze(shared, HTML) == expected
+    assert len(parses) == 1
+    assert shared.page_cache.stats()["parsed_misses"] == 1
+
+
+def test_parsed_page_is_dropped_with_its_cache_entry():
+    cache = PageMemoryCache(max_bytes=0, max_screenshot_bytes=0, max_parsed=4)
+    cache["a"] = {"url": "a", "text": "", "html": HTML}
+    page = cache.parsed(HTML)
+    assert cache.parsed(HTML) is page
+    assert page.title == "株式会社サンプル | 会社概要"
+    assert [a.href for a in page.anchors] == ["/company/", "/contact/"]
+
+    cache.pop("a")
+    assert cache.parsed(HTML) is not page
+    assert cache.stats()["parsed_hits"] == 1
@@ -0,0 +1,125 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+import src.pdf_extractor as pdf_extractor
+from src.pdf_extractor import PdfTextExtractor
+from tests.sample_docs import build_minimal_pdf
+
+
+@pytest.mark.asyncio
+async def test_extract_in_process_pool_and_cache_by_content():
+    extractor = PdfTextExtractor(max_workers=1, timeout_sec=60)
+    raw = build_minimal_pdf("COMPANY PROFILE CEO John Smith")
+    try:
+        first, second = await asyncio.gather(extractor.extract(raw), extractor.extract(raw))
+        third = await extractor.extract(bytes(raw))
+    finally:
+        extractor.close()
+
+    assert "John" in first
+    assert first == second == third
+    stats = extractor.stats()
+    assert stats["extracted"] == 1
+    assert stats["cache_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_skips_documents_over_byte_limit():
+    extractor = PdfTextExtractor(max_workers=0, max_bytes=100)
+    raw = build_minimal_pdf("COMPANY PROFILE")
+
+    assert await extractor.extract(raw) == ""
+    assert extractor.stats()["skipped_large"] == 1
+    assert extractor.stats()["extracted"] == 0
+
+
+@pytest.mark.asyncio
+async def test_extract_timeout_returns_empty_and_remembers(monkeypatch):
+    extractor = PdfTextExtractor(max_workers=0, timeout_sec=0.05)
+    calls = []
+
+    async def _slow(raw, executor):
+        calls.append(raw)
+        await asyncio.sleep(1)
+        return "never"
+
+    monkeypatch.setattr(extractor, "_run", _slow)
+    raw = build_minimal_pdf("COMPANY PROFILE")
+
+    assert await extractor.extract(raw) == ""
+    assert await extractor.extract(raw) == ""
+    assert len(calls) == 1
+    assert extractor.stats()["timeouts"] == 1
+
+
+class _FakePool:
+    def __init__(self):
+        self._processes = {}
+        self.shut_down = asyncio.Event()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down.set()
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_only_its_own_pool_and_bystanders_retry(monkeypatch):
+    pools = []
+    warmed = []
+
+    def _new_pool(max_workers):
+        pools.append(_FakePool())
+        return pools[-1]
+
+    async def _warm(executor, workers):
+        warmed.append(executor)
+        return workers
+
+    monkeypatch.setattr(pdf_extractor, "new_spawn_pool", _new_pool)
+    monkeypatch.setattr(pdf_extractor, "warm_pool", _warm)
+    extractor = PdfTextExtractor(max_workers=2, timeout_sec=0.1)
+    hung, bystander = b"%PDF hung", b"%PDF bystander"
+
+    async def _run(raw, executor):
+        if raw == hung:
+            await asyncio.sleep(5)
+        if executor is pools[0]:
+            # 他の文書のタイムアウトで止められたプールの巻き添え
+            await executor.shut_down.wait()
+            raise BrokenProcessPool("terminated")
+        return "ok"
+
+    monkeypatch.setattr(extractor, "_run", _run)
+    async def _later():
+        await asyncio.sleep(0.05)
+        return await extractor.extract(bystander)
+
+    results = await asyncio.gather(extractor.extract(hung), _later())
+
+    assert results == ["", "ok"]
+    assert len(pools) == 2
+    assert extractor._executor is pools[1] and not pools[1].shut_down.is_set()
+    assert warmed == [pools[0], pools[1]]
+    stats = extractor.stats()
+    assert (stats["timeouts"], stats["retries"], stats["failures"]) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_worker_startup_is_not_counted_in_timeout(monkeypatch):
+    async def _slow_warm(executor, workers):
+        await asyncio.sleep(0.3)
+        return workers
+
+    monkeypatch.setattr(pdf_extractor, "new_spawn_pool", lambda max_workers: _FakePool())
+    monkeypatch.setattr(pdf_extractor, "warm_pool", _slow_warm)
+    extractor = PdfTextExtractor(max_workers=1, timeout_sec=0.1)
+
+    async def _run(raw, executor):
+        return "text"
+
+    monkeypatch.setattr(extractor, "_run", _run)
+    assert await extractor.extract(b"%PDF doc") == "text"
+    assert extractor.stats()["timeouts"] == 0
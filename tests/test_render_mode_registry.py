@@ -0,0 +1,80 @@
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.render_mode_registry import MODE_BROWSER, MODE_HTTP, RenderModeRegistry
+
+
+def test_render_mode_needs_min_hits_and_persists(tmp_path):
+    path = tmp_path / "render_modes.txt"
+    reg = RenderModeRegistry(str(path), min_hits=2)
+    reg.record("spa.example.jp", MODE_BROWSER)
+    assert reg.mode("spa.example.jp") == ""
+    reg.record("spa.example.jp", MODE_BROWSER)
+    assert reg.mode("spa.example.jp") == MODE_BROWSER
+    assert path.exists()
+
+    reg.record("static.example.jp", MODE_HTTP)
+    reg.record("static.example.jp", MODE_HTTP)
+    reg.record("mixed.example.jp", MODE_HTTP)
+    reg.record("mixed.example.jp", MODE_HTTP)
+    reg.record("mixed.example.jp", MODE_BROWSER)
+    assert reg.mode("mixed.example.jp") == ""
+
+    reloaded = RenderModeRegistry(str(path), min_hits=2)
+    assert reloaded.mode("spa.example.jp") == MODE_BROWSER
+    assert reloaded.mode("static.example.jp") == MODE_HTTP
+
+
+def test_render_mode_flush_merges_other_writers(tmp_path):
+    path = tmp_path / "render_modes.txt"
+    a = RenderModeRegistry(str(path), min_hits=1)
+    b = RenderModeRegistry(str(path), min_hits=1)
+    a.record("a.example.jp", MODE_HTTP)
+    b.record("b.example.jp", MODE_BROWSER)
+
+    merged = RenderModeRegistry(str(path), min_hits=1)
+    assert merged.mode("a.example.jp") == MODE_HTTP
+    assert merged.mode("b.example.jp") == MODE_BROWSER
+
+
+def _scraper(monkeypatch, tmp_path) -> CompanyScraper:
+    monkeypatch.setenv("RENDER_MODES_PATH", str(tmp_path / "render_modes.txt"))
+    return CompanyScraper(headless=True)
+
+
+@pytest.mark.asyncio
+async def test_get_page_info_skips_browser_for_http_hosts(monkeypatch, tmp_path):
+    scraper = _scraper(monkeypatch, tmp_path)
+    scraper.render_modes.record("static.example.jp", MODE_HTTP)
+    scraper.render_modes.record("static.example.jp", MODE_HTTP)
+
+    async def fake_fetch(url, **kwargs):
+        return {"url": url, "text": "会社概要", "html": "<html><body>会社概要</body></html>"}
+
+    async def fail_start():
+        raise AssertionError("browser must not start")
+
+    monkeypatch.setattr(scraper, "_fetch_http_info", fake_fetch)
+    monkeypatch.setattr(scraper, "start", fail_start)
+    info = await scraper.get_page_info("https://static.example.jp/company")
+    assert info["text"] == "会社概要"
+
+
+@pytest.mark.asyncio
+async def test_get_page_info_goes_straight_to_browser_for_spa_hosts(monkeypatch, tmp_path):
+    scraper = _scraper(monkeypatch, tmp_path)
+    scraper.render_modes.record("spa.example.jp", MODE_BROWSER)
+    scraper.render_modes.record("spa.example.jp", MODE_BROWSER)
+    calls = []
+
+    async def fake_fetch(url, **kwargs):
+        calls.append(url)
+        return {"url": url, "text": "", "html": ""}
+
+    async def fail_start():
+        raise RuntimeError("no browser here")
+
+    monkeypatch.setattr(scraper, "_fetch_http_info", fake_fetch)
+    monkeypatch.setattr(scraper, "start", fail_start)
+    await scraper.get_page_info("https://spa.example.jp/company")
+    assert calls == []
@@ -0,0 +1,98 @@
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.screenshot_profile import ScreenshotProfile, image_mime_type, pillow_available
+
+
+class _Locator:
+    def __init__(self, count, data=b"\xff\xd8\xffcrop"):
+        self._count = count
+        self._data = data
+        self.calls = []
+
+    @property
+    def first(self):
+        return self
+
+    async def count(self):
+        return self._count
+
+    async def screenshot(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._data
+
+
+class _Page:
+    viewport_size = {"width": 1280, "height": 800}
+
+    def __init__(self, locators=None):
+        self.locators = locators or {}
+        self.calls = []
+
+    def locator(self, selector):
+        return self.locators.get(selector) or _Locator(0)
+
+    async def screenshot(self, **kwargs):
+        self.calls.append(kwargs)
+        return b"\xff\xd8\xffpage"
+
+
+def test_image_mime_type_sniffs_formats():
+    assert image_mime_type(b"\x89PNG\r\n\x1a\n....") == "image/png"
+    assert image_mime_type(b"\xff\xd8\xff\xe0rest") == "image/jpeg"
+    assert image_mime_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+    assert image_mime_type(b"") == "image/png"
+
+
+def test_profile_build_normalizes_values():
+    profile = ScreenshotProfile.build(image_format="JPG", quality=500, max_height=-1, crop_selectors="table.profile | footer")
+    assert profile.image_format == "jpeg"
+    assert profile.quality == 100
+    assert profile.max_height == 0
+    assert profile.crop_selectors == ("table.profile", "footer")
+    assert profile.capture_options() == {"type": "jpeg", "quality": 100}
+    if not pillow_available():
+        # Pillow が無ければ webp/縮小は jpeg・等倍に落とす
+        fallback = ScreenshotProfile.build(image_format="webp", scale=0.5)
+        assert fallback.image_format == "jpeg"
+        assert fallback.scale == 1.0
+        assert not fallback.needs_postprocess
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_clips_to_max_height(monkeypatch):
+    monkeypatch.setenv("SCREENSHOT_FORMAT", "jpeg")
+    monkeypatch.setenv("SCREENSHOT_QUALITY", "55")
+    monkeypatch.setenv("SCREENSHOT_MAX_HEIGHT", "3000")
+    scraper = CompanyScraper(headless=True)
+    page = _Page()
+
+    data = await scraper._capture_screenshot(page, 4000)
+
+    assert data.startswith(b"\xff\xd8\xff")
+    assert page.calls == [
+        {
+            "full_page": True,
+            "timeout": 4000,
+            "type": "jpeg",
+            "quality": 55,
+            "scale": "css",
+            "clip": {"x": 0, "y": 0, "width": 1280, "height": 3000},
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_prefers_crop_selector(monkeypatch):
+    monkeypatch.setenv("SCREENSHOT_FORMAT", "png")
+    monkeypatch.setenv("SCREENSHOT_CROP_SELECTORS", "table.company|footer")
+    scraper = CompanyScraper(headless=True)
+    footer = _Locator(1)
+    page = _Page({"footer": footer})
+
+    data = await scraper._capture_screenshot(page, 2000)
+
+    assert data == b"\xff\xd8\xffcrop"
+    assert footer.calls == [{"timeout": 2000, "type": "png", "scale": "css"}]
+    assert page.calls == []
+    assert scraper.screenshot_crops == 1
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.search_engine_health import (
+    OUTCOME_CHALLENGE,
+    OUTCOME_OK,
+    OUTCOME_RATE_LIMITED,
+    SearchEngineHealth,
+)
+
+
+def test_circuit_opens_after_consecutive_failures_and_half_open_probe(monkeypatch):
+    health = SearchEngineHealth(failure_threshold=3, open_sec=60)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    for _ in range(2):
+        health.record("startpage", OUTCOME_CHALLENGE)
+    assert not health.is_open("startpage")
+    health.record("startpage", OUTCOME_RATE_LIMITED)
+    assert health.is_open("startpage")
+
+    # 期限切れ後の最初の失敗で倍の期間開き直す
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert not health.is_open("startpage")
+    health.record("startpage", OUTCOME_CHALLENGE)
+    assert health.open_until("startpage") == pytest.approx(now + 61 + 120)
+
+    # 期限切れ後の成功で閉じる
+    monkeypatch.setattr(time, "time", lambda: now + 200)
+    health.record("startpage", OUTCOME_OK, 500)
+    assert not health.is_open("startpage")
+    assert health.open_until("startpage") == 0.0
+
+
+def test_order_prefers_healthy_fast_engines_and_keeps_ties():
+    health = SearchEngineHealth(min_samples=3, failure_threshold=10, failure_rate_open=2.0)
+    assert health.order(["startpage", "bing"]) == ["startpage", "bing"]
+    for _ in range(5):
+        health.record("startpage", OUTCOME_OK, 6000)
+        health.record("bing", OUTCOME_OK, 2000)
+    assert health.order(["startpage", "bing"]) == ["bing", "startpage"]
+    for _ in range(5):
+        health.record("bing", OUTCOME_CHALLENGE)
+    assert health.order(["startpage", "bing"])[0] == "startpage"
+
+
+@pytest.mark.asyncio
+async def test_state_is_shared_between_workers(tmp_path):
+    path = str(tmp_path / "engine_health.sqlite3")
+    w1 = SearchEngineHealth(path, worker_id="w1", failure_threshold=2, refresh_sec=0)
+    w2 = SearchEngineHealth(path, worker_id="w2", failure_threshold=2, refresh_sec=0)
+    w1.record("startpage", OUTCOME_CHALLENGE)
+    w1.record("startpage", OUTCOME_CHALLENGE)
+    # 開いたことは record() が予約した非同期 flush で書かれる
+    await w1._flush_task
+
+    assert not w2.is_open("startpage")
+    await w2.refresh_async()
+    assert w2.is_open("startpage")
+    assert w2.order(["startpage", "bing"]) == ["bing", "startpage"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_is_only_touched_off_the_event_loop(tmp_path, monkeypatch):
+    health = SearchEngineHealth(str(tmp_path / "engine_health.sqlite3"), failure_threshold=2, refresh_sec=0.01)
+    loop_thread = threading.get_ident()
+    threads = []
+    original_connect = health._connect
+
+    def _connect():
+        threads.append(threading.get_ident())
+        return original_connect()
+
+    monkeypatch.setattr(health, "_connect", _connect)
+    health.ensure_refresher()
+    for _ in range(2):
+        health.record("bing", OUTCOME_CHALLENGE)
+    assert health.is_open("bing")
+    assert health.order(["bing", "startpage"]) == ["startpage", "bing"]
+    await asyncio.sleep(0.05)
+    await health.aclose()
+    assert threads
+    assert loop_thread not in threads
+
+
+class _Resp:
+    def __init__(self, status, text=""):
+        self.status_code = status
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+@pytest.mark.asyncio
+async def test_startpage_skips_retry_ladder_once_circuit_opens(monkeypatch):
+    monkeypatch.setenv("SEARCH_CIRCUIT_FAILURES", "2")
+    monkeypatch.delenv("SEARCH_ENGINE_HEALTH_DB_PATH", raising=False)
+    scraper = CompanyScraper(headless=True)
+    calls = []
+
+    async def _get(url, **kwargs):
+        calls.append(url)
+        return _Resp(429)
+
+    async def _proxy(query):
+        return "proxy-result"
+
+    monkeypatch.setattr(scraper, "_session_get_async", _get)
+    monkeypatch.setattr(scraper, "_fetch_startpage_via_proxy", _proxy)
+
+    assert await scraper._fetch_startpage("株式会社サンプル") == "proxy-result"
+    assert len(calls) == 2
+    assert scraper.search_engine_health.is_open("startpage")
+
+    calls.clear()
+    assert await scraper._fetch_startpage("株式会社サンプル2") == "proxy-result"
+    assert calls == []
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+
+
+def _make_scraper(monkeypatch, fanout: bool, per_engine: int = 2):
+    monkeypatch.setenv("SEARCH_ENGINES", "startpage,bing")
+    monkeypatch.setenv("SEARCH_FANOUT_ENABLED", "true" if fanout else "false")
+    monkeypatch.setenv("SEARCH_FANOUT_PER_ENGINE", str(per_engine))
+    scraper = CompanyScraper(headless=True)
+    scraper._build_company_queries = lambda name, addr: ["q0", "q1", "q2"]  # type: ignore[method-assign]
+    return scraper
+
+
+def _install_fake_engines(scraper, delays, results, stats):
+    async def _fetch(engine, query):
+        stats["calls"].append((engine, query))
+        stats["active"][engine] = stats["active"].get(engine, 0) + 1
+        stats["peak"][engine] = max(stats["peak"].get(engine, 0), stats["active"][engine])
+        try:
+            await asyncio.sleep(delays.get((engine, query), 0.01))
+        except asyncio.CancelledError:
+            stats["cancelled"].append((engine, query))
+            raise
+        finally:
+            stats["active"][engine] -= 1
+        return results.get((engine, query), "")
+
+    async def _startpage(query):
+        return await _fetch("startpage", query)
+
+    async def _bing(query):
+        return await _fetch("bing", query)
+
+    scraper._fetch_startpage = _startpage
+    scraper._fetch_bing = _bing
+    scraper._extract_startpage_urls = lambda html: html.split()
+    scraper._extract_bing_urls = lambda html: html.split()
+
+
+RESULTS = {
+    ("startpage", "q0"): "https://a.example.co.jp/ https://b.example.co.jp/",
+    ("bing", "q0"): "https://b.example.co.jp/ https://c.example.co.jp/company/",
+    ("startpage", "q1"): "https://d.example.co.jp/",
+    ("bing", "q1"): "https://e.example.co.jp/",
+    ("startpage", "q2"): "https://f.example.co.jp/",
+    ("bing", "q2"): "https://g.example.co.jp/",
+}
+# 後ろのスロットほど速く返す（完了順がスロット順と逆になる）
+DELAYS = {
+    ("startpage", "q0"): 0.08,
+    ("bing", "q0"): 0.06,
+    ("startpage", "q1"): 0.04,
+    ("bing", "q1"): 0.03,
+    ("startpage", "q2"): 0.02,
+    ("bing", "q2"): 0.01,
+}
+
+
+def _new_stats():
+    return {"calls": [], "active": {}, "peak": {}, "cancelled": []}
+
+
+@pytest.mark.asyncio
+async def test_fanout_result_matches_sequential_order(monkeypatch):
+    sequential = _make_scraper(monkeypatch, fanout=False)
+    _install_fake_engines(sequential, DELAYS, RESULTS, _new_stats())
+    expected = await sequential.search_company("株式会社サンプル", "東京都", num_results=5)
+
+    fanout = _make_scraper(monkeypatch, fanout=True)
+    stats = _new_stats()
+    _install_fake_engines(fanout, DELAYS, RESULTS, stats)
+    got = await fanout.search_company("株式会社サンプル", "東京都", num_results=5)
+
+    assert got == expected
+    assert len(got) == 5
+    assert all(peak <= 2 for peak in stats["peak"].values())
+
+
+@pytest.mark.asyncio
+async def test_fanout_stops_early_and_cancels_rest(monkeypatch):
+    scraper = _make_scraper(monkeypatch, fanout=True, per_engine=3)
+    stats = _new_stats()
+    delays = dict(DELAYS)
+    delays[("startpage", "q0")] = 0.01
+    delays[("bing", "q0")] = 0.01
+    delays[("startpage", "q2")] = 5.0
+    delays[("bing", "q2")] = 5.0
+    _install_fake_engines(scraper, delays, RESULTS, stats)
+
+    urls = await asyncio.wait_for(scraper.search_company("株式会社サンプル", "東京都", num_results=3), timeout=2.0)
+
+    assert sorted(urls) == sorted(["https://a.example.co.jp/", "https://b.example.co.jp/", "https://c.example.co.jp/company/"])
+    assert ("startpage", "q2") in stats["cancelled"]
+    assert ("bing", "q2") in stats["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_fanout_respects_per_engine_limit(monkeypatch):
+    scraper = _make_scraper(monkeypatch, fanout=True, per_engine=1)
+    stats = _new_stats()
+    _install_fake_engines(scraper, DELAYS, RESULTS, stats)
+
+    await scraper.search_company("株式会社サンプル", "東京都", num_results=50)
+
+    assert stats["peak"] == {"startpage": 1, "bing": 1}
+    assert len(stats["calls"]) == 6
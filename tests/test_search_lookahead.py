@@ -0,0 +1,111 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.database_manager import DatabaseManager
+from src.search_lookahead import SearchLookahead
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path):
+    dbm = DatabaseManager(db_path=str(tmp_path / "test.db"), claim_order="id_asc", worker_id="w1")
+    dbm.cur.executemany(
+        "INSERT INTO companies (id, company_name, address, status) VALUES (?, ?, ?, 'pending')",
+        [(1, "株式会社A", "東京都"), (2, "株式会社B", "大阪府"), (3, "株式会社C", "愛知県"), (4, "株式会社D", "福岡県")],
+    )
+    dbm.conn.commit()
+    yield dbm
+    dbm.close()
+
+
+def _status(dbm, cid):
+    return dbm.cur.execute("SELECT status, locked_by FROM companies WHERE id=?", (cid,)).fetchone()
+
+
+@pytest.mark.asyncio
+async def test_lookahead_prefetches_next_companies_and_releases_on_close(db_manager):
+    searched = []
+
+    async def _search(company):
+        searched.append(company["id"])
+        return []
+
+    lookahead = SearchLookahead(
+        depth=2,
+        claim=lambda: db_manager.claim_next_company("w1"),
+        search=_search,
+        refresh=lambda cs: db_manager.refresh_claims([c["id"] for c in cs], "w1"),
+        release=lambda c: db_manager.release_claim(c["id"], "w1"),
+    )
+
+    first = await lookahead.next_company()
+    await asyncio.sleep(0)
+    assert first["id"] == 1
+    assert sorted(searched) == [1, 2, 3]
+    assert tuple(_status(db_manager, 3)) == ("running", "w1")
+    assert tuple(_status(db_manager, 4)) == ("pending", None)
+
+    # 取り出しのたびに先行確保中の全件のリースが延びる
+    db_manager.cur.execute("UPDATE companies SET locked_at=datetime('now', '-1 hour') WHERE id IN (2, 3)")
+    db_manager.conn.commit()
+    second = await lookahead.next_company()
+    assert second["id"] == 2
+    stale = db_manager.cur.execute(
+        "SELECT COUNT(*) FROM companies WHERE id IN (2, 3) AND locked_at < datetime('now', '-30 minutes')"
+    ).fetchone()[0]
+    assert stale == 0
+    await lookahead.close()
+
+    # 返した会社は running のまま、先行確保だけした会社は pending に戻る
+    assert tuple(_status(db_manager, 2)) == ("running", "w1")
+    assert tuple(_status(db_manager, 3)) == ("pending", None)
+    assert tuple(_status(db_manager, 4)) == ("pending", None)
+
+
+@pytest.mark.asyncio
+async def test_lookahead_skips_company_whose_lease_was_lost(db_manager):
+    async def _search(company):
+        await asyncio.sleep(10)
+
+    lookahead = SearchLookahead(
+        depth=1,
+        claim=lambda: db_manager.claim_next_company("w1"),
+        search=_search,
+        refresh=lambda cs: db_manager.refresh_claims([c["id"] for c in cs], "w1"),
+        release=lambda c: db_manager.release_claim(c["id"], "w1"),
+        should_prefetch=lambda c: c["id"] != 1,
+    )
+    assert (await lookahead.next_company())["id"] == 1
+    # TTL 回収で他 worker が取った想定
+    db_manager.cur.execute("UPDATE companies SET locked_by='w2' WHERE id=2")
+    db_manager.conn.commit()
+
+    assert (await lookahead.next_company())["id"] == 3
+    assert lookahead.lost_leases == 1
+    await lookahead.close()
+    assert tuple(_status(db_manager, 2)) == ("running", "w2")
+
+
+@pytest.mark.asyncio
+async def test_search_company_joins_inflight_prefetch(monkeypatch):
+    monkeypatch.setenv("SEARCH_ENGINES", "startpage")
+    scraper = CompanyScraper(headless=True)
+    scraper._build_company_queries = lambda name, addr: ["q0"]  # type: ignore[method-assign]
+    calls = []
+
+    async def _fetch(query):
+        calls.append(query)
+        await asyncio.sleep(0.05)
+        return "https://www.sample.co.jp/"
+
+    scraper._fetch_startpage = _fetch
+    scraper._extract_startpage_urls = lambda html: html.split()
+
+    prefetch = asyncio.create_task(scraper.search_company("株式会社サンプル", "東京都", num_results=3))
+    await asyncio.sleep(0.01)
+    joined = await scraper.search_company("株式会社サンプル", "東京都", num_results=3)
+
+    assert joined == await prefetch == ["https://www.sample.co.jp/"]
+    assert calls == ["q0"]
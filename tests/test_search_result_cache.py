@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from src.company_scraper import CompanyScraper
+from src.search_result_cache import SearchResultCache
+
+
+def test_cache_roundtrip_normalizes_query_and_skips_empty(tmp_path):
+    cache = SearchResultCache(str(tmp_path / "search_cache.sqlite3"))
+    cache.put("startpage", "株式会社サンプル　会社概要", ["https://a.example.co.jp/", "https://b.example.co.jp/"])
+    cache.put("startpage", "空の結果", [])
+
+    assert cache.get("startpage", "株式会社サンプル 会社概要 ") == ["https://a.example.co.jp/", "https://b.example.co.jp/"]
+    assert cache.get("bing", "株式会社サンプル 会社概要") is None
+    assert cache.get("startpage", "空の結果") is None
+
+
+def test_cache_ttl_expires_and_evicts(tmp_path, monkeypatch):
+    cache = SearchResultCache(str(tmp_path / "search_cache.sqlite3"), ttl_sec=60)
+    cache.put("bing", "q", ["https://a.example.co.jp/"])
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+
+    assert cache.get("bing", "q") is None
+    assert cache.evict() == 1
+
+
+@pytest.mark.asyncio
+async def test_search_company_reuses_disk_cache_across_instances(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEARCH_ENGINES", "startpage")
+    monkeypatch.setenv("SEARCH_DISK_CACHE_ENABLED", "true")
+    monkeypatch.setenv("COMPANIES_DB_PATH", str(tmp_path / "companies.db"))
+    calls = []
+
+    def _make():
+        scraper = CompanyScraper(headless=True)
+        scraper._build_company_queries = lambda name, addr: ["q0", "q1"]  # type: ignore[method-assign]
+
+        async def _fetch(query):
+            calls.append(query)
+            return "https://www.sample.co.jp/ https://www.sample.co.jp/company/"
+
+        scraper._fetch_startpage = _fetch
+        scraper._extract_startpage_urls = lambda html: html.split()
+        return scraper
+
+    first = await _make().search_company("株式会社サンプル", "東京都", num_results=2)
+    assert calls == ["q0"]
+    assert (tmp_path / "search_cache.sqlite3").exists()
+
+    second = await _make().search_company("株式会社サンプル", "東京都", num_results=2)
+    assert second == first
+    assert calls == ["q0"]
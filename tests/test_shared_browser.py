@@ -0,0 +1,105 @@
+import pytest
+
+import src.company_scraper as company_scraper_module
+from src.company_scraper import CompanyScraper
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        return None
+
+    async def new_page(self):
+        raise AssertionError("not used")
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.closed = False
+        self.contexts = []
+
+    async def new_context(self, **kwargs):
+        ctx = _FakeContext()
+        self.contexts.append(ctx)
+        return ctx
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeChromium:
+    def __init__(self, connect_ok: bool):
+        self.connect_ok = connect_ok
+        self.connected = []
+        self.launched = []
+
+    async def connect_over_cdp(self, url, timeout=None):
+        if not self.connect_ok:
+            raise RuntimeError("connect refused")
+        browser = _FakeBrowser()
+        self.connected.append((url, browser))
+        return browser
+
+    async def launch(self, **kwargs):
+        browser = _FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class _FakePlaywright:
+    def __init__(self, chromium):
+        self.chromium = chromium
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def _patch_playwright(monkeypatch, chromium):
+    pw = _FakePlaywright(chromium)
+
+    class _Starter:
+        async def start(self):
+            return pw
+
+    monkeypatch.setattr(company_scraper_module, "async_playwright", lambda: _Starter())
+    return pw
+
+
+@pytest.mark.asyncio
+async def test_start_connects_to_shared_browser_and_keeps_it_open(monkeypatch):
+    monkeypatch.setenv("BROWSER_CDP_URL", "http://127.0.0.1:9222")
+    chromium = _FakeChromium(connect_ok=True)
+    pw = _patch_playwright(monkeypatch, chromium)
+    scraper = CompanyScraper(headless=True)
+
+    await scraper.start()
+    url, browser = chromium.connected[0]
+    assert url == "http://127.0.0.1:9222"
+    assert chromium.launched == []
+    assert scraper._browser_shared is True
+
+    await scraper.close()
+    assert browser.contexts[0].closed is True
+    assert browser.closed is False
+    assert pw.stopped is True
+
+
+@pytest.mark.asyncio
+async def test_start_falls_back_to_local_launch_when_shared_browser_unreachable(monkeypatch):
+    monkeypatch.setenv("BROWSER_CDP_URL", "http://127.0.0.1:9")
+    chromium = _FakeChromium(connect_ok=False)
+    _patch_playwright(monkeypatch, chromium)
+    scraper = CompanyScraper(headless=True)
+
+    await scraper.start()
+    assert len(chromium.launched) == 1
+    assert scraper._browser_shared is False
+
+    await scraper.close()
+    assert chromium.launched[0].closed is True
@@ -4,8 +4,15 @@ import main
 
 
 class _DummyScraper:
-    async def _fetch_http_info(self, url: str, timeout_ms: int = 0, allow_slow: bool = False):
-        return {"url": url, "html": "<html><body>same</body></html>", "text": "same"}
+    def __init__(self, not_modified: bool = False):
+        self.not_modified = not_modified
+        self.calls = []
+
+    async def _fetch_http_info(self, url: str, timeout_ms: int = 0, allow_slow: bool = False, **kwargs):
+        self.calls.append(kwargs)
+        if self.not_modified and kwargs.get("validators"):
+            return {"url": url, "html": "", "text": "", "not_modified": True, "etag": '"v1"'}
+        return {"url": url, "html": "<html><body>same</body></html>", "text": "same", "etag": '"v1"'}
 
     def compute_homepage_fingerprint(self, html: str, text: str) -> str:
         return "fp_same"
@@ -72,3 +79,52 @@ async def test_maybe_skip_if_unchanged_skips_when_logic_hash_is_same(monkeypatch
     assert manager.saved[0]["homepage_check_logic_hash"] == "auto:same"
     assert manager.saved[0]["status"] == "done"
 
+
+
+@pytest.mark.asyncio
+async def test_maybe_skip_if_unchanged_skips_on_validator_match(monkeypatch):
+    monkeypatch.setattr(main, "UPDATE_CHECK_ENABLED", True)
+    monkeypatch.setattr(main, "CURRENT_UPDATE_CHECK_LOGIC_HASH", "auto:same")
+
+    company = {
+        "id": 3,
+        "final_homepage": "https://example.com",
+        "homepage_check_url": "https://example.com",
+        "homepage_fingerprint": "fp_prev",
+        "homepage_content_length": 123,
+        "homepage_check_logic_hash": "auto:same",
+        "homepage_etag": '"v1"',
+    }
+    scraper = _DummyScraper(not_modified=True)
+    manager = _DummyManager()
+
+    skipped = await main.maybe_skip_if_unchanged(company, scraper, manager)
+
+    assert skipped is True
+    assert scraper.calls[0]["validators"]["etag"] == '"v1"'
+    assert manager.saved[0]["homepage_fingerprint"] == "fp_prev"
+    assert manager.saved[0]["homepage_content_length"] == 123
+    assert manager.saved[0]["homepage_etag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_maybe_skip_if_unchanged_no_validators_when_logic_hash_changed(monkeypatch):
+    monkeypatch.setattr(main, "UPDATE_CHECK_ENABLED", True)
+    monkeypatch.setattr(main, "CURRENT_UPDATE_CHECK_LOGIC_HASH", "auto:new")
+
+    company = {
+        "id": 4,
+        "final_homepage": "https://example.com",
+        "homepage_check_url": "https://example.com",
+        "homepage_fingerprint": "fp_same",
+        "homepage_check_logic_hash": "auto:old",
+        "homepage_etag": '"v1"',
+    }
+    scraper = _DummyScraper(not_modified=True)
+    manager = _DummyManager()
+
+    skipped = await main.maybe_skip_if_unchanged(company, scraper, manager)
+
+    assert skipped is False
+    assert scraper.calls[0]["validators"] is None
+    assert company["homepage_etag"] == '"v1"'